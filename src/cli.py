@@ -1,15 +1,61 @@
 """CLI for MiniCon."""
 
 import os
-from typing import List, Optional
+from contextlib import AbstractContextManager, nullcontext
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import typer
 from rich.console import Console
+from rich.style import Style
 from rich.table import Table
+from rich.text import Text
 
-from src.container.manager import ContainerManager
 from src.container.model import State
 
+if TYPE_CHECKING:
+    from src.container.manager import ContainerManager
+
+# Rich style applied to each container state in the `list` output
+_STATE_STYLES = {
+    State.CREATED: "blue",
+    State.RUNNING: "green",
+    State.EXITED: "red",
+}
+
+# Lookup of valid `--state` values to their State member
+_VALID_STATES = {state.value: state for state in State}
+
+# Above this many rows the table is drawn without outer edges or padding
+_COMPACT_TABLE_ROWS = 100
+
+
+@lru_cache(maxsize=None)
+def _style(definition: str) -> Style:
+    """Get a parsed Rich style, building it once per definition.
+
+    Args:
+        definition: Rich style definition, such as "green" or "bold red".
+
+    Returns:
+        The parsed style object.
+    """
+    return Style.parse(definition)
+
+
+@lru_cache(maxsize=None)
+def _state_cell(state: State) -> tuple[str, Style]:
+    """Get the display text and style for a container state.
+
+    Args:
+        state: The container state to display.
+
+    Returns:
+        A tuple of the state's string value and its parsed style.
+    """
+    return state.value, _style(_STATE_STYLES.get(state, ""))
+
 
 class MiniConCLI:
     """MiniCon CLI for container management.
@@ -21,13 +67,18 @@ class MiniConCLI:
     Attributes:
         app (typer.Typer): The Typer application instance for command registration.
         console (Console): Rich console for formatted output.
+        manager (ContainerManager): Container manager shared by all commands,
+            created lazily on first use.
     """
 
     def __init__(self) -> None:
         """Initialize the CLI with common resources."""
         self.app = typer.Typer(help="MiniCon: A lightweight container implementation")
         self.console = Console()
+        self._manager: Optional["ContainerManager"] = None
+        self._is_root: Optional[bool] = None
 
+        # Typer only records these; signatures are inspected once, when app() runs
         self.app.command("create")(self.create)
         self.app.command("list")(self.list)
         self.app.command("start")(self.start)
@@ -35,8 +86,33 @@ class MiniConCLI:
         self.app.command("rm")(self.remove)
         self.app.command("run")(self.run)
 
+    @property
+    def manager(self) -> "ContainerManager":
+        """Get the container manager, creating it on first access.
+
+        The manager is shared by every command run through this CLI instance,
+        so the registry is only loaded from disk once per invocation.
+
+        Returns:
+            The container manager for this CLI instance.
+        """
+        if self._manager is None:
+            from src.container.manager import ContainerManager
+
+            self._manager = ContainerManager()
+        return self._manager
+
+    def _status(self, message: str) -> AbstractContextManager[Any]:
+        # The spinner runs a refresh thread, which is wasted when nobody sees it
+        if self.console.is_terminal:
+            return self.console.status(message)
+        return nullcontext()
+
     def _check_root(self) -> None:
-        if os.geteuid() != 0:
+        # Privileges cannot change during an invocation, so check them once
+        if self._is_root is None:
+            self._is_root = os.geteuid() == 0
+        if not self._is_root:
             message = "[bold red]Error:[/] This command requires root privileges"
             self.console.print(message)
             raise typer.Exit(1)
@@ -61,7 +137,7 @@ class MiniConCLI:
         """
         self._check_root()
 
-        manager = ContainerManager()
+        manager = self.manager
         container_id = manager.create(name, command)
         self.console.print(f"Container created with ID: [bold green]{container_id}[/]")
 
@@ -73,58 +149,74 @@ class MiniConCLI:
             "-s",
             help="Filter by container state (created, running, exited)",
         ),
+        limit: Optional[int] = typer.Option(
+            None,
+            "--limit",
+            "-l",
+            min=1,
+            help="Maximum number of containers to show",
+        ),
+        offset: int = typer.Option(
+            0,
+            "--offset",
+            min=0,
+            help="Number of containers to skip before listing",
+        ),
     ) -> None:
         """List all containers, optionally filtered by state.
 
         This command displays a table of containers with their ID, name, state,
         process ID (if running), and command. The output can be filtered to show
-        only containers in a specific state (created, running, or exited).
+        only containers in a specific state (created, running, or exited), and
+        paginated with a limit and offset so only the visible rows are rendered.
 
         Args:
             state: Optional state filter to show only containers in the specified state.
                   Valid values are "created", "running", or "exited".
+            limit: Optional maximum number of containers to display.
+            offset: Number of matching containers to skip before displaying.
         """
-        manager = ContainerManager()
+        manager = self.manager
 
         filter_state = None
         if state:
-            try:
-                filter_state = State(state)
-            except ValueError:
+            filter_state = _VALID_STATES.get(state)
+            if filter_state is None:
                 self.console.print(f"[bold red]Error:[/] Invalid state: {state}")
                 raise typer.Exit(1)
 
-        containers = manager.list(filter_state)
+        if not manager.has_any(filter_state):
+            self.console.print("No containers found")
+            return
+
+        end = offset + limit if limit is not None else None
+        containers = list(islice(manager.list(filter_state), offset, end))
 
         if not containers:
             self.console.print("No containers found")
             return
 
-        table = Table(show_header=True)
-        table.add_column("ID", style="cyan")
+        compact = len(containers) > _COMPACT_TABLE_ROWS
+        table = Table(show_header=True, show_edge=not compact, pad_edge=not compact)
+        table.add_column("ID", style=_style("cyan"))
         table.add_column("NAME")
-        table.add_column("STATE", style="green")
+        table.add_column("STATE", style=_style("green"))
         table.add_column("PID")
         table.add_column("COMMAND")
 
-        for container in containers:
-            pid = str(container.process_id) if container.process_id else "-"
-            cmd = " ".join(container.command[:3]) + (
-                "..." if len(container.command) > 3 else ""
-            )
-            state_style = {
-                "created": "blue",
-                "running": "green",
-                "exited": "red",
-            }.get(container.state.value, "")
-
-            table.add_row(
-                container.id,
-                container.name,
-                f"[{state_style}]{container.state.value}[/{state_style}]",
-                pid,
-                cmd,
+        # Text cells bypass Rich's markup parser for every row
+        rows = [
+            (
+                Text(container.id),
+                Text(container.name),
+                Text(*_state_cell(container.state)),
+                Text(str(container.process_id) if container.process_id else "-"),
+                Text(container.display_command),
             )
+            for container in containers
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         self.console.print(table)
 
@@ -146,8 +238,8 @@ class MiniConCLI:
         """
         self._check_root()
 
-        with self.console.status(f"Starting container {container_id}..."):
-            manager = ContainerManager()
+        with self._status(f"Starting container {container_id}..."):
+            manager = self.manager
             try:
                 manager.start(container_id)
                 self.console.print(
@@ -181,8 +273,8 @@ class MiniConCLI:
         """
         self._check_root()
 
-        with self.console.status(f"Stopping container {container_id}..."):
-            manager = ContainerManager()
+        with self._status(f"Stopping container {container_id}..."):
+            manager = self.manager
             try:
                 manager.stop(container_id)
                 self.console.print(
@@ -218,7 +310,7 @@ class MiniConCLI:
         """
         self._check_root()
 
-        manager = ContainerManager()
+        manager = self.manager
         try:
             manager.remove(container_id)
             self.console.print(
@@ -252,12 +344,12 @@ class MiniConCLI:
         """
         self._check_root()
 
-        manager = ContainerManager()
+        manager = self.manager
 
-        with self.console.status(f"Creating container {name}..."):
+        with self._status(f"Creating container {name}..."):
             container_id = manager.create(name, command)
 
-        with self.console.status(f"Starting container {container_id}..."):
+        with self._status(f"Starting container {container_id}..."):
             try:
                 manager.start(container_id)
                 self.console.print(
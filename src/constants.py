@@ -1,6 +1,9 @@
 """Constants for MiniCon application."""
 
 import os
+import re
+from functools import lru_cache
+from typing import Optional
 
 # Default configuration values
 DEFAULT_MEMORY_LIMIT = 250 * 1024 * 1024  # 250MB in bytes
@@ -18,8 +21,49 @@ MINICON_BASE_IMAGE = os.getenv("MINICON_BASE_IMAGE", DEFAULT_BASE_IMAGE_PATH)
 MINICON_ROOTFS_DIR = os.getenv("MINICON_ROOTFS_DIR", DEFAULT_ROOTFS_DIR)
 MINICON_REGISTRY_FILE = os.getenv("MINICON_REGISTRY_FILE", DEFAULT_REGISTRY_FILE)
 
+# Root filesystem driver: "copy" copies the base image into every container,
+# "overlay" mounts it read-only beneath a per-container overlayfs
+MINICON_ROOTFS_DRIVER = os.getenv("MINICON_ROOTFS_DRIVER", "copy")
+
+
+def _parse_pid(name: str) -> Optional[int]:
+    """Read a process ID from an environment variable.
+
+    Args:
+        name: Name of the environment variable.
+
+    Returns:
+        The process ID, or None when the variable is unset or empty.
+
+    Raises:
+        ValueError: If the variable is not a positive integer.
+    """
+    value = os.getenv(name)
+    if not value:
+        return None
+    if not value.isdigit() or int(value) == 0:
+        raise ValueError(f"{name} must be a process ID, got {value!r}")
+    return int(value)
+
+
+# PID of a process whose user namespace new containers join instead of creating
+# their own, so sibling containers can share memory across it
+MINICON_JOIN_USERNS = _parse_pid("MINICON_JOIN_USERNS")
+
+
 # Memory and resource limits
-MINICON_MEMORY_LIMIT = int(os.getenv("MINICON_MEMORY_LIMIT", str(DEFAULT_MEMORY_LIMIT)))
+@lru_cache(maxsize=1)
+def get_memory_limit() -> int:
+    """Get the default container memory limit.
+
+    Read from MINICON_MEMORY_LIMIT on first use rather than at import, so
+    commands that never create a container skip the lookup.
+
+    Returns:
+        The memory limit in bytes.
+    """
+    return int(os.getenv("MINICON_MEMORY_LIMIT", DEFAULT_MEMORY_LIMIT))
+
 
 # Linux namespace flags (defined as constants for clarity)
 CLONE_NEWNS = 0x00020000  # Mount namespace
@@ -27,36 +71,43 @@ CLONE_NEWUTS = 0x04000000  # UTS namespace
 CLONE_NEWPID = 0x20000000  # PID namespace
 CLONE_NEWUSER = 0x10000000  # User namespace
 
+# mount(2) flags
+MS_REC = 0x4000  # Apply recursively to every mount in the subtree
+MS_PRIVATE = 0x40000  # Do not propagate mount events to or from peers
+
+# close_range(2) flag: mark the descriptors close-on-exec instead of closing them
+CLOSE_RANGE_CLOEXEC = 0x4
+
 # Essential directories created in container rootfs
-ESSENTIAL_DIRECTORIES = ["proc", "sys", "dev", "tmp", "etc", "bin", "lib", "home"]
+ESSENTIAL_DIRECTORIES = ("proc", "sys", "dev", "tmp", "etc", "bin", "lib", "home")
 
 # Dangerous commands blocked by security validation
-DANGEROUS_COMMANDS = {
-    "rm",
-    "rmdir",
-    "dd",
-    "mkfs",
-    "fdisk",
-    "parted",
-    "mount",
-    "umount",
-    "sudo",
-    "su",
-    "chmod",
-    "chown",
-}
+DANGEROUS_COMMANDS = frozenset(
+    {
+        "rm",
+        "rmdir",
+        "dd",
+        "mkfs",
+        "fdisk",
+        "parted",
+        "mount",
+        "umount",
+        "sudo",
+        "su",
+        "chmod",
+        "chown",
+    }
+)
 
 # Container name validation
 MAX_CONTAINER_NAME_LENGTH = 64
-ALLOWED_CONTAINER_NAME_CHARS = set(
-    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_"
+ALLOWED_CONTAINER_NAME_PATTERN = re.compile(
+    rf"[A-Za-z0-9_-]{{1,{MAX_CONTAINER_NAME_LENGTH}}}"
 )
 
 # Hostname validation
 MAX_HOSTNAME_LENGTH = 253
-ALLOWED_HOSTNAME_CHARS = set(
-    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-."
-)
+ALLOWED_HOSTNAME_PATTERN = re.compile(r"[A-Za-z0-9.-]+")
 
 # Default safe path base for validation
 DEFAULT_SAFE_PATH_BASE = MINICON_BASE_DIR
@@ -79,6 +130,9 @@ ESSENTIAL_BINARY_PATHS = [
     ("/bin/bash", "/usr/bin/bash"),
 ]
 
+# Maximum threads used to copy binaries and libraries into a container
+COPY_WORKERS = 8
+
 # Container library directories
 CONTAINER_LIB_DIRS = ["lib", "lib64", "usr/lib", "lib/aarch64-linux-gnu"]
 
@@ -92,5 +146,8 @@ ESSENTIAL_SYSTEM_LIBS = [
 # File permissions
 EXECUTABLE_PERMISSION = 0o755
 
+# ioctl request that clones a file's extents (reflink) on supporting filesystems
+FICLONE = 0x40049409
+
 # System paths
 PROC_PATH = "/proc"
@@ -2,27 +2,38 @@
 
 import logging
 import os
+import secrets
 import threading
-import uuid
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, Optional
 
 from src.constants import (
+    CONTAINER_LIB_DIRS,
+    COPY_WORKERS,
+    ESSENTIAL_BINARY_PATHS,
     ESSENTIAL_DIRECTORIES,
+    ESSENTIAL_SYSTEM_LIBS,
+    EXECUTABLE_PERMISSION,
     MINICON_BASE_DIR,
     MINICON_BASE_IMAGE,
-    MINICON_MEMORY_LIMIT,
     MINICON_ROOTFS_DIR,
+    MINICON_ROOTFS_DRIVER,
+    get_memory_limit,
 )
 from src.container.model import Container, State
+from src.container.monitor import ExitMonitor
 from src.container.registry import ContainerRegistry
 from src.namespace.orchestrator import NamespaceOrchestrator
 from src.utils.security import (
     SecurityError,
     safe_copy_directory,
     safe_extract_tar,
+    safe_mount_overlay,
+    safe_umount,
     validate_command,
     validate_container_name,
 )
+from src.utils.system import copy_file
 
 logger = logging.getLogger(__name__)
 
@@ -36,59 +47,99 @@ class ContainerManager:
 
     Attributes:
         registry (ContainerRegistry): Registry for persisting container metadata.
+        _exit_monitor (ExitMonitor): Reactor that reports container exits.
         _orchestrators (dict[str, NamespaceOrchestrator]): Dictionary of orchestrators
             for running containers, keyed by container ID.
         _orchestrator_class (type[NamespaceOrchestrator]): Class used to create
             orchestrator instances.
+        _UID (int): Real user ID of the manager process, mapped to root in
+            the container.
+        _GID (int): Real group ID of the manager process, mapped to root in
+            the container.
         _container_class (type[Container]): Class used to create container instances.
+        _resolved_binaries (tuple | None): Host paths of the essential binaries,
+            resolved on first use and shared by all managers.
+        _resolved_libraries (tuple | None): Host paths of the essential system
+            libraries, resolved on first use and shared by all managers.
     """
 
+    # The manager never changes its own credentials, so read them once
+    _UID: int = os.getuid()
+    _GID: int = os.getgid()
+
     _orchestrator_class: type[NamespaceOrchestrator] = NamespaceOrchestrator
     _container_class: type[Container] = Container
+    _resolved_binaries: Optional[tuple[tuple[tuple[str, ...], str], ...]] = None
+    _resolved_libraries: Optional[tuple[tuple[str, str], ...]] = None
 
     def __init__(self) -> None:
         """Initialize the container manager.
 
         This constructor initializes the container manager with a registry for
         persisting container metadata and a dictionary to track orchestrators
-        for running containers. It also attempts to recover any containers that
-        were previously in the running state.
+        for running containers. It creates the base and root filesystem
+        directories once, so creating a container does not have to, and
+        attempts to recover any containers that were previously in the running
+        state.
 
         The container manager serves as the main interface for creating, starting,
         stopping, and removing containers in the system.
         """
         self.registry: ContainerRegistry = ContainerRegistry()
+        os.makedirs(MINICON_BASE_DIR, exist_ok=True)
+        os.makedirs(MINICON_ROOTFS_DIR, exist_ok=True)
+        self._exit_monitor = ExitMonitor(self._monitor_container)
         self._orchestrators: dict[str, NamespaceOrchestrator] = {}
         self._recover_running_containers()
 
     def _recover_running_containers(self) -> None:
+        # Common case on a quiet host: nothing was left running
+        if not self.registry.has_containers(State.RUNNING):
+            return
+
         running_containers = self.registry.get_all_containers(State.RUNNING)
+        exited_ids: list[str] = []
         for container in running_containers:
-            if container.process_id and self._is_process_running(container.process_id):
+            pidfd = self._open_pidfd(container.process_id)
+            if pidfd is not None or (
+                container.process_id and self._is_process_running(container.process_id)
+            ):
                 orchestrator = self._orchestrator_class()
                 orchestrator._container_pid = container.process_id
+                orchestrator._pidfd = pidfd
                 self._orchestrators[container.id] = orchestrator
 
                 try:
-                    monitor_thread = threading.Thread(
-                        target=self._monitor_container,
-                        args=(container.id,),
-                        daemon=True,
-                    )
-                    monitor_thread.start()
+                    self._watch_container(container.id, pidfd)
                 except Exception as e:
                     logger.warning(
                         f"Failed to start monitoring thread for container "
                         f"{container.id}: {e}"
                     )
                     # Mark as exited since we can't monitor it
-                    self.registry.update_container_state(container.id, State.EXITED)
+                    exited_ids.append(container.id)
                     self._orchestrators.pop(container.id, None)
+                    orchestrator.close_pidfd()
             else:
                 # Process died, mark as exited
-                self.registry.update_container_state(container.id, State.EXITED)
+                exited_ids.append(container.id)
                 self._orchestrators.pop(container.id, None)
 
+        # Persist all stale containers with a single registry write
+        if exited_ids:
+            self.registry.update_many_states(exited_ids, State.EXITED)
+
+    def _open_pidfd(self, process_id: Optional[int]) -> Optional[int]:
+        # A pidfd doubles as the liveness check and as a handle for waiting,
+        # so the PID is never re-probed with a signal
+        if not process_id:
+            return None
+        try:
+            return os.pidfd_open(process_id)
+        except (AttributeError, OSError):
+            # Process is gone or pidfds are unsupported; fall back to kill(0)
+            return None
+
     def _is_process_running(self, process_id: int) -> bool:
         try:
             os.kill(process_id, 0)
@@ -97,7 +148,7 @@ class ContainerManager:
             return False
 
     def create(
-        self, name: str, command: list[str], memory_limit: int = MINICON_MEMORY_LIMIT
+        self, name: str, command: list[str], memory_limit: Optional[int] = None
     ) -> str:
         """Create a new container.
 
@@ -110,7 +161,7 @@ class ContainerManager:
             command: A list of strings representing the command and its
                 arguments to run in the container.
             memory_limit: The memory limit in bytes for the container.
-                Defaults to MINICON_MEMORY_LIMIT.
+                Defaults to the MINICON_MEMORY_LIMIT environment setting.
 
         Returns:
             The unique identifier (ID) of the created container.
@@ -125,7 +176,10 @@ class ContainerManager:
         if not validate_command(command):
             raise ValueError(f"Invalid or dangerous command: {command}")
 
-        container_id = str(uuid.uuid4())[:8]
+        if memory_limit is None:
+            memory_limit = get_memory_limit()
+
+        container_id = secrets.token_hex(4)
         root_fs_path = self._prepare_root_fs(container_id)
         container = self._container_class(
             id=container_id,
@@ -162,18 +216,20 @@ class ContainerManager:
 
         orchestrator = self._orchestrator_class()
         try:
+            self._restore_overlay_root_fs(container.root_fs)
             orchestrator.configure(
                 root_fs=container.root_fs,
                 hostname=container.hostname,
                 command=container.command,
                 memory_limit=container.memory_limit,
-                uid_map=[(0, os.getuid(), 1)],
-                gid_map=[(0, os.getgid(), 1)],
+                uid_map=[(0, self._UID, 1)],
+                gid_map=[(0, self._GID, 1)],
             )
             orchestrator.set_cgroup_settings(
                 memory_limit=container.memory_limit,
             )
             pid = orchestrator.create_container_process()
+            orchestrator._pidfd = self._open_pidfd(pid)
             kwargs = {"process_id": pid}
             self.registry.update_container_state(container_id, State.RUNNING, **kwargs)
             self._orchestrators[container_id] = orchestrator
@@ -183,15 +239,27 @@ class ContainerManager:
             raise RuntimeError(f"Failed to start container {container_id}: {e}") from e
 
         try:
-            monitor_thread = threading.Thread(
-                target=self._monitor_container,
-                args=(container_id,),
-                daemon=True,
-            )
-            monitor_thread.start()
+            self._watch_container(container_id, orchestrator._pidfd)
         except RuntimeError as e:
             logger.warning(f"Could not start monitoring thread: {e}")
 
+    def _watch_container(self, container_id: str, pidfd: Optional[int]) -> None:
+        # Prefer the shared epoll reactor; a dedicated waiting thread is only
+        # needed when no pidfd could be opened for the process
+        if pidfd is not None:
+            try:
+                self._exit_monitor.watch(container_id, pidfd)
+                return
+            except OSError as e:
+                logger.warning(f"Could not watch container {container_id}: {e}")
+
+        monitor_thread = threading.Thread(
+            target=self._monitor_container,
+            args=(container_id,),
+            daemon=True,
+        )
+        monitor_thread.start()
+
     def _monitor_container(self, container_id: str) -> None:
         orchestrator = self._orchestrators.get(container_id)
         if not orchestrator:
@@ -202,6 +270,9 @@ class ContainerManager:
             self.registry.update_container_state(
                 container_id, State.EXITED, exit_code=exit_code
             )
+            container = self.registry.get_container(container_id)
+            if container:
+                self._release_root_fs(container.root_fs)
         except (OSError, ChildProcessError) as e:
             logger.warning(f"Failed to monitor container {container_id}: {e}")
             # Process might have already exited, mark as exited with unknown code
@@ -215,6 +286,7 @@ class ContainerManager:
             )
         finally:
             self._orchestrators.pop(container_id, None)
+            orchestrator.close_pidfd()
 
     def stop(self, container_id: str) -> bool:
         """Stop a container.
@@ -246,6 +318,7 @@ class ContainerManager:
 
         orchestrator.terminate()
         self.registry.update_container_state(container_id, State.EXITED)
+        self._release_root_fs(container.root_fs)
         return True
 
     def remove(self, container_id: str) -> None:
@@ -269,56 +342,54 @@ class ContainerManager:
             raise ValueError(
                 f"Cannot remove running container {container_id}. Stop it first."
             )
-        container = self.registry.get_container(container_id)
-        if not container:
-            raise ValueError(f"Container {container_id} not found")
+
+        if os.path.ismount(container.root_fs):
+            safe_umount(container.root_fs)
+
         self.registry.remove_container(container_id)
         orchestrator = self._orchestrators.pop(container_id, None)
         if orchestrator:
             orchestrator.cleanup_resources()
+            orchestrator.close_pidfd()
 
-    def list(self, state: Optional[State] = None) -> list[Container]:
+    def list(self, state: Optional[State] = None) -> Iterator[Container]:
         """List containers, optionally filtered by state.
 
-        This method retrieves all containers from the registry, optionally filtered
-        by their state. It returns a list of Container objects that match the
-        specified criteria.
+        This method lazily iterates over the containers in the registry,
+        optionally filtered by their state, so callers that only display a page
+        of results never build the full list.
 
         Args:
             state: Optional state to filter containers by. If None, all containers
                 are returned regardless of state.
 
         Returns:
-            A list of Container objects, optionally filtered by state.
+            An iterator of Container objects, optionally filtered by state.
+        """
+        return self.registry.iter_containers(state)
+
+    def has_any(self, state: Optional[State] = None) -> bool:
+        """Check whether any containers exist, optionally filtered by state.
+
+        This is a cheaper alternative to `list` when only the presence of
+        containers matters.
+
+        Args:
+            state: Optional state to filter containers by. If None, any
+                container counts regardless of state.
+
+        Returns:
+            True if at least one matching container exists, False otherwise.
         """
-        return self.registry.get_all_containers(state)
+        return self.registry.has_containers(state)
 
     def _prepare_root_fs(self, container_id: str) -> str:
-        base_dir = MINICON_BASE_DIR
         base_image_path = MINICON_BASE_IMAGE
         root_fs_path = f"{MINICON_ROOTFS_DIR}/{container_id}"
 
-        os.makedirs(base_dir, exist_ok=True)
         os.makedirs(root_fs_path, exist_ok=True)
 
-        if os.path.exists(base_image_path):
-            try:
-                if os.path.isdir(base_image_path):
-                    safe_copy_directory(base_image_path, root_fs_path)
-                elif os.path.isfile(base_image_path) and base_image_path.endswith(
-                    ".tar"
-                ):
-                    safe_extract_tar(base_image_path, root_fs_path)
-            except SecurityError as e:
-                logger.error(f"Security error preparing root filesystem: {e}")
-                raise
-            except Exception as e:
-                logger.error(f"Failed to prepare base filesystem: {e}")
-                # Continue with minimal filesystem creation
-        else:
-            logger.warning(
-                f"Base image not found: {base_image_path}. Creating minimal filesystem."
-            )
+        root_fs_path = self._populate_root_fs(root_fs_path, base_image_path)
 
         for dir_name in ESSENTIAL_DIRECTORIES:
             os.makedirs(os.path.join(root_fs_path, dir_name), exist_ok=True)
@@ -327,73 +398,270 @@ class ContainerManager:
         self._copy_essential_binaries(root_fs_path)
 
         hosts_file = os.path.join(root_fs_path, "etc/hosts")
-        if not os.path.exists(hosts_file):
-            with open(hosts_file, "w") as _file:
-                _file.write("127.0.0.1 localhost\n")
-                _file.write(f"127.0.0.1 {container_id}\n")
+        hosts = b"127.0.0.1 localhost\n127.0.0.1 %s\n" % container_id.encode()
+        try:
+            # Exclusive create keeps a hosts file supplied by the base image
+            with open(hosts_file, "xb") as _file:
+                _file.write(hosts)
+        except FileExistsError:
+            pass
 
         return root_fs_path
 
+    def _populate_root_fs(self, container_dir: str, base_image_path: str) -> str:
+        """Fill a container directory from the base image with the chosen driver.
+
+        Args:
+            container_dir: Directory created for the container.
+            base_image_path: Path to the base image.
+
+        Returns:
+            The path of the container's root filesystem: the merged overlay
+            when the overlay driver is used, otherwise container_dir itself.
+
+        Raises:
+            SecurityError: If the base image or a path fails validation.
+        """
+        overlay_path = self._mount_overlay_root_fs(container_dir, base_image_path)
+        if overlay_path:
+            return overlay_path
+
+        if not os.path.exists(base_image_path):
+            logger.warning(
+                f"Base image not found: {base_image_path}. Creating minimal filesystem."
+            )
+            return container_dir
+
+        try:
+            if os.path.isdir(base_image_path):
+                safe_copy_directory(base_image_path, container_dir)
+            elif os.path.isfile(base_image_path) and base_image_path.endswith(".tar"):
+                safe_extract_tar(base_image_path, container_dir)
+        except SecurityError as e:
+            logger.error(f"Security error preparing root filesystem: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to prepare base filesystem: {e}")
+            # Continue with minimal filesystem creation
+        return container_dir
+
+    def _mount_overlay_root_fs(
+        self, container_dir: str, base_image_path: str
+    ) -> Optional[str]:
+        """Mount the base image beneath a per-container overlay.
+
+        The base image directory is shared read-only by every container and
+        only the files a container changes are written to its upper layer, so
+        creating a container no longer copies the whole image.
+
+        The overlay is mounted in the host mount namespace at create time and
+        stays mounted until the container is stopped or its exit is observed.
+        An exit seen by no manager leaves it mounted until `remove`, which
+        unmounts whatever is still mounted. If a reboot drops the mount of a
+        container that was created but not started, `start` mounts it again.
+
+        Args:
+            container_dir: Directory holding the container's overlay layers.
+            base_image_path: Path to the base image.
+
+        Returns:
+            The path of the merged root filesystem, or None if the overlay
+            driver is disabled, the base image is not a directory, or the
+            mount failed and the image must be copied instead.
+        """
+        if MINICON_ROOTFS_DRIVER != "overlay" or not os.path.isdir(base_image_path):
+            return None
+
+        upper_dir = os.path.join(container_dir, "upper")
+        work_dir = os.path.join(container_dir, "work")
+        merged_dir = os.path.join(container_dir, "merged")
+        for path in (upper_dir, work_dir, merged_dir):
+            os.makedirs(path, exist_ok=True)
+
+        try:
+            safe_mount_overlay(base_image_path, upper_dir, work_dir, merged_dir)
+        except SecurityError:
+            raise
+        except Exception as e:
+            logger.warning(f"Overlay mount failed, copying base image instead: {e}")
+            return None
+
+        return merged_dir
+
+    def _restore_overlay_root_fs(self, root_fs: str) -> None:
+        """Remount a created container's overlay if it is no longer mounted.
+
+        Overlay mounts live in the host mount namespace and do not survive a
+        reboot, while the registry does. The upper layer on disk still holds
+        the container's changes, so the overlay is mounted again over it.
+
+        Args:
+            root_fs: The container's root filesystem path.
+
+        Raises:
+            SecurityError: If a path fails validation.
+            OSError: If the overlay cannot be mounted.
+        """
+        container_dir = os.path.dirname(root_fs)
+        upper_dir = os.path.join(container_dir, "upper")
+        if (
+            os.path.basename(root_fs) != "merged"
+            or not os.path.isdir(upper_dir)
+            or os.path.ismount(root_fs)
+        ):
+            return
+
+        work_dir = os.path.join(container_dir, "work")
+        safe_mount_overlay(MINICON_BASE_IMAGE, upper_dir, work_dir, root_fs)
+
+    def _release_root_fs(self, root_fs: str) -> None:
+        """Unmount an exited container's overlay root filesystem.
+
+        Copied root filesystems are plain directories and are left alone.
+        The upper layer keeps the container's changes until it is removed.
+
+        Args:
+            root_fs: The container's root filesystem path.
+        """
+        if not os.path.ismount(root_fs):
+            return
+        try:
+            safe_umount(root_fs)
+        except Exception as e:
+            logger.warning(f"Failed to unmount root filesystem {root_fs}: {e}")
+
     def _copy_essential_binaries(self, root_fs_path: str) -> None:
         """Copy essential system binaries and libraries to container filesystem."""
-        import shutil
-
-        # Copy shared libraries first
-        self._copy_shared_libraries(root_fs_path)
+        # Libraries and binaries go out as one batch so their copies overlap
+        copies = self._shared_library_copies(root_fs_path)
+        copies.update(self._essential_binary_copies(root_fs_path))
+        self._copy_files(copies)
 
-        from ..constants import ESSENTIAL_BINARY_PATHS
+    def _essential_binary_copies(
+        self, root_fs_path: str
+    ) -> dict[str, tuple[tuple[str, ...], Optional[int]]]:
+        """Resolve the essential binaries that still need copying.
 
-        essential_binaries = ESSENTIAL_BINARY_PATHS
+        Args:
+            root_fs_path: Path to the container's root filesystem.
 
+        Returns:
+            Candidate source paths, in order of preference, and permission bits
+            keyed by destination path.
+        """
         bin_dir = os.path.join(root_fs_path, "bin")
 
-        for binary_paths in essential_binaries:
-            binary_copied = False
-            for binary_path in binary_paths:
-                if os.path.exists(binary_path):
-                    try:
-                        binary_name = os.path.basename(binary_path)
-                        dest_path = os.path.join(bin_dir, binary_name)
-
-                        # Copy binary if it doesn't exist
-                        if not os.path.exists(dest_path):
-                            shutil.copy2(binary_path, dest_path)
-                            # Make executable
-                            from src.constants import EXECUTABLE_PERMISSION
-
-                            os.chmod(dest_path, EXECUTABLE_PERMISSION)
-                            logger.info(f"Copied {binary_path} to container")
-                            binary_copied = True
-                            break
-                    except Exception as e:
-                        logger.warning(f"Failed to copy {binary_path}: {e}")
-                        continue
-
-            if not binary_copied:
-                logger.warning(f"Could not find any of {binary_paths} to copy")
-
-    def _copy_shared_libraries(self, root_fs_path: str) -> None:
-        """Copy essential shared libraries to container filesystem."""
-        import shutil
-
-        from ..constants import CONTAINER_LIB_DIRS, ESSENTIAL_SYSTEM_LIBS
+        copies: dict[str, tuple[tuple[str, ...], Optional[int]]] = {}
+        for binary_paths, binary_name in self._resolve_binaries():
+            # Copy binary if it doesn't exist
+            dest_path = os.path.join(bin_dir, binary_name)
+            if not os.path.exists(dest_path):
+                copies.setdefault(dest_path, (binary_paths, EXECUTABLE_PERMISSION))
+
+        return copies
 
+    def _shared_library_copies(
+        self, root_fs_path: str
+    ) -> dict[str, tuple[tuple[str, ...], Optional[int]]]:
+        """Resolve the shared libraries that still need copying.
+
+        The library directories are created as a side effect.
+
+        Args:
+            root_fs_path: Path to the container's root filesystem.
+
+        Returns:
+            Candidate source paths, in order of preference, and permission bits
+            keyed by destination path.
+        """
         # Create lib directories
         for lib_dir in CONTAINER_LIB_DIRS:
             os.makedirs(os.path.join(root_fs_path, lib_dir), exist_ok=True)
 
-        # Essential libraries and their destination paths
-        essential_libs = ESSENTIAL_SYSTEM_LIBS
+        # Several sources may share a destination; they are tried in order
+        sources: dict[str, list[str]] = {}
+        for src_path, dest_rel_path in self._resolve_libraries():
+            dest_path = os.path.join(root_fs_path, dest_rel_path)
+            if dest_path not in sources:
+                if os.path.exists(dest_path):
+                    continue
+                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            sources.setdefault(dest_path, []).append(src_path)
+
+        return {
+            dest_path: (tuple(src_paths), None)
+            for dest_path, src_paths in sources.items()
+        }
+
+    @classmethod
+    def _resolve_binaries(cls) -> tuple[tuple[tuple[str, ...], str], ...]:
+        """Find the host copies of each essential binary, once per process.
 
-        for src_path, dest_rel_path in essential_libs:
-            if os.path.exists(src_path):
-                try:
-                    dest_path = os.path.join(root_fs_path, dest_rel_path)
-                    dest_dir = os.path.dirname(dest_path)
-                    os.makedirs(dest_dir, exist_ok=True)
+        Returns:
+            Pairs of (existing source paths, binary name) for every binary found
+            on the host. The binary name is taken from the first source.
+        """
+        if cls._resolved_binaries is None:
+            resolved = []
+            for binary_paths in ESSENTIAL_BINARY_PATHS:
+                existing = tuple(path for path in binary_paths if os.path.exists(path))
+                if not existing:
+                    logger.warning(f"Could not find any of {binary_paths} to copy")
+                    continue
+                resolved.append((existing, os.path.basename(existing[0])))
+            cls._resolved_binaries = tuple(resolved)
+        return cls._resolved_binaries
+
+    @classmethod
+    def _resolve_libraries(cls) -> tuple[tuple[str, str], ...]:
+        """Find the essential system libraries present on the host, once per process.
 
-                    if not os.path.exists(dest_path):
-                        shutil.copy2(src_path, dest_path)
-                        logger.info(f"Copied library {src_path} to container")
+        Returns:
+            Pairs of (source path, path relative to the container root) for
+            every library found on the host.
+        """
+        if cls._resolved_libraries is None:
+            cls._resolved_libraries = tuple(
+                (src_path, dest_rel_path)
+                for src_path, dest_rel_path in ESSENTIAL_SYSTEM_LIBS
+                if os.path.exists(src_path)
+            )
+        return cls._resolved_libraries
+
+    def _copy_files(
+        self, copies: dict[str, tuple[tuple[str, ...], Optional[int]]]
+    ) -> None:
+        """Copy independent files into the container filesystem concurrently.
+
+        Each destination is copied from the first of its candidate sources that
+        succeeds, so a failing source falls back to the next one.
+
+        Args:
+            copies: Candidate source paths, in order of preference, and optional
+                permission bits to apply, keyed by destination path.
+        """
+        if not copies:
+            return
+
+        def copy(
+            src_paths: tuple[str, ...], dest_path: str, mode: Optional[int]
+        ) -> str:
+            for src_path in src_paths:
+                try:
+                    copy_file(src_path, dest_path, mode)
+                    return src_path
                 except Exception as e:
-                    logger.warning(f"Failed to copy library {src_path}: {e}")
+                    logger.warning(f"Failed to copy {src_path}: {e}")
+            raise OSError(f"Could not copy any of {src_paths}")
+
+        workers = min(COPY_WORKERS, len(copies))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(copy, src_paths, dest_path, mode)
+                for dest_path, (src_paths, mode) in copies.items()
+            ]
+            for future in as_completed(futures):
+                try:
+                    logger.info(f"Copied {future.result()} to container")
+                except OSError as e:
+                    logger.warning(str(e))
@@ -1,10 +1,13 @@
 """Container model and state management."""
 
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import ClassVar, List, Optional
+
+_DATE_FIELDS = ("created_at", "started_at", "exited_at")
+_fromisoformat = datetime.fromisoformat
 
 
 class State(str, Enum):
@@ -18,7 +21,7 @@ class State(str, Enum):
     EXITED = "exited"
 
 
-@dataclass
+@dataclass(slots=True)
 class Container:
     """Container model representing a running or stopped container.
 
@@ -49,10 +52,28 @@ class Container:
     process_id: Optional[int] = None
     state: State = State.CREATED
     exit_code: int = 0
-    created_at: datetime = datetime.now()
+    created_at: datetime = field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
     exited_at: Optional[datetime] = None
 
+    # Names of the dataclass fields, assigned once the class is built
+    FIELD_NAMES: ClassVar[frozenset[str]]
+
+    @property
+    def display_command(self) -> str:
+        """Get a shortened form of the command for display.
+
+        Only the first three arguments are shown, followed by an ellipsis
+        when the command has more.
+
+        Returns:
+            The truncated command string.
+        """
+        display = " ".join(self.command[:3])
+        if len(self.command) > 3:
+            display += "..."
+        return display
+
     def to_dict(self) -> dict:
         """Serialize the container to a dictionary.
 
@@ -63,21 +84,31 @@ class Container:
         Returns:
             A dictionary containing the container's metadata.
         """
-        data = asdict(self)
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                data[key] = value.isoformat() if value else None
-            elif isinstance(value, Enum):
-                data[key] = value.value
-        return data
+        # Built by hand: asdict() deep-copies every field only to be re-scanned.
+        # The command list is shared, not copied; callers serialize it directly.
+        return {
+            "name": self.name,
+            "id": self.id,
+            "command": self.command,
+            "root_fs": self.root_fs,
+            "hostname": self.hostname,
+            "memory_limit": self.memory_limit,
+            "process_id": self.process_id,
+            "state": self.state.value,
+            "exit_code": self.exit_code,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "exited_at": self.exited_at.isoformat() if self.exited_at else None,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Container":
         """Create a Container instance from a dictionary.
 
         This method deserializes a dictionary representation of a container's
-        metadata into a Container object. It handles the conversion of string
-        representations of enum and datetime fields to their respective types.
+        metadata into a Container object. It converts the state value to its
+        enum and ISO 8601 date strings to datetimes; the dictionary is expected
+        to come from JSON, as produced by `to_dict`.
 
         Args:
             data: A dictionary containing the container's metadata.
@@ -85,15 +116,37 @@ class Container:
         Returns:
             A Container instance populated with the data from the dictionary.
         """
-        if "state" in data and isinstance(data["state"], str):
-            data["state"] = State(data["state"])
+        return cls(**_convert_fields(data))
+
+    @staticmethod
+    def fields_from_dict(data: dict) -> dict:
+        """Convert a metadata dictionary into Container field values.
 
-        for date_field in ["created_at", "started_at", "exited_at"]:
-            if date_field in data and data[date_field]:
-                if isinstance(data[date_field], str):
-                    data[date_field] = datetime.fromisoformat(data[date_field])
+        Unknown keys are dropped and serialized states and dates are parsed,
+        without applying the result to any instance.
+
+        Args:
+            data: A dictionary containing the container's metadata.
+
+        Returns:
+            A dictionary of field names to converted values.
+
+        Raises:
+            ValueError: If the state or a date value is invalid.
+        """
+        return _convert_fields(data)
 
-        return cls(**data)
+    def update_from_dict(self, data: dict) -> None:
+        """Overwrite this container's fields from a dictionary.
+
+        This is the in-place counterpart of `from_dict`, used to refresh an
+        existing instance on reload instead of allocating a new one.
+
+        Args:
+            data: A dictionary containing the container's metadata.
+        """
+        for key, value in _convert_fields(data).items():
+            setattr(self, key, value)
 
     def to_json(self) -> str:
         """Serialize the container to a JSON string.
@@ -121,3 +174,40 @@ class Container:
             A Container instance populated with the data from the JSON string.
         """
         return cls.from_dict(json.loads(json_str))
+
+
+Container.FIELD_NAMES = frozenset(f.name for f in fields(Container))
+
+# Plain dict lookup avoids Enum.__call__ for every deserialized container
+_STATE_MAP = {state.value: state for state in State}
+
+
+def _convert_fields(data: dict) -> dict:
+    """Convert serialized state and date values, dropping unknown keys.
+
+    Keys that are not Container fields, such as ones written by a newer
+    version, are ignored instead of failing the whole load.
+
+    Args:
+        data: A dictionary of container metadata decoded from JSON.
+
+    Returns:
+        A dictionary of the known fields, with the state as a State and ISO
+        8601 date strings as datetimes.
+    """
+    field_names = Container.FIELD_NAMES
+    converted = {key: value for key, value in data.items() if key in field_names}
+
+    state = converted.get("state")
+    if isinstance(state, str) and not isinstance(state, State):
+        try:
+            converted["state"] = _STATE_MAP[state]
+        except KeyError:
+            raise ValueError(f"Invalid state: {state!r}") from None
+
+    for date_field in _DATE_FIELDS:
+        value = converted.get(date_field)
+        if value and isinstance(value, str):
+            converted[date_field] = _fromisoformat(value)
+
+    return converted
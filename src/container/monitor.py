@@ -0,0 +1,86 @@
+"""Event-driven container exit monitor."""
+
+import logging
+import select
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExitMonitor:
+    """Watches container process file descriptors for exit on a single thread.
+
+    Each watched pidfd is registered with an epoll instance. A pidfd becomes
+    readable once its process exits, at which point the exit callback is
+    invoked with the container ID. This replaces one blocking thread per
+    container with one reactor thread for all of them.
+
+    Attributes:
+        _on_exit (Callable[[str], None]): Callback invoked with the container ID
+            once its process has exited.
+        _epoll (select.epoll | None): Epoll instance, created on first watch.
+        _thread (threading.Thread | None): Reactor thread, started on first watch.
+        _watched (dict[int, str]): Container IDs keyed by pidfd.
+        _lock (threading.Lock): Guards `_watched` and lazy initialization.
+    """
+
+    def __init__(self, on_exit: Callable[[str], None]) -> None:
+        """Initialize the exit monitor.
+
+        Args:
+            on_exit: Callback invoked with the container ID after its process
+                exits. It runs on the reactor thread.
+        """
+        self._on_exit = on_exit
+        self._epoll: Optional[select.epoll] = None
+        self._thread: Optional[threading.Thread] = None
+        self._watched: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def watch(self, container_id: str, pidfd: int) -> None:
+        """Start watching a container process for exit.
+
+        Args:
+            container_id: The ID of the container that owns the process.
+            pidfd: A process file descriptor for the container process. It
+                remains owned by the caller.
+
+        Raises:
+            OSError: If the pidfd cannot be registered with epoll.
+        """
+        with self._lock:
+            if self._epoll is None:
+                self._epoll = select.epoll()
+            self._epoll.register(pidfd, select.EPOLLIN | select.EPOLLONESHOT)
+            self._watched[pidfd] = container_id
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        assert self._epoll is not None
+        while True:
+            try:
+                events = self._epoll.poll()
+            except InterruptedError:
+                continue
+
+            for pidfd, _ in events:
+                with self._lock:
+                    container_id = self._watched.pop(pidfd, None)
+                    try:
+                        self._epoll.unregister(pidfd)
+                    except OSError:
+                        pass
+
+                if container_id is None:
+                    continue
+
+                try:
+                    self._on_exit(container_id)
+                except Exception as e:
+                    logger.error(
+                        f"Exit handler failed for container {container_id}: {e}"
+                    )
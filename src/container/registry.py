@@ -2,9 +2,17 @@
 
 import json
 import logging
+import mmap
 import os
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from types import TracebackType
+from typing import Any, BinaryIO, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 from src.constants import MINICON_BASE_DIR, MINICON_REGISTRY_FILE
 from src.container.model import Container, State
@@ -12,6 +20,91 @@ from src.container.model import Container, State
 logger = logging.getLogger(__name__)
 
 
+def _loads(raw: bytes | str | memoryview) -> Any:
+    """Parse registry JSON, using orjson when it is installed.
+
+    Args:
+        raw: The raw registry file contents.
+
+    Returns:
+        The decoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode registry data as indented UTF-8 JSON, preferring orjson.
+
+    Args:
+        data: The JSON-serializable registry document.
+
+    Returns:
+        The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _read_registry(path: str) -> Any:
+    """Read and parse a registry file.
+
+    Args:
+        path: Path to the registry file.
+
+    Returns:
+        The decoded JSON document.
+    """
+    with open(path, "rb") as _file:
+        mapped = _map_file(_file)
+        if mapped is None:
+            return _loads(_file.read())
+
+        # The view must be released before the mapping can be closed
+        with mapped, memoryview(mapped) as view:
+            return _loads(view)
+
+
+def _map_file(_file: BinaryIO) -> Optional[mmap.mmap]:
+    """Map an open file read-only, so orjson can parse it without a copy.
+
+    Args:
+        _file: The open registry file.
+
+    Returns:
+        The read-only mapping, or None when orjson is not installed (json
+        cannot parse a buffer) or the file cannot be mapped, e.g. when empty.
+    """
+    if orjson is None:
+        return None
+    try:
+        return mmap.mmap(_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=4)
+def _read_registry_cached(path: str, inode: int, mtime_ns: int, size: int) -> Any:
+    """Read a registry file, reusing the parse while the file is unchanged.
+
+    The inode, modification time and size are part of the cache key. Saves
+    replace the file with a new one, so every save changes the inode even
+    when it lands within the same timestamp tick and keeps the same length.
+
+    Args:
+        path: Path to the registry file.
+        inode: Inode number of the file.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+
+    Returns:
+        The decoded JSON document. Callers must not mutate it.
+    """
+    return _read_registry(path)
+
+
 class ContainerRegistry:
     """Manages a collection of containers, storing their metadata in a JSON file.
 
@@ -19,23 +112,43 @@ class ContainerRegistry:
     It also handles serialization and deserialization of container data to and
     from the JSON file.
 
+    Mutations are written to the file immediately unless autoflush is off,
+    in which case they accumulate until `flush` is called. Using the registry
+    as a context manager batches every mutation in the block into one write.
+
     Args:
         registry_file (str, optional): Path to the JSON file used to store
             container metadata. Defaults to MINICON_REGISTRY_FILE.
+        autoflush (bool, optional): Whether each mutation is written to the
+            file immediately. Defaults to True.
 
     Attributes:
         _registry_file (str): Path to the JSON file used to store container
             metadata.
         _containers (Dict[str, Container]): Dictionary of containers, keyed
             by container ID.
+        _autoflush (bool): Whether each mutation is written immediately.
+        _outer_autoflush (bool): The autoflush setting to restore when the
+            outermost batch block exits.
+        _batch_depth (int): Number of currently open batch blocks.
+        _dirty (bool): Whether there are mutations not yet written to the file.
+        _directory_ready (bool): Whether the registry file's directory is known
+            to exist.
+        _by_state (dict[State, dict[str, None]]): Container IDs in each state,
+            as insertion-ordered sets, so filtering by state does not scan
+            every container.
     """
 
-    def __init__(self, registry_file: str = MINICON_REGISTRY_FILE):
+    def __init__(
+        self, registry_file: str = MINICON_REGISTRY_FILE, autoflush: bool = True
+    ):
         """Initializes the container registry.
 
         Args:
             registry_file (str, optional): Path to the JSON file used to store
                 container metadata. Defaults to MINICON_REGISTRY_FILE.
+            autoflush (bool, optional): Whether each mutation is written to the
+                file immediately. Defaults to True.
         """
         if not os.path.isabs(registry_file):
             self._registry_file = os.path.join(MINICON_BASE_DIR, registry_file)
@@ -43,8 +156,58 @@ class ContainerRegistry:
             self._registry_file = registry_file
 
         self._containers: dict[str, Container] = {}
+        self._by_state: dict[State, dict[str, None]] = {state: {} for state in State}
+        self._autoflush = autoflush
+        self._outer_autoflush = autoflush
+        self._batch_depth = 0
+        self._dirty = False
+        self._directory_ready = False
         self.load_containers()
 
+    def __enter__(self) -> "ContainerRegistry":
+        """Starts a batch, deferring writes until the outermost block exits.
+
+        Returns:
+            The registry itself.
+        """
+        if self._batch_depth == 0:
+            self._outer_autoflush = self._autoflush
+            self._autoflush = False
+        self._batch_depth += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Ends a batch, writing pending mutations if it is the outermost one.
+
+        Args:
+            exc_type: The type of the exception raised in the block, if any.
+            exc_value: The exception raised in the block, if any.
+            traceback: The traceback of the exception, if any.
+        """
+        self._batch_depth -= 1
+        if self._batch_depth > 0:
+            return
+
+        self._autoflush = self._outer_autoflush
+        # Flush even on error so the file matches the in-memory registry
+        self.flush()
+
+    def flush(self) -> None:
+        """Writes pending mutations to the registry file, if there are any."""
+        if self._dirty:
+            self._save_to_file()
+            self._dirty = False
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._autoflush:
+            self.flush()
+
     def load_containers(self) -> None:
         """Loads container metadata from the registry file.
 
@@ -55,21 +218,54 @@ class ContainerRegistry:
         """
         try:
             if os.path.exists(self._registry_file):
-                with open(self._registry_file, "r") as _file:
-                    data = json.load(_file)
-                    self._containers = {
-                        container_id: self._deserialize_container(container_data)
-                        for container_id, container_data in data.items()
-                    }
-                    logger.info(
-                        f"Loaded {len(self._containers)} containers from"
-                        f"{self._registry_file}"
-                    )
+                data = self._read_registry_file()
+                containers: dict[str, Container] = {}
+                refreshed: list[tuple[Container, dict]] = []
+                for container_id, container_data in data.items():
+                    # The parsed document may be cached and shared with other
+                    # registries; command is the only mutable value a
+                    # Container keeps from it, so only that is copied
+                    if "command" in container_data:
+                        container_data = {
+                            **container_data,
+                            "command": list(container_data["command"]),
+                        }
+                    # On reload, refresh existing instances instead of
+                    # replacing them
+                    container = self._containers.get(container_id)
+                    if container is not None:
+                        refreshed.append(
+                            (container, Container.fields_from_dict(container_data))
+                        )
+                    else:
+                        container = self._deserialize_container(container_data)
+                    containers[container_id] = container
+
+                # Every entry converted, so existing instances are only
+                # touched once the whole document is known to be valid
+                for container, fields in refreshed:
+                    for key, value in fields.items():
+                        setattr(container, key, value)
+                self._containers = containers
+                self._reindex()
+                logger.info(
+                    f"Loaded {len(self._containers)} containers from"
+                    f"{self._registry_file}"
+                )
             else:
                 logger.warning(f"Registry file {self._registry_file} not found")
         except Exception as e:
             logger.error(f"Failed to load containers from {self._registry_file}: {e}")
 
+    def _read_registry_file(self) -> Any:
+        try:
+            stat = os.stat(self._registry_file)
+        except OSError:
+            return _read_registry(self._registry_file)
+        return _read_registry_cached(
+            self._registry_file, stat.st_ino, stat.st_mtime_ns, stat.st_size
+        )
+
     def save_container(self, container: Container) -> None:
         """Saves a container to the registry.
 
@@ -80,7 +276,8 @@ class ContainerRegistry:
             container: The container to save.
         """
         self._containers[container.id] = container
-        self._save_to_file()
+        self._index(container.id, container.state)
+        self._mark_dirty()
 
     def get_container(self, container_id: str) -> Optional[Container]:
         """Retrieve a container by its ID.
@@ -107,10 +304,59 @@ class ContainerRegistry:
         Returns:
             A list of Container objects, optionally filtered by state.
         """
-        containers = list(self._containers.values())
         if state:
-            return [container for container in containers if container.state == state]
-        return containers
+            return self.get_by_state(state)
+        return list(self._containers.values())
+
+    def get_by_state(self, state: State) -> list[Container]:
+        """Retrieves the containers in a given state.
+
+        The per-state index is used, so the cost depends on the number of
+        matching containers rather than the size of the registry.
+
+        Args:
+            state: The state to filter containers by.
+
+        Returns:
+            A list of the containers in that state.
+        """
+        container_ids = self._by_state[state]
+        return [self._containers[container_id] for container_id in container_ids]
+
+    def iter_containers(self, state: Optional[State] = None) -> Iterator[Container]:
+        """Iterate over containers, optionally filtered by state.
+
+        Unlike `get_all_containers`, no intermediate list is built, so callers
+        that only need part of the registry can stop early.
+
+        Args:
+            state: Optional state to filter containers by. If None, all containers
+                are yielded regardless of state.
+
+        Yields:
+            Container objects, optionally filtered by state.
+        """
+        if state is None:
+            yield from self._containers.values()
+        else:
+            for container_id in self._by_state[state]:
+                yield self._containers[container_id]
+
+    def has_containers(self, state: Optional[State] = None) -> bool:
+        """Check whether the registry holds any containers.
+
+        Stops at the first match instead of building the full list.
+
+        Args:
+            state: Optional state to filter containers by. If None, any
+                container counts regardless of state.
+
+        Returns:
+            True if at least one container matches, False otherwise.
+        """
+        if state is None:
+            return bool(self._containers)
+        return bool(self._by_state[state])
 
     def update_container_state(
         self, container_id: str, new_state: State, **kwargs: str | int
@@ -130,7 +376,39 @@ class ContainerRegistry:
             return False
 
         container = self._containers[container_id]
+        self._apply_state(container, new_state, **kwargs)
+
+        self._mark_dirty()
+        return True
+
+    def update_many_states(self, container_ids: list[str], new_state: State) -> int:
+        """Updates the state of several containers with a single registry write.
+
+        Args:
+            container_ids: The unique identifiers of the containers to update.
+            new_state: The new state to set for each container.
+
+        Returns:
+            The number of containers that were found and updated.
+        """
+        updated = 0
+        for container_id in container_ids:
+            container = self._containers.get(container_id)
+            if container is None:
+                continue
+
+            self._apply_state(container, new_state)
+            updated += 1
+
+        if updated:
+            self._mark_dirty()
+        return updated
+
+    def _apply_state(
+        self, container: Container, new_state: State, **kwargs: str | int
+    ) -> None:
         container.state = new_state
+        self._index(container.id, new_state)
         if new_state == State.RUNNING:
             container.started_at = datetime.now()
         elif new_state == State.EXITED:
@@ -138,11 +416,23 @@ class ContainerRegistry:
             container.exit_code = int(kwargs.get("exit_code", 0))
 
         for key, value in kwargs.items():
-            if hasattr(container, key):
+            if key in Container.FIELD_NAMES:
                 setattr(container, key, value)
 
-        self._save_to_file()
-        return True
+    def _index(self, container_id: str, state: State) -> None:
+        # Clear every state, not just the recorded one, in case the container's
+        # state was changed directly on the instance
+        self._unindex(container_id)
+        self._by_state[state][container_id] = None
+
+    def _unindex(self, container_id: str) -> None:
+        for container_ids in self._by_state.values():
+            container_ids.pop(container_id, None)
+
+    def _reindex(self) -> None:
+        self._by_state = {state: {} for state in State}
+        for container_id, container in self._containers.items():
+            self._by_state[container.state][container_id] = None
 
     def remove_container(self, container_id: str) -> bool:
         """Removes a container from the registry.
@@ -156,7 +446,8 @@ class ContainerRegistry:
         """
         if container_id in self._containers:
             del self._containers[container_id]
-            self._save_to_file()
+            self._unindex(container_id)
+            self._mark_dirty()
             return True
         return False
 
@@ -165,27 +456,43 @@ class ContainerRegistry:
 
         This method serializes the `_containers` dictionary to a JSON file
         atomically, first writing to a temporary file and then replacing the
-        original file with the temporary file. If an error occurs during
-        serialization or file writing, the original file is left intact and
-        the exception is re-raised.
+        original file with the temporary file. Containers are encoded one at a
+        time as the file is written. If an error occurs during serialization
+        or file writing, the original file is left intact and the exception
+        is re-raised.
         """
         try:
-            os.makedirs(os.path.dirname(self._registry_file), exist_ok=True)
-
-            data = {
-                container_id: self._serialize_container(container)
-                for container_id, container in self._containers.items()
-            }
+            if not self._directory_ready:
+                registry_dir = os.path.dirname(self._registry_file) or "."
+                os.makedirs(registry_dir, exist_ok=True)
+                self._directory_ready = True
 
             temp_file = f"{self._registry_file}.tmp"
-            with open(temp_file, "w") as _file:
-                json.dump(data, _file, indent=2)
+            with open(temp_file, "wb") as _file:
+                _file.writelines(self._encode_registry())
 
             os.replace(temp_file, self._registry_file)
         except Exception as e:
             logger.error(f"Failed to save containers to {self._registry_file}: {e}")
             raise e
 
+    def _encode_registry(self) -> Iterator[bytes]:
+        # Encode one container at a time instead of building the whole
+        # document first. The output matches encoding the full mapping with
+        # an indent of 2; JSON strings escape newlines, so every raw newline
+        # is formatting and can be re-indented one level.
+        yield b"{"
+        separator = b"\n"
+        for container_id, container in self._containers.items():
+            entry = _dumps(self._serialize_container(container))
+            yield b"%s  %s: %s" % (
+                separator,
+                _dumps(container_id),
+                entry.replace(b"\n", b"\n  "),
+            )
+            separator = b",\n"
+        yield b"}" if separator == b"\n" else b"\n}"
+
     def _serialize_container(self, container: Container) -> dict:  # type: ignore
         return container.to_dict()
 
@@ -3,11 +3,26 @@
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional
+from typing import Any, Callable, ClassVar, NoReturn, Optional
 
 logger = logging.getLogger(__name__)
 
 
+def _run_child(child_func: Callable[[], Any]) -> NoReturn:
+    """Run the container function in a forked child and exit with its result.
+
+    Args:
+        child_func: Function to call in the child process. An integer return
+            value becomes the exit code; anything else exits with 0.
+    """
+    try:
+        exit_code = child_func()
+        os._exit(exit_code if isinstance(exit_code, int) else 0)
+    except Exception as e:
+        logger.error(f"Error in container process: {e}")
+        os._exit(1)
+
+
 class NamespaceHandler(ABC):
     """Abstract base class for namespace handlers.
 
@@ -16,12 +31,14 @@ class NamespaceHandler(ABC):
     namespace setup logic.
 
     Attributes:
-        None
+        clone_flag: The CLONE_NEW* flag of the namespace the handler creates.
 
     Methods:
         setup: Abstract method to set up the namespace for a container.
     """
 
+    clone_flag: ClassVar[int]
+
     def __init__(self) -> None:
         """Initialize the namespace handler with common attributes."""
         self._child_pid: Optional[int] = None
@@ -52,12 +69,7 @@ class NamespaceHandler(ABC):
         """
         pid = os.fork()
         if pid == 0:
-            try:
-                exit_code = child_func()
-                os._exit(exit_code if isinstance(exit_code, int) else 0)
-            except Exception as e:
-                logger.error(f"Error in container process: {e}")
-                os._exit(1)
+            _run_child(child_func)
         else:
             self._child_pid = pid
         return pid
@@ -68,7 +80,9 @@ class NamespaceHandler(ABC):
         """Fork a process in the new namespace with synchronization.
 
         This version waits for parent to set up UID/GID mappings before
-        the child process continues execution.
+        the child process continues execution. The parent signals by writing
+        a single byte to write_fd; the pipe should be created with
+        os.pipe2(os.O_CLOEXEC) so it cannot leak into the container command.
 
         Args:
             child_func: Function to call in the child process.
@@ -78,19 +92,17 @@ class NamespaceHandler(ABC):
         Returns:
             The PID (in the parent namespace) of the forked child.
         """
+
+        def wait_then_run() -> Any:
+            # Child process: wait for parent signal
+            os.close(write_fd)  # Close write end in child
+            os.read(read_fd, 1)  # Wait for the one-byte go signal
+            os.close(read_fd)  # Close read end after signal
+            return child_func()
+
         pid = os.fork()
         if pid == 0:
-            try:
-                # Child process: wait for parent signal
-                os.close(write_fd)  # Close write end in child
-                os.read(read_fd, 2)  # Wait for "go" signal
-                os.close(read_fd)  # Close read end after signal
-
-                exit_code = child_func()
-                os._exit(exit_code if isinstance(exit_code, int) else 0)
-            except Exception as e:
-                logger.error(f"Error in container process: {e}")
-                os._exit(1)
+            _run_child(wait_then_run)
         else:
             # Parent process
             os.close(read_fd)  # Close read end in parent
@@ -1,6 +1,5 @@
 """Mount namespace handler."""
 
-import ctypes
 import logging
 import os
 from typing import Optional
@@ -8,6 +7,7 @@ from typing import Optional
 from src.constants import CLONE_NEWNS
 from src.namespace.handlers import NamespaceHandler
 from src.utils.security import SecurityError, safe_make_mount_private, safe_mount_proc
+from src.utils.system import check_syscall, load_libc
 
 logger = logging.getLogger(__name__)
 
@@ -16,12 +16,20 @@ class MountNamespaceHandler(NamespaceHandler):
     """Provides a specific implementation for handling Mount namespaces.
 
     This class is designed to manage the setup of a Mount namespace for a container.
+
+    Attributes:
+        propagation_private: Whether mount propagation in the current mount
+            namespace is already private. Set it when the parent namespace is
+            known to be private to skip the remount.
     """
 
+    clone_flag = CLONE_NEWNS
+
     def __init__(self) -> None:
         """Initialize Mount namespace handler."""
         super().__init__()
         self._root_fs: Optional[str] = None
+        self.propagation_private = False
 
     def setup(self) -> None:
         """Sets up a Mount namespace for a container.
@@ -29,14 +37,7 @@ class MountNamespaceHandler(NamespaceHandler):
         This method should be called after the container process has been
         created and before it has been started.
         """
-        from src.utils.system import load_libc
-
-        libc = load_libc()
-
-        result = libc.unshare(CLONE_NEWNS)
-        if result < 0:
-            errno = ctypes.get_errno()
-            raise OSError(errno, f"unshare failed: {os.strerror(errno)}")
+        check_syscall(load_libc().unshare(self.clone_flag), "unshare")
 
         logger.info("Mount namespace setup completed.")
 
@@ -61,8 +62,10 @@ class MountNamespaceHandler(NamespaceHandler):
             raise ValueError("Root filesystem not set.")
 
         try:
-            # Make all mounts private to prevent propagation
-            safe_make_mount_private()
+            # Make all mounts private to prevent propagation, once per namespace
+            if not self.propagation_private:
+                safe_make_mount_private()
+                self.propagation_private = True
 
             # Create minimal proc, sys, dev in container
             self._setup_essential_mounts()
@@ -92,7 +95,12 @@ class MountNamespaceHandler(NamespaceHandler):
         essential_dirs = ["/proc", "/sys", "/dev", "/tmp"]
         for dir_path in essential_dirs:
             container_path = os.path.join(self._root_fs, dir_path.lstrip("/"))
-            os.makedirs(container_path, exist_ok=True)
+            # The root filesystem already exists, so one mkdir suffices; its
+            # EEXIST is cheaper than probing first
+            try:
+                os.mkdir(container_path)
+            except FileExistsError:
+                pass
 
     def _mount_container_essentials(self) -> None:
         """Mount essential filesystems inside container."""
@@ -100,13 +108,14 @@ class MountNamespaceHandler(NamespaceHandler):
             # Mount /proc for process information
             from src.constants import PROC_PATH
 
-            if os.path.exists(PROC_PATH):
-                try:
-                    safe_mount_proc(PROC_PATH)
-                    logger.info("Successfully mounted /proc")
-                except Exception as proc_e:
-                    logger.warning(f"Could not mount /proc: {proc_e}")
-                    # Continue without /proc - not critical for basic operations
+            # /proc was created before the chroot; a missing mount point
+            # surfaces as a mount error below instead of an extra stat
+            try:
+                safe_mount_proc(PROC_PATH)
+                logger.info("Successfully mounted /proc")
+            except Exception as proc_e:
+                logger.warning(f"Could not mount /proc: {proc_e}")
+                # Continue without /proc - not critical for basic operations
 
             logger.info("Essential container filesystem setup completed.")
         except Exception as e:
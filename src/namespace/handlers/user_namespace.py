@@ -1,12 +1,12 @@
 """User namespace handler."""
 
-import ctypes
 import logging
 import os
 from typing import List, Optional, Tuple
 
 from src.constants import CLONE_NEWUSER
 from src.namespace.handlers import NamespaceHandler
+from src.utils.system import check_syscall, load_libc
 
 logger = logging.getLogger(__name__)
 
@@ -15,8 +15,14 @@ class UserNamespaceHandler(NamespaceHandler):
     """Provides a specific implementation for handling User namespaces.
 
     This class is designed to manage the setup of a User namespace for a container.
+
+    Attributes:
+        joined: Whether an existing User namespace was joined instead of a new
+            one being created. Its ID mappings are then already in place.
     """
 
+    clone_flag = CLONE_NEWUSER
+
     def __init__(self) -> None:
         """Initialize User namespace handler."""
         super().__init__()
@@ -24,6 +30,11 @@ class UserNamespaceHandler(NamespaceHandler):
         self._group_id: Optional[int] = None
         self._uid_mappings: List[Tuple[int, int, int]] = []
         self._gid_mappings: List[Tuple[int, int, int]] = []
+        # uid_map/gid_map contents, encoded as mappings are added so the
+        # parent only has to write them while the child waits
+        self._uid_map_data = b""
+        self._gid_map_data = b""
+        self.joined = False
 
     def setup(self) -> None:
         """Apply User namespace isolation.
@@ -38,16 +49,31 @@ class UserNamespaceHandler(NamespaceHandler):
         Returns:
             None
         """
-        from src.utils.system import load_libc
+        check_syscall(load_libc().unshare(self.clone_flag), "unshare")
+
+        logger.info("User namespace setup completed.")
 
-        libc = load_libc()
+    def join(self, pid: int) -> None:
+        """Join the User namespace of an existing process.
 
-        result = libc.unshare(CLONE_NEWUSER)
-        if result < 0:
-            errno = ctypes.get_errno()
-            raise OSError(errno, f"unshare failed: {os.strerror(errno)}")
+        Children created afterwards share that namespace, and its ID mappings,
+        with the process instead of getting a namespace of their own. The
+        calling process must be single-threaded.
 
-        logger.info("User namespace setup completed.")
+        Args:
+            pid: PID of a process in the User namespace to join.
+
+        Raises:
+            OSError: If the namespace cannot be opened or joined.
+        """
+        fd = os.open(f"/proc/{pid}/ns/user", os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            check_syscall(load_libc().setns(fd, self.clone_flag), "setns")
+        finally:
+            os.close(fd)
+
+        self.joined = True
+        logger.info(f"Joined user namespace of process {pid}.")
 
     def set_user(self, user_id: int, group_id: int) -> None:
         """Set the user and group ID for the container.
@@ -62,6 +88,26 @@ class UserNamespaceHandler(NamespaceHandler):
         self._user_id = user_id
         self._group_id = group_id
 
+    def set_uid_mappings(self, mappings: List[Tuple[int, int, int]]) -> None:
+        """Replace the user ID mappings to apply when the container is started.
+
+        Args:
+            mappings: (inside_uid, outside_uid, count) tuples, in the order
+                they should appear in uid_map.
+        """
+        self._uid_mappings = list(mappings)
+        self._uid_map_data = b"".join(_format_mapping(*m) for m in mappings)
+
+    def set_gid_mappings(self, mappings: List[Tuple[int, int, int]]) -> None:
+        """Replace the group ID mappings to apply when the container is started.
+
+        Args:
+            mappings: (inside_gid, outside_gid, count) tuples, in the order
+                they should appear in gid_map.
+        """
+        self._gid_mappings = list(mappings)
+        self._gid_map_data = b"".join(_format_mapping(*m) for m in mappings)
+
     def add_gid_mapping(self, inside_gid: int, outside_gid: int, count: int) -> None:
         """Add a group ID mapping to be applied when the container is started.
 
@@ -71,6 +117,7 @@ class UserNamespaceHandler(NamespaceHandler):
             count: The number of IDs to map.
         """
         self._gid_mappings.append((inside_gid, outside_gid, count))
+        self._gid_map_data += _format_mapping(inside_gid, outside_gid, count)
 
     def add_uid_mapping(self, inside_uid: int, outside_uid: int, count: int) -> None:
         """Add a user ID mapping to be applied when the container is started.
@@ -81,6 +128,7 @@ class UserNamespaceHandler(NamespaceHandler):
             count: The number of IDs to map.
         """
         self._uid_mappings.append((inside_uid, outside_uid, count))
+        self._uid_map_data += _format_mapping(inside_uid, outside_uid, count)
 
     def apply_user_isolation(self) -> None:
         """Apply UID and GID mappings to the child process.
@@ -98,9 +146,14 @@ class UserNamespaceHandler(NamespaceHandler):
             raise ValueError("Child process not created yet")
 
         try:
-            self._disable_setgroups()
-            self._write_uid_mappings()
-            self._write_gid_mappings()
+            # Resolve /proc/<pid> once and open each map file relative to it
+            pid_dir = os.open(f"/proc/{self._child_pid}", os.O_PATH | os.O_DIRECTORY)
+            try:
+                self._disable_setgroups(pid_dir)
+                self._write_uid_mappings(pid_dir)
+                self._write_gid_mappings(pid_dir)
+            finally:
+                os.close(pid_dir)
         except Exception as e:
             logger.error(f"Failed to configure permissions: {e}")
 
@@ -125,19 +178,23 @@ class UserNamespaceHandler(NamespaceHandler):
 
         logger.info(f"Dropped priviledges to UID {self._user_id}, GID {self._group_id}")
 
-    def _disable_setgroups(self) -> None:
-        with open(f"/proc/{self.child_pid}/setgroups", "wb") as _file:
-            _file.write(b"deny")
+    def _disable_setgroups(self, pid_dir: int) -> None:
+        self._write_proc_file(pid_dir, "setgroups", b"deny")
+
+    def _write_uid_mappings(self, pid_dir: int) -> None:
+        self._write_proc_file(pid_dir, "uid_map", self._uid_map_data)
 
-    def _write_uid_mappings(self) -> None:
-        with open(f"/proc/{self._child_pid}/uid_map", "wb") as _file:
-            for inside_uid, outside_uid, count in self._uid_mappings:
-                _file.write(f"{inside_uid} {outside_uid} {count}\n".encode())
+    def _write_gid_mappings(self, pid_dir: int) -> None:
+        self._write_proc_file(pid_dir, "gid_map", self._gid_map_data)
 
-    def _write_gid_mappings(self) -> None:
-        with open(f"/proc/{self._child_pid}/gid_map", "wb") as _file:
-            for inside_gid, outside_gid, count in self._gid_mappings:
-                _file.write(f"{inside_gid} {outside_gid} {count}\n".encode())
+    def _write_proc_file(self, pid_dir: int, name: str, data: bytes) -> None:
+        # The kernel accepts a single write to these files, so every line must
+        # go in one write() call, without a buffered file object in between
+        fd = os.open(name, os.O_WRONLY, dir_fd=pid_dir)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
 
     @property
     def user_id(self) -> Optional[int]:
@@ -156,3 +213,7 @@ class UserNamespaceHandler(NamespaceHandler):
             The group ID or None if not set.
         """
         return self._group_id
+
+
+def _format_mapping(inside: int, outside: int, count: int) -> bytes:
+    return f"{inside} {outside} {count}\n".encode()
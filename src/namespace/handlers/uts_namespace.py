@@ -1,13 +1,12 @@
 """UTS namespace handler."""
 
-import ctypes
 import logging
-import os
 from typing import Optional
 
 from src.constants import CLONE_NEWUTS
 from src.namespace.handlers import NamespaceHandler
 from src.utils.security import SecurityError, safe_set_hostname
+from src.utils.system import check_syscall, load_libc
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +17,8 @@ class UtsNamespaceHandler(NamespaceHandler):
     This class is designed to manage the setup of a UTS namespace for a container.
     """
 
+    clone_flag = CLONE_NEWUTS
+
     def __init__(self) -> None:
         """Initialize UTS namespace handler."""
         super().__init__()
@@ -36,14 +37,7 @@ class UtsNamespaceHandler(NamespaceHandler):
         Returns:
             None
         """
-        from src.utils.system import load_libc
-
-        libc = load_libc()
-
-        result = libc.unshare(CLONE_NEWUTS)
-        if result < 0:
-            errno = ctypes.get_errno()
-            raise OSError(errno, f"unshare failed: {os.strerror(errno)}")
+        check_syscall(load_libc().unshare(self.clone_flag), "unshare")
 
         logger.info("UTS namespace setup completed.")
 
@@ -2,17 +2,84 @@
 
 import logging
 import os
+import select
 import signal
 import time
-from typing import List, Optional, Tuple
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Iterator, List, Optional, Tuple
 
+from src.constants import MINICON_JOIN_USERNS
+from src.namespace.handlers import NamespaceHandler
 from src.namespace.handlers.mount_namespace import MountNamespaceHandler
 from src.namespace.handlers.pid_namespace import PidNamespaceHandler
 from src.namespace.handlers.user_namespace import UserNamespaceHandler
 from src.namespace.handlers.uts_namespace import UtsNamespaceHandler
+from src.utils.system import check_syscall, load_libc, set_cloexec_from
 
 logger = logging.getLogger(__name__)
 
+# Waiting on a pidfd needs Linux 5.4+ and a Python built against it
+_P_PIDFD: Optional[int] = getattr(os, "P_PIDFD", None)
+
+# Grace period between SIGTERM and SIGKILL when terminating a container
+_TERMINATE_TIMEOUT_MS = 5000
+
+# How long to wait for a killed container to exit before giving up on reaping it
+_KILL_TIMEOUT_MS = 1000
+
+
+# Symlink hops allowed while resolving a path, matching the kernel's MAXSYMLINKS
+_MAX_SYMLINKS = 40
+
+
+def _path_in_root(root: str, path: str) -> str:
+    """Map a path inside the container to the host path it will resolve to.
+
+    Symlinks are followed the way they will be after chroot, so absolute
+    targets resolve under root instead of on the host, and ".." never climbs
+    above it.
+
+    Args:
+        root: The container's root filesystem on the host.
+        path: The path as seen from inside the container, relative to "/".
+
+    Returns:
+        The host path under root.
+    """
+    parts = [part for part in path.split("/") if part]
+    parts.reverse()
+    resolved: list[str] = []
+    hops = 0
+    while parts:
+        part = parts.pop()
+        if part == ".":
+            continue
+        if part == "..":
+            if resolved:
+                resolved.pop()
+            continue
+
+        host_path = os.path.join(root, *resolved, part)
+        if not os.path.islink(host_path) or hops >= _MAX_SYMLINKS:
+            resolved.append(part)
+            continue
+
+        hops += 1
+        target = os.readlink(host_path)
+        if target.startswith("/"):
+            resolved = []
+        parts.extend(reversed([p for p in target.split("/") if p]))
+
+    return os.path.join(root, *resolved)
+
+
+def _wait_status(result: os.waitid_result) -> int:
+    # Rebuild the waitpid()-style status that waitid() reports as siginfo
+    if result.si_code == os.CLD_EXITED:
+        return (result.si_status & 0xFF) << 8
+    return result.si_status & 0x7F
+
 
 class NamespaceOrchestrator:
     """A class that orchestrates namespace isolation for containers.
@@ -31,15 +98,18 @@ class NamespaceOrchestrator:
         _command: Command to run in container
         _memory_limit: Memory limit in bytes
         _container_pid: PID of container process
+        _pidfd: Process file descriptor for the container process, if open
+        _cgroup_path: Path of the container's cgroup, once created
         _exit_code: Container exit code
     """
 
     def __init__(self) -> None:
         """Initialize the namespace orchestrator.
 
-        This initializes the namespace handlers for PID, mount, UTS, and user
-        namespaces. It also initializes the container metadata that is
-        associated with the namespace setup.
+        This initializes the container metadata that is associated with the
+        namespace setup. The namespace handlers are created on first use, so
+        an orchestrator that only waits for or terminates a process never
+        builds them.
 
         Args:
             None
@@ -47,19 +117,36 @@ class NamespaceOrchestrator:
         Returns:
             None
         """
-        self._pid_handler = PidNamespaceHandler()
-        self._mount_handler = MountNamespaceHandler()
-        self._uts_handler = UtsNamespaceHandler()
-        self._user_handler = UserNamespaceHandler()
-
         self._root_fs: Optional[str] = None
         self._host_name: Optional[str] = None
         self._command: Optional[list[str]] = None
         self._memory_limit: Optional[int] = None
 
         self._container_pid: Optional[int] = None
+        self._pidfd: Optional[int] = None
+        self._cgroup_path: Optional[str] = None
         self._exit_code: Optional[int] = None
 
+    @cached_property
+    def _pid_handler(self) -> PidNamespaceHandler:
+        """Handler for PID namespace isolation, created on first use."""
+        return PidNamespaceHandler()
+
+    @cached_property
+    def _mount_handler(self) -> MountNamespaceHandler:
+        """Handler for mount namespace isolation, created on first use."""
+        return MountNamespaceHandler()
+
+    @cached_property
+    def _uts_handler(self) -> UtsNamespaceHandler:
+        """Handler for UTS (hostname) namespace isolation, created on first use."""
+        return UtsNamespaceHandler()
+
+    @cached_property
+    def _user_handler(self) -> UserNamespaceHandler:
+        """Handler for user namespace isolation, created on first use."""
+        return UserNamespaceHandler()
+
     def configure(
         self,
         root_fs: str,
@@ -96,11 +183,8 @@ class NamespaceOrchestrator:
         self._mount_handler.set_root_fs(self._root_fs)
         self._uts_handler.set_hostname(self._hostname)
 
-        for inside_uid, outside_uid, count in uid_map:
-            self._user_handler.add_uid_mapping(inside_uid, outside_uid, count)
-
-        for inside_gid, outside_gid, count in gid_map:
-            self._user_handler.add_gid_mapping(inside_gid, outside_gid, count)
+        self._user_handler.set_uid_mappings(uid_map)
+        self._user_handler.set_gid_mappings(gid_map)
 
         if uid_map and gid_map:
             inside_uid, _, _ = uid_map[0]
@@ -108,9 +192,12 @@ class NamespaceOrchestrator:
             self._user_handler.set_user(inside_uid, inside_gid)
 
         logger.info(
-            f"Configured container with root_fs: {self._root_fs}, hostname: "
-            f"{self._hostname}, command: {self._command}, memory_limit: "
-            f"{self._memory_limit}"
+            "Configured container with root_fs: %s, hostname: %s, command: %s, "
+            "memory_limit: %s",
+            self._root_fs,
+            self._hostname,
+            self._command,
+            self._memory_limit,
         )
 
     def set_cgroup_settings(self, memory_limit: int, cpu_shares: int = 1024) -> None:
@@ -131,39 +218,51 @@ class NamespaceOrchestrator:
         self._cpu_shares = cpu_shares
 
         logger.info(
-            f"Set cgroup settings with memory_limit: {self._memory_limit}, "
-            f"cpu_shares: {self._cpu_shares}"
+            "Set cgroup settings with memory_limit: %s, cpu_shares: %s",
+            self._memory_limit,
+            self._cpu_shares,
         )
 
     def setup_namespaces(self) -> None:
         """Set up the namespaces for the container.
 
         This method sets up the necessary namespaces (mount, UTS, PID, user)
-        for the container. It calls the setup method of each namespace handler
-        to perform the necessary setup.
+        for the container. The CLONE_NEW* flags of every handler are combined
+        into a single unshare() call; when the user namespace is included the
+        kernel creates it first and makes it the owner of the others.
 
         Returns:
             None
         """
         logger.info("Setting up namespaces...")
 
-        try:
-            # Skip user namespace setup when running as root
-            # User namespaces are incompatible with elevated privileges
-            if os.getuid() != 0:
+        handlers: list[NamespaceHandler] = []
+        join_pid: Optional[int] = None
+        # Skip user namespace setup when running as root
+        # User namespaces are incompatible with elevated privileges
+        if os.getuid() != 0:
+            join_pid = MINICON_JOIN_USERNS
+            if join_pid is None:
                 logger.info("Setting up user namespace")
-                self._user_handler.setup()
-            else:
-                logger.info("Skipping user namespace setup (running as root)")
+                handlers.append(self._user_handler)
+        else:
+            logger.info("Skipping user namespace setup (running as root)")
+        handlers += [self._mount_handler, self._uts_handler, self._pid_handler]
 
-            self._mount_handler.setup()
-            self._uts_handler.setup()
-            self._pid_handler.setup()
+        flags = 0
+        for handler in handlers:
+            flags |= handler.clone_flag
+
+        try:
+            if join_pid is not None:
+                # Join first so the new namespaces are owned by the shared one
+                self._user_handler.join(join_pid)
+            check_syscall(load_libc().unshare(flags), "unshare")
         except OSError as e:
-            logger.error(f"Failed to setup namespaces: {e}")
+            logger.error("Failed to setup namespaces: %s", e)
             raise RuntimeError(f"Failed to setup namespaces: {e}")
         except Exception as e:
-            logger.error(f"Unexpected error occurred while setting up namespaces: {e}")
+            logger.error("Unexpected error occurred while setting up namespaces: %s", e)
             raise
 
         logger.info("Namespaces setup completed successfully.")
@@ -178,28 +277,37 @@ class NamespaceOrchestrator:
 
         Returns:
             The PID of the created container process.
+
+        Raises:
+            FileNotFoundError: If the command is not found in the container.
+            RuntimeError: If the container process cannot be created.
         """
         if not self._command:
             raise ValueError("Command not set for container. Call configure() first.")
 
+        # Fail before any namespace work if the command cannot be run
+        self._command = self._resolve_command(self._command)
+
         try:
             self.setup_namespaces()
 
             # Pre-create cgroup before process starts
             self._pre_setup_cgroups()
 
-            # Create pipe for parent-child synchronization
-            read_fd, write_fd = os.pipe()
+            # Create pipe for parent-child synchronization; close-on-exec keeps
+            # it out of the container command should the child leave it open
+            read_fd, write_fd = os.pipe2(os.O_CLOEXEC)
 
             # Use synchronized fork to wait for user namespace setup
             self._container_pid = self._pid_handler.fork_in_new_namespace_sync(
                 self._container_entry_point, read_fd, write_fd
             )
-            logger.info(f"Container process created with PID: {self._container_pid}")
+            logger.info("Container process created with PID: %s", self._container_pid)
 
             # Apply user mappings while child waits (only if not running as root)
             if (
                 os.getuid() != 0
+                and not self._user_handler.joined
                 and self._user_handler._uid_mappings
                 and self._user_handler._gid_mappings
             ):
@@ -208,24 +316,70 @@ class NamespaceOrchestrator:
                 self._user_handler.apply_user_isolation()
 
             # Signal child to proceed
-            os.write(write_fd, b"go")
+            os.write(write_fd, b"\x01")
             os.close(write_fd)
 
             # Apply process to pre-created cgroup
             self._apply_process_to_cgroup()
         except Exception as e:
-            logger.error(f"Failed to create container process: {e}")
+            logger.error("Failed to create container process: %s", e)
             raise RuntimeError(f"Failed to create container process: {e}")
 
         if self._container_pid is None:
             raise RuntimeError("Container process creation failed")
         return self._container_pid
 
+    def _reap_after_terminate(self, pidfd: Optional[int]) -> None:
+        try:
+            self._reap(pidfd)
+        except ChildProcessError:
+            logger.info("Container process %s already terminated", self._container_pid)
+            self._exit_code = -1
+
+    def _resolve_command(self, command: list[str]) -> list[str]:
+        """Resolve the command's program against PATH inside the container.
+
+        The lookup is done under the container's root filesystem, the same
+        way execvp would do it after chroot, so the child can exec the path
+        directly. A program containing "/" is not searched for but is checked
+        the same way. Only executable regular files are accepted, and
+        symlinks are followed as they will resolve inside the container.
+
+        Args:
+            command: The container command.
+
+        Returns:
+            The command with its program replaced by the resolved path.
+
+        Raises:
+            FileNotFoundError: If the program is not an executable file in the
+                container.
+        """
+        program = command[0]
+        if "/" in program:
+            if self._is_container_executable(program):
+                return command
+        else:
+            for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+                candidate = os.path.join(directory or ".", program)
+                if self._is_container_executable(candidate):
+                    return [candidate, *command[1:]]
+
+        raise FileNotFoundError(f"Command not found in container: {program}")
+
+    def _is_container_executable(self, path: str) -> bool:
+        # The child runs from "/" after chroot, so relative paths start there
+        host_path = _path_in_root(self._root_fs or "/", path)
+        return os.path.isfile(host_path) and os.access(host_path, os.X_OK)
+
     def wait_for_exit(self) -> int:
         """Wait for the container process to exit.
 
         This method waits for the container process to complete its
-        execution and returns the exit code of the process.
+        execution and returns the exit code of the process. The process is
+        waited on through a pidfd, the one held for it or one opened for the
+        wait, which cannot be confused by PID reuse. Without pidfd support
+        the PID is waited on.
 
         Returns:
             The exit code of the container process.
@@ -233,18 +387,15 @@ class NamespaceOrchestrator:
         if not self._container_pid:
             raise ValueError("Container process not created yet.")
 
-        logger.info(f"Waiting for container process {self._container_pid} to exit...")
+        logger.info("Waiting for container process %s to exit...", self._container_pid)
 
-        _, status = os.waitpid(self._container_pid, 0)
+        with self._wait_pidfd() as pidfd:
+            exit_code = self._reap(pidfd)
 
-        if os.WIFEXITED(status):
-            exit_code = os.WEXITSTATUS(status)
-        else:
-            exit_code = -1
-
-        self._exit_code = exit_code
         logger.info(
-            f"Container process {self._container_pid} exited with exit code {exit_code}"
+            "Container process %s exited with exit code %s",
+            self._container_pid,
+            exit_code,
         )
 
         self.cleanup_resources()
@@ -255,50 +406,54 @@ class NamespaceOrchestrator:
         """Terminate the container process.
 
         This method is responsible for terminating the container process.
-        It sends SIGTERM to the process and waits for it to exit.
+        It sends SIGTERM to the process and waits for it to exit, sending
+        SIGKILL if it is still running after the grace period.
         """
         if not self._container_pid:
             raise ValueError("Container process not created yet.")
 
-        logger.info(f"Terminating container process {self._container_pid}...")
+        logger.info("Terminating container process %s...", self._container_pid)
 
         try:
-            os.kill(self._container_pid, signal.SIGTERM)
-
-            try:
-                _, status = os.waitpid(self._container_pid, os.WNOHANG)
-                if not os.WIFSIGNALED(status) and not os.WIFEXITED(status):
-                    timeout = 5
-                    time.sleep(timeout)
-
-                    _, status = os.waitpid(self._container_pid, os.WNOHANG)
-                    if not os.WIFSIGNALED(status) and not os.WIFEXITED(status):
-                        logger.warning(
-                            f"Container process {self._container_pid} did not "
-                            f"terminate after {timeout} seconds, sending SIGKILL"
-                        )
-                        os.kill(self._container_pid, signal.SIGKILL)
-            except ChildProcessError:
-                logger.info(
-                    f"Container process {self._container_pid} already terminated"
-                )
-                pass
-
-            if os.WIFEXITED(status):
-                self._exit_code = os.WEXITSTATUS(status)
-            else:
-                self._exit_code = -1
+            with self._wait_pidfd() as pidfd:
+                os.kill(self._container_pid, signal.SIGTERM)
+
+                if not self._wait_for_exit_event(pidfd, _TERMINATE_TIMEOUT_MS):
+                    logger.warning(
+                        "Container process %s did not terminate after %s ms, "
+                        "sending SIGKILL",
+                        self._container_pid,
+                        _TERMINATE_TIMEOUT_MS,
+                    )
+                    os.kill(self._container_pid, signal.SIGKILL)
+                    exited = self._wait_for_exit_event(pidfd, _KILL_TIMEOUT_MS)
+                else:
+                    exited = True
+
+                if exited:
+                    self._reap_after_terminate(pidfd)
+                else:
+                    # Reaping would block until the process leaves its
+                    # uninterruptible sleep, which may be never
+                    logger.error(
+                        "Container process %s did not exit %s ms after SIGKILL, "
+                        "leaving it unreaped",
+                        self._container_pid,
+                        _KILL_TIMEOUT_MS,
+                    )
+                    self._exit_code = -1
 
             logger.info(
-                f"Container process {self._container_pid} "
-                f"terminated with exit code {self._exit_code}"
+                "Container process %s terminated with exit code %s",
+                self._container_pid,
+                self._exit_code,
             )
         except ProcessLookupError as e:
             logger.warning(
-                f"Container process {self._container_pid} already terminated: {e}"
+                "Container process %s already terminated: %s", self._container_pid, e
             )
         except Exception as e:
-            logger.error(f"Failed to terminate container process: {e}")
+            logger.error("Failed to terminate container process: %s", e)
 
         self.cleanup_resources()
 
@@ -308,13 +463,138 @@ class NamespaceOrchestrator:
         This method removes the cgroup created for the container
         and resets the internal state.
         """
-        if not self._container_pid and not hasattr(self, "_cgroup_id"):
+        if not self._container_pid and self._cgroup_path is None:
             return
 
-        logger.info(f"Cleaning up resources for container {self._container_pid}")
+        logger.info("Cleaning up resources for container %s", self._container_pid)
         self._cleanup_cgroup()
         self._reset_internal_state()
 
+    @contextmanager
+    def _wait_pidfd(self) -> Iterator[Optional[int]]:
+        """Provide a pidfd for the container process for the length of a wait.
+
+        The pidfd held for the process is reused; otherwise one is opened and
+        closed again afterwards.
+
+        Yields:
+            A pidfd for the process, or None if pidfds are unsupported or the
+            process is gone.
+        """
+        assert self._container_pid is not None
+        if self._pidfd is not None:
+            yield self._pidfd
+            return
+
+        try:
+            pidfd = os.pidfd_open(self._container_pid)
+        except (AttributeError, OSError):
+            # Process is gone or pidfds are unsupported
+            pidfd = None
+
+        if pidfd is None:
+            yield None
+            return
+
+        try:
+            yield pidfd
+        finally:
+            os.close(pidfd)
+
+    def _reap(self, pidfd: Optional[int]) -> int:
+        """Reap the exited container process and return its exit code.
+
+        With a pidfd the process is reaped in one waitid(P_PIDFD) call, which
+        cannot be confused by PID reuse; otherwise the PID is waited on. The
+        status is interpreted by _handle_child_exit either way.
+
+        Args:
+            pidfd: A pidfd for the container process, or None.
+
+        Returns:
+            The exit code of the process.
+
+        Raises:
+            ChildProcessError: If the process is not a child of this process.
+        """
+        assert self._container_pid is not None
+        if pidfd is not None and _P_PIDFD is not None:
+            result = os.waitid(_P_PIDFD, pidfd, os.WEXITED)
+            # Without WNOHANG, waitid only returns once there is a status
+            assert result is not None
+            status = _wait_status(result)
+        else:
+            _, status = os.waitpid(self._container_pid, 0)
+
+        self._handle_child_exit(status)
+        assert self._exit_code is not None
+        return self._exit_code
+
+    def _wait_for_exit_event(self, pidfd: Optional[int], timeout_ms: int) -> bool:
+        """Wait until the container process exits, without reaping it.
+
+        The wait is event-driven: a pidfd becomes readable the moment the
+        process exits. Without a pidfd the wait is for SIGCHLD instead.
+
+        Args:
+            pidfd: A pidfd for the container process, or None.
+            timeout_ms: How long to wait, in milliseconds.
+
+        Returns:
+            True if the process exited within the timeout, False otherwise.
+        """
+        if pidfd is None:
+            return self._wait_for_sigchld(timeout_ms)
+
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        return bool(poller.poll(timeout_ms))
+
+    def _wait_for_sigchld(self, timeout_ms: int) -> bool:
+        """Wait for SIGCHLD until the container process exits or time runs out.
+
+        SIGCHLD is blocked for the wait, so a child exiting between the exit
+        check and sigtimedwait leaves the signal pending instead of losing it.
+
+        Args:
+            timeout_ms: How long to wait, in milliseconds.
+
+        Returns:
+            True if the process exited within the timeout, False otherwise.
+        """
+        deadline = time.monotonic() + timeout_ms / 1000
+        previous_mask = signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGCHLD})
+        try:
+            while not self._has_exited():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if signal.sigtimedwait({signal.SIGCHLD}, remaining) is None:
+                    return self._has_exited()
+            return True
+        finally:
+            signal.pthread_sigmask(signal.SIG_SETMASK, previous_mask)
+
+    def _has_exited(self) -> bool:
+        # WNOWAIT leaves the process to be reaped by the caller
+        assert self._container_pid is not None
+        try:
+            result = os.waitid(
+                os.P_PID, self._container_pid, os.WEXITED | os.WNOHANG | os.WNOWAIT
+            )
+        except ChildProcessError:
+            return True
+        return result is not None
+
+    def close_pidfd(self) -> None:
+        """Close the process file descriptor held for the container, if any."""
+        if self._pidfd is not None:
+            try:
+                os.close(self._pidfd)
+            except OSError:
+                pass
+            self._pidfd = None
+
     def _cleanup_cgroup(self) -> None:
         """Clean up cgroup resources."""
         cgroup_path = self._get_cgroup_path()
@@ -322,37 +602,51 @@ class NamespaceOrchestrator:
             try:
                 self._move_processes_to_root_cgroup(cgroup_path)
                 os.rmdir(cgroup_path)
-                logger.info(f"Removed cgroup {cgroup_path}")
+                logger.info("Removed cgroup %s", cgroup_path)
             except Exception as e:
-                logger.error(f"Error removing cgroup: {e}")
+                logger.error("Error removing cgroup: %s", e)
 
     def _get_cgroup_path(self) -> str:
         """Get the cgroup path for cleanup."""
-        if hasattr(self, "_cgroup_id"):
-            return f"/sys/fs/cgroup/{self._cgroup_id}"
+        if self._cgroup_path is not None:
+            return self._cgroup_path
         else:
+            # Cgroups are created before fork by _pre_setup_cgroups; PID-named
+            # ones are left over from the old post-fork setup
             return f"/sys/fs/cgroup/minicon_{self._container_pid}"
 
     def _move_processes_to_root_cgroup(self, cgroup_path: str) -> None:
         """Move any remaining processes back to root cgroup."""
-        procs_file = f"{cgroup_path}/cgroup.procs"
-        if os.path.exists(procs_file):
-            with open(procs_file, "r") as f:
-                procs = f.read().strip().split("\n")
-
-            if procs and procs[0]:
-                with open("/sys/fs/cgroup/cgroup.procs", "w") as f:
-                    for proc in procs:
-                        try:
-                            f.write(proc)
-                        except Exception:
-                            pass
+        try:
+            fd = os.open(f"{cgroup_path}/cgroup.procs", os.O_RDONLY | os.O_CLOEXEC)
+        except FileNotFoundError:
+            return
+        try:
+            chunks = []
+            while chunk := os.read(fd, 65536):
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+
+        pids = b"".join(chunks).split()
+        if not pids:
+            return
+
+        # cgroup.procs takes exactly one PID per write()
+        root_fd = os.open("/sys/fs/cgroup/cgroup.procs", os.O_WRONLY | os.O_CLOEXEC)
+        try:
+            for pid in pids:
+                try:
+                    os.write(root_fd, pid)
+                except OSError:
+                    pass
+        finally:
+            os.close(root_fd)
 
     def _reset_internal_state(self) -> None:
         """Reset internal state after cleanup."""
         self._container_pid = None
-        if hasattr(self, "_cgroup_id"):
-            delattr(self, "_cgroup_id")
+        self._cgroup_path = None
 
     def _apply_isolation(self) -> None:
         """Apply namespace isolation in the child process.
@@ -364,11 +658,11 @@ class NamespaceOrchestrator:
         logger.info("Applying namespace isolation in container process")
 
         if self._root_fs:
-            logger.info(f"Changing root to {self._root_fs}")
+            logger.info("Changing root to %s", self._root_fs)
             self._mount_handler.apply_mount_isolation()
 
         if self._hostname:
-            logger.info(f"Setting hostname to {self._hostname}")
+            logger.info("Setting hostname to %s", self._hostname)
             self._uts_handler.apply_uts_isolation()
 
         logger.info("Namespace isolation applied successfully")
@@ -384,35 +678,39 @@ class NamespaceOrchestrator:
             logger.info("No memory limit set, skipping cgroup setup")
             return
 
-        # Use a temporary ID for cgroup creation
-        self._cgroup_id = f"minicon_{os.getpid()}_{id(self)}"
-        cgroup_path = f"/sys/fs/cgroup/{self._cgroup_id}"
+        # Use a temporary ID for cgroup creation; the path is kept for the
+        # process assignment and cleanup that follow
+        cgroup_path = f"/sys/fs/cgroup/minicon_{os.getpid()}_{id(self)}"
+        self._cgroup_path = cgroup_path
 
-        logger.info(f"Pre-creating cgroups v2 at {cgroup_path}")
+        logger.info("Pre-creating cgroups v2 at %s", cgroup_path)
 
         try:
-            os.makedirs(cgroup_path, exist_ok=True)
+            # /sys/fs/cgroup always exists, so only the leaf needs creating
+            try:
+                os.mkdir(cgroup_path)
+            except FileExistsError:
+                pass
 
+            # Enabling an already enabled controller succeeds, so there is no
+            # need to read the current controllers first
             parent_controllers_path = "/sys/fs/cgroup/cgroup.subtree_control"
-            with open(parent_controllers_path, "r") as f:
-                current_controllers = f.read()
-
-            if "+memory" not in current_controllers:
-                try:
-                    with open(parent_controllers_path, "w") as f:
-                        f.write("+memory")
-                    logger.info("Enabled memory controller in parent cgroup")
-                except Exception as e:
-                    logger.warning(f"Could not enable memory controller: {e}")
+            try:
+                with open(parent_controllers_path, "w") as f:
+                    f.write("+memory")
+                logger.info("Enabled memory controller in parent cgroup")
+            except Exception as e:
+                logger.warning("Could not enable memory controller: %s", e)
 
-            with open(f"{cgroup_path}/memory.max", "w") as f:
-                f.write(str(self._memory_limit))
+            self._cg_write("memory.max", str(self._memory_limit).encode())
+            # Throttle and reclaim at 90% of the limit before the OOM killer runs
+            self._cg_write("memory.high", str(self._memory_limit * 9 // 10).encode())
 
             logger.info(
-                f"Pre-created cgroup with memory limit {self._memory_limit} bytes"
+                "Pre-created cgroup with memory limit %s bytes", self._memory_limit
             )
         except Exception as e:
-            logger.warning(f"Failed to pre-setup cgroups: {e}")
+            logger.warning("Failed to pre-setup cgroups: %s", e)
             # Don't raise exception - cgroups might not be available in test environment
 
     def _apply_process_to_cgroup(self) -> None:
@@ -420,66 +718,39 @@ class NamespaceOrchestrator:
         if not self._container_pid:
             raise ValueError("Container process not created yet.")
 
-        if not hasattr(self, "_cgroup_id") or not self._memory_limit:
+        if self._cgroup_path is None or not self._memory_limit:
             logger.info("No cgroup pre-created, skipping process assignment")
             return
 
-        cgroup_path = f"/sys/fs/cgroup/{self._cgroup_id}"
-
         try:
-            with open(f"{cgroup_path}/cgroup.procs", "w") as f:
-                f.write(str(self._container_pid))
+            self._cg_write("cgroup.procs", str(self._container_pid).encode())
 
             logger.info(
-                f"Container process {self._container_pid} added to "
-                f"cgroup with memory limit {self._memory_limit} bytes"
+                "Container process %s added to cgroup with memory limit %s bytes",
+                self._container_pid,
+                self._memory_limit,
             )
         except Exception as e:
-            logger.error(f"Failed to apply process to cgroup: {e}")
+            logger.error("Failed to apply process to cgroup: %s", e)
 
-    def _setup_cgroups(self) -> None:
-        """Set up cgroups for the container process.
+    def _cg_write(self, name: str, value: bytes) -> None:
+        """Write a value to a control file of the container's cgroup.
 
-        This method creates the necessary cgroup for the container process
-        and sets memory limits using cgroups v2.
-        """
-        if not self._container_pid:
-            raise ValueError("Container process not created yet.")
+        cgroupfs handles each write() as one complete value, so the file is
+        written with a single raw write instead of through a text-mode file.
 
-        if not self._memory_limit:
-            logger.info("No memory limit set, skipping cgroup setup")
-            return
-
-        logger.info(f"Setting up cgroups v2 for container PID {self._container_pid}")
+        Args:
+            name: Name of the control file, such as memory.max.
+            value: Value to write.
 
-        cgroup_path = f"/sys/fs/cgroup/minicon_{self._container_pid}"
+        Raises:
+            OSError: If the file cannot be opened or written.
+        """
+        fd = os.open(f"{self._cgroup_path}/{name}", os.O_WRONLY | os.O_CLOEXEC)
         try:
-            os.makedirs(cgroup_path, exist_ok=True)
-
-            parent_controllers_path = "/sys/fs/cgroup/cgroup.subtree_control"
-            with open(parent_controllers_path, "r") as f:
-                current_controllers = f.read()
-
-            if "+memory" not in current_controllers:
-                try:
-                    with open(parent_controllers_path, "w") as f:
-                        f.write("+memory")
-                    logger.info("Enabled memory controller in parent cgroup")
-                except Exception as e:
-                    logger.warning(f"Could not enable memory controller: {e}")
-
-            with open(f"{cgroup_path}/memory.max", "w") as f:
-                f.write(str(self._memory_limit))
-
-            with open(f"{cgroup_path}/cgroup.procs", "w") as f:
-                f.write(str(self._container_pid))
-
-            logger.info(
-                f"Container process {self._container_pid} added to "
-                f"cgroup with memory limit {self._memory_limit} bytes"
-            )
-        except Exception as e:
-            logger.error(f"Failed to set up cgroups: {e}")
+            os.write(fd, value)
+        finally:
+            os.close(fd)
 
     def _container_entry_point(self) -> int:
         """Entry point for the container process.
@@ -502,14 +773,16 @@ class NamespaceOrchestrator:
             if os.getuid() != 0 and self._user_handler.user_id is not None:
                 self._user_handler.drop_privileges()
 
-            logger.info(f"Executing container command: {self._command}")
+            logger.info("Executing container command: %s", self._command)
 
-            os.execvp(self._command[0], self._command)
+            # Keep descriptors inherited from the runtime out of the container
+            set_cloexec_from(3)
+            os.execv(self._command[0], self._command)
 
             logger.error("Failed to execute container command")
             return 1
         except Exception as e:
-            logger.error(f"Error in container process: {e}")
+            logger.error("Error in container process: %s", e)
             return 1
 
     def _handle_child_exit(self, status: int) -> None:
@@ -523,11 +796,11 @@ class NamespaceOrchestrator:
         """
         if os.WIFEXITED(status):
             self._exit_code = os.WEXITSTATUS(status)
-            logger.info(f"Container process exited with code {self._exit_code}")
+            logger.info("Container process exited with code %s", self._exit_code)
         elif os.WIFSIGNALED(status):
             signal_num = os.WTERMSIG(status)
             self._exit_code = 128 + signal_num
-            logger.info(f"Container process terminated by signal {signal_num}")
+            logger.info("Container process terminated by signal %s", signal_num)
         else:
             self._exit_code = -1
             logger.warning("Container process exited abnormally")
@@ -2,17 +2,20 @@
 
 import logging
 import os
+import socket
 import subprocess
 from pathlib import Path
 from typing import List
 
 from src.constants import (
-    ALLOWED_CONTAINER_NAME_CHARS,
-    ALLOWED_HOSTNAME_CHARS,
+    ALLOWED_CONTAINER_NAME_PATTERN,
+    ALLOWED_HOSTNAME_PATTERN,
     DANGEROUS_COMMANDS,
     DEFAULT_SAFE_PATH_BASE,
-    MAX_CONTAINER_NAME_LENGTH,
     MAX_HOSTNAME_LENGTH,
+    MS_PRIVATE,
+    MS_REC,
+    PROC_PATH,
 )
 
 logger = logging.getLogger(__name__)
@@ -51,11 +54,11 @@ def validate_container_name(name: str) -> bool:
     Returns:
         True if name is valid, False otherwise
     """
-    if not name or len(name) > MAX_CONTAINER_NAME_LENGTH:
+    if not name:
         return False
 
-    # Allow alphanumeric, hyphens, and underscores only
-    return all(c in ALLOWED_CONTAINER_NAME_CHARS for c in name)
+    # Alphanumeric, hyphens, and underscores only; the pattern also bounds length
+    return ALLOWED_CONTAINER_NAME_PATTERN.fullmatch(name) is not None
 
 
 def validate_command(command: List[str]) -> bool:
@@ -71,7 +74,7 @@ def validate_command(command: List[str]) -> bool:
         return False
 
     # Check for potentially dangerous commands
-    executable = os.path.basename(command[0])
+    executable = command[0].rpartition("/")[2]
     if executable in DANGEROUS_COMMANDS:
         logger.warning(f"Potentially dangerous command blocked: {executable}")
         return False
@@ -100,9 +103,10 @@ def safe_copy_directory(source: str, destination: str) -> None:
         raise SecurityError(f"Unsafe source path: {source}")
 
     try:
-        # Use cp -a to preserve attributes and copy recursively
+        # Use cp -a to preserve attributes and copy recursively, cloning
+        # extents instead of copying data where the filesystem supports it
         subprocess.run(
-            ["cp", "-a", f"{source}/.", destination],
+            ["cp", "-a", "--reflink=auto", f"{source}/.", destination],
             check=True,
             capture_output=True,
             text=True,
@@ -154,24 +158,78 @@ def safe_mount_proc(proc_path: str) -> None:
 
     Raises:
         SecurityError: If path is unsafe
-        subprocess.CalledProcessError: If mount fails
+        OSError: If mount fails
     """
-    from ..constants import PROC_PATH
-
     # Allow /proc path in container context
     if proc_path != PROC_PATH:
         raise SecurityError(f"Invalid proc path (must be {PROC_PATH}): {proc_path}")
 
+    from src.utils.system import mount
+
     try:
-        subprocess.run(
-            ["mount", "-t", "proc", "proc", proc_path],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+        mount("proc", proc_path, "proc")
         logger.info(f"Successfully mounted proc at {proc_path}")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to mount proc: {e.stderr}")
+    except OSError as e:
+        logger.error(f"Failed to mount proc: {e}")
+        raise
+
+
+def safe_mount_overlay(
+    lower_dir: str, upper_dir: str, work_dir: str, merged_dir: str
+) -> None:
+    """Safely mount an overlay filesystem.
+
+    Args:
+        lower_dir: Read-only directory shared by every overlay, such as the
+            base image
+        upper_dir: Writable directory that receives this overlay's changes
+        work_dir: Empty scratch directory on the same filesystem as upper_dir
+        merged_dir: Path where the combined view is mounted
+
+    Raises:
+        SecurityError: If paths are unsafe or would break the mount options
+        OSError: If mount fails
+    """
+    for path in (upper_dir, work_dir, merged_dir):
+        if not is_safe_path(path):
+            raise SecurityError(f"Unsafe overlay path: {path}")
+
+    # Commas and colons separate overlay mount options and lower layers
+    for path in (lower_dir, upper_dir, work_dir):
+        if "," in path or ":" in path:
+            raise SecurityError(f"Invalid characters in overlay path: {path}")
+
+    from src.utils.system import mount
+
+    options = f"lowerdir={lower_dir},upperdir={upper_dir},workdir={work_dir}"
+    try:
+        mount("overlay", merged_dir, "overlay", data=options)
+        logger.info(f"Successfully mounted overlay at {merged_dir}")
+    except OSError as e:
+        logger.error(f"Failed to mount overlay: {e}")
+        raise
+
+
+def safe_umount(path: str) -> None:
+    """Safely unmount a filesystem.
+
+    Args:
+        path: Mount point to unmount
+
+    Raises:
+        SecurityError: If path is unsafe
+        OSError: If umount fails
+    """
+    if not is_safe_path(path):
+        raise SecurityError(f"Unsafe unmount path: {path}")
+
+    from src.utils.system import umount
+
+    try:
+        umount(path)
+        logger.info(f"Successfully unmounted {path}")
+    except OSError as e:
+        logger.error(f"Failed to unmount {path}: {e}")
         raise
 
 
@@ -189,23 +247,12 @@ def safe_set_hostname(hostname: str) -> None:
         raise SecurityError(f"Invalid hostname length: {hostname}")
 
     # Basic hostname validation (RFC compliant)
-    if not all(c in ALLOWED_HOSTNAME_CHARS for c in hostname):
+    if not ALLOWED_HOSTNAME_PATTERN.fullmatch(hostname):
         raise SecurityError(f"Invalid hostname characters: {hostname}")
 
     try:
-        import ctypes
-
-        from .system import load_libc
-
-        libc = load_libc()
-
-        # Use sethostname system call directly
-        hostname_bytes = hostname.encode("utf-8")
-        result = libc.sethostname(hostname_bytes, len(hostname_bytes))
-
-        if result < 0:
-            errno = ctypes.get_errno()
-            raise OSError(errno, f"sethostname failed: {os.strerror(errno)}")
+        # The stdlib wrapper issues sethostname(2) and raises OSError itself
+        socket.sethostname(hostname)
 
         logger.info(f"Successfully set hostname to {hostname}")
     except Exception as e:
@@ -214,16 +261,16 @@ def safe_set_hostname(hostname: str) -> None:
 
 
 def safe_make_mount_private() -> None:
-    """Safely make root mount private.
+    """Safely make the root mount, and every mount beneath it, private.
 
     Raises:
-        subprocess.CalledProcessError: If mount operation fails
+        OSError: If mount operation fails
     """
+    from src.utils.system import mount
+
     try:
-        subprocess.run(
-            ["mount", "--make-private", "/"], check=True, capture_output=True, text=True
-        )
+        mount(None, "/", None, MS_REC | MS_PRIVATE)
         logger.info("Successfully made root mount private")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to make mount private: {e.stderr}")
+    except OSError as e:
+        logger.error(f"Failed to make mount private: {e}")
         raise
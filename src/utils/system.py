@@ -1,17 +1,25 @@
 """System utility functions for MiniCon."""
 
 import ctypes
+import fcntl
 import logging
-from typing import Any
+import os
+import shutil
+from functools import lru_cache
+from typing import Any, Optional
 
-from ..constants import LIBC_PATHS
+from src.constants import CLOSE_RANGE_CLOEXEC, FICLONE, LIBC_PATHS
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def load_libc() -> Any:
     """Load libc library with fallback for different architectures.
 
+    The library is loaded once per process and the handle is shared, since
+    every namespace handler needs it.
+
     Returns:
         ctypes.CDLL: Loaded libc library
 
@@ -22,9 +30,185 @@ def load_libc() -> Any:
         try:
             libc = ctypes.CDLL(path, use_errno=True)
             logger.debug(f"Successfully loaded libc from {path}")
+            _declare_signatures(libc)
             return libc
         except OSError:
             logger.debug(f"Failed to load libc from {path}")
             continue
 
     raise OSError(f"Could not load libc library from any of: {LIBC_PATHS}")
+
+
+def check_syscall(result: int, name: str) -> None:
+    """Raise OSError if a libc call made through ctypes failed.
+
+    Args:
+        result: The call's return value; negative means failure.
+        name: Name of the call, used in the error message.
+
+    Raises:
+        OSError: If result is negative, with the errno the call left behind.
+    """
+    if result < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, f"{name} failed: {os.strerror(errno)}")
+
+
+def _declare_signatures(libc: Any) -> None:
+    # Declared once per handle so ctypes converts arguments without guessing
+    libc.unshare.argtypes = [ctypes.c_int]
+    libc.unshare.restype = ctypes.c_int
+    libc.mount.argtypes = [
+        ctypes.c_char_p,
+        ctypes.c_char_p,
+        ctypes.c_char_p,
+        ctypes.c_ulong,
+        ctypes.c_char_p,
+    ]
+    libc.mount.restype = ctypes.c_int
+    libc.umount2.argtypes = [ctypes.c_char_p, ctypes.c_int]
+    libc.umount2.restype = ctypes.c_int
+    libc.setns.argtypes = [ctypes.c_int, ctypes.c_int]
+    libc.setns.restype = ctypes.c_int
+
+
+def mount(
+    source: Optional[str],
+    target: str,
+    fstype: Optional[str],
+    flags: int = 0,
+    data: Optional[str] = None,
+) -> None:
+    """Mount a filesystem via the libc syscall, without spawning the mount binary.
+
+    Args:
+        source: Device or filesystem source, or None when only changing flags.
+        target: Mount point.
+        fstype: Filesystem type, or None when only changing flags.
+        flags: MS_* mount flags.
+        data: Filesystem-specific options, as passed to mount -o.
+
+    Raises:
+        OSError: If the mount fails.
+    """
+    libc = load_libc()
+    result = libc.mount(
+        source.encode() if source is not None else None,
+        target.encode(),
+        fstype.encode() if fstype is not None else None,
+        flags,
+        data.encode() if data is not None else None,
+    )
+    check_syscall(result, f"mount {target}")
+
+
+def umount(target: str) -> None:
+    """Unmount a filesystem via the libc syscall, without the umount binary.
+
+    Args:
+        target: Mount point to unmount.
+
+    Raises:
+        OSError: If the unmount fails.
+    """
+    libc = load_libc()
+    check_syscall(libc.umount2(target.encode(), 0), f"umount {target}")
+
+
+def set_cloexec_from(low_fd: int) -> None:
+    """Mark every descriptor from low_fd upwards close-on-exec.
+
+    Descriptors stay usable until exec, so logging keeps working if the exec
+    fails, but none of them leak into the executed program. This is a single
+    close_range(2) call on Linux 5.9+; older kernels fall back to flagging each
+    descriptor listed in /proc/self/fd.
+
+    Args:
+        low_fd: The lowest descriptor to mark, usually 3 to keep stdio.
+    """
+    close_range = getattr(load_libc(), "close_range", None)
+    if close_range is not None:
+        if close_range(low_fd, ctypes.c_uint(-1), CLOSE_RANGE_CLOEXEC) == 0:
+            return
+
+    for name in os.listdir("/proc/self/fd"):
+        fd = int(name)
+        if fd >= low_fd:
+            try:
+                os.set_inheritable(fd, False)
+            except OSError:
+                # The descriptor listdir used for /proc/self/fd is gone by now
+                pass
+
+
+def copy_file(source: str, destination: str, mode: Optional[int] = None) -> None:
+    """Copy a file, sharing extents with the source where the filesystem allows.
+
+    The copy is first attempted as a reflink (FICLONE), which is a metadata-only
+    operation on btrfs and XFS. Otherwise the data is copied in the kernel with
+    copy_file_range, then sendfile, and only if neither works does it fall back
+    to shutil.copy2. Permissions and timestamps are preserved in every case.
+
+    Args:
+        source: Path of the file to copy.
+        destination: Path of the file to create or overwrite.
+        mode: Optional permission bits to give the copy instead of the
+            source's.
+
+    Raises:
+        OSError: If the file cannot be copied.
+    """
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        source_fd, destination_fd = src.fileno(), dst.fileno()
+        stat = os.fstat(source_fd)
+        if _copy_in_kernel(source_fd, destination_fd, stat.st_size):
+            # Apply metadata through the open descriptor, not another path lookup
+            os.fchmod(destination_fd, stat.st_mode & 0o7777 if mode is None else mode)
+            os.utime(destination_fd, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            return
+
+    shutil.copy2(source, destination)
+    if mode is not None:
+        os.chmod(destination, mode)
+
+
+def _copy_in_kernel(source_fd: int, destination_fd: int, size: int) -> bool:
+    try:
+        fcntl.ioctl(destination_fd, FICLONE, source_fd)
+        return True
+    except OSError:
+        pass
+    return _copy_file_range(source_fd, destination_fd, size) or _sendfile(
+        source_fd, destination_fd, size
+    )
+
+
+def _copy_file_range(source_fd: int, destination_fd: int, size: int) -> bool:
+    offset = 0
+    try:
+        while offset < size:
+            copied = os.copy_file_range(
+                source_fd, destination_fd, size - offset, offset, offset
+            )
+            if copied == 0:
+                # Some filesystems (procfs, FUSE) report EOF early; the copy is
+                # incomplete, so let the caller try another method
+                return False
+            offset += copied
+    except OSError:
+        # Unsupported across these filesystems; let the caller try another method
+        return False
+    return True
+
+
+def _sendfile(source_fd: int, destination_fd: int, size: int) -> bool:
+    offset = 0
+    try:
+        while offset < size:
+            sent = os.sendfile(destination_fd, source_fd, offset, size - offset)
+            if sent == 0:
+                return False
+            offset += sent
+    except OSError:
+        return False
+    return True
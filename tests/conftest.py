@@ -9,10 +9,31 @@ from src.container.manager import ContainerManager
 from src.container.model import Container
 from src.container.registry import ContainerRegistry
 from src.namespace.orchestrator import NamespaceOrchestrator
+from src.utils.system import load_libc
 
 ONE_HUNDRED_MEGABYTES = 100 * 1024 * 1024
 
 
+@pytest.fixture(autouse=True)
+def reset_resolved_host_files():
+    # The resolved binaries and libraries are cached per process; clear them so
+    # each test resolves against its own (possibly patched) filesystem
+    ContainerManager._resolved_binaries = None
+    ContainerManager._resolved_libraries = None
+    yield
+    ContainerManager._resolved_binaries = None
+    ContainerManager._resolved_libraries = None
+
+
+@pytest.fixture(autouse=True)
+def reset_libc_handle():
+    # load_libc caches its handle; clear it so tests that patch ctypes.CDLL
+    # never see a real libc (or another test's mock)
+    load_libc.cache_clear()
+    yield
+    load_libc.cache_clear()
+
+
 @pytest.fixture
 def sample_container():
     return Container(
@@ -1,15 +1,18 @@
 """Tests for the ContainerManager class."""
 
+import os
 from unittest.mock import patch
 
 import pytest
 
+from src.constants import get_memory_limit
 from src.container.manager import ContainerManager
 from src.container.model import State
+from src.utils.system import copy_file
 
 
 def test_should_create_container_with_unique_id(manager):
-    with patch("uuid.uuid4", return_value="abcdef1234567890"):
+    with patch("secrets.token_hex", return_value="abcdef12"):
         container_id = manager.create("test-container", ["python", "-m", "http.server"])
 
         assert container_id == "abcdef12"
@@ -20,9 +23,31 @@ def test_should_create_container_with_unique_id(manager):
         assert container.state == State.CREATED
 
 
+def test_should_create_base_directories_once_when_initialized(mock_registry_file):
+    with (
+        patch("os.makedirs") as mock_makedirs,
+        patch("src.container.registry.ContainerRegistry._save_to_file"),
+    ):
+        manager = ContainerManager()
+        mock_makedirs.assert_any_call("/var/lib/minicon", exist_ok=True)
+        mock_makedirs.assert_any_call("/var/lib/minicon/rootfs", exist_ok=True)
+        mock_makedirs.reset_mock()
+
+        with (
+            patch("secrets.token_hex", return_value="abcdef12"),
+            patch("os.path.exists", return_value=False),
+            patch.object(manager, "_copy_essential_binaries"),
+        ):
+            manager.create("test-container", ["python", "-m", "http.server"])
+
+        assert all(
+            call.args[0] != "/var/lib/minicon" for call in mock_makedirs.call_args_list
+        )
+
+
 def test_should_prepare_rootfs_during_container_creation(manager):
     with (
-        patch("uuid.uuid4", return_value="abcdef1234567890"),
+        patch("secrets.token_hex", return_value="abcdef12"),
         patch("os.makedirs") as mock_makedirs,
         patch("os.path.exists", return_value=True),
         patch("os.path.isdir", return_value=True),
@@ -39,6 +64,51 @@ def test_should_prepare_rootfs_during_container_creation(manager):
         assert container.root_fs == f"/var/lib/minicon/rootfs/{container_id}"
 
 
+def test_should_mount_overlay_rootfs_when_overlay_driver_enabled(manager):
+    with (
+        patch("secrets.token_hex", return_value="abcdef12"),
+        patch("os.makedirs"),
+        patch("os.path.exists", return_value=True),
+        patch("os.path.isdir", return_value=True),
+        patch("src.container.manager.MINICON_ROOTFS_DRIVER", "overlay"),
+        patch("src.container.manager.safe_mount_overlay") as mock_mount,
+        patch("src.container.manager.safe_copy_directory") as mock_safe_copy,
+    ):
+        container_id = manager.create("test-container", ["python", "-m", "http.server"])
+
+        container_dir = f"/var/lib/minicon/rootfs/{container_id}"
+        mock_mount.assert_called_once_with(
+            "/var/lib/minicon/base",
+            f"{container_dir}/upper",
+            f"{container_dir}/work",
+            f"{container_dir}/merged",
+        )
+        mock_safe_copy.assert_not_called()
+
+        container = manager.registry.get_container(container_id)
+        assert container.root_fs == f"{container_dir}/merged"
+
+
+def test_should_copy_base_image_when_overlay_mount_fails(manager):
+    with (
+        patch("secrets.token_hex", return_value="abcdef12"),
+        patch("os.makedirs"),
+        patch("os.path.exists", return_value=True),
+        patch("os.path.isdir", return_value=True),
+        patch("src.container.manager.MINICON_ROOTFS_DRIVER", "overlay"),
+        patch(
+            "src.container.manager.safe_mount_overlay",
+            side_effect=OSError("overlay unsupported"),
+        ),
+        patch("src.container.manager.safe_copy_directory") as mock_safe_copy,
+    ):
+        container_id = manager.create("test-container", ["python", "-m", "http.server"])
+
+        mock_safe_copy.assert_called_once_with(
+            "/var/lib/minicon/base", f"/var/lib/minicon/rootfs/{container_id}"
+        )
+
+
 def test_should_start_container_when_in_created_state(manager, mock_orchestrator):
     with (
         patch("threading.Thread"),
@@ -91,6 +161,46 @@ def test_should_stop_running_container(manager, mock_orchestrator):
     assert container.state == State.EXITED
 
 
+def test_should_unmount_overlay_rootfs_when_stopping_container(
+    manager, mock_orchestrator
+):
+    container_id = "def456"
+    manager.registry.get_container(container_id).state = State.RUNNING
+    manager._orchestrators[container_id] = mock_orchestrator
+
+    with (
+        patch("os.path.ismount", return_value=True),
+        patch("src.container.manager.safe_umount") as mock_umount,
+    ):
+        manager.stop(container_id)
+
+    mock_umount.assert_called_once_with("/var/lib/minicon/rootfs/def456")
+
+
+def test_should_remount_overlay_rootfs_missing_after_reboot(manager):
+    root_fs = "/var/lib/minicon/rootfs/abc123/merged"
+
+    with (
+        patch("os.path.ismount", return_value=False),
+        patch("src.container.manager.safe_mount_overlay") as mock_mount,
+    ):
+        manager._restore_overlay_root_fs(root_fs)
+
+    mock_mount.assert_called_once_with(
+        "/var/lib/minicon/base",
+        "/var/lib/minicon/rootfs/abc123/upper",
+        "/var/lib/minicon/rootfs/abc123/work",
+        root_fs,
+    )
+
+
+def test_should_not_remount_copied_rootfs(manager):
+    with patch("src.container.manager.safe_mount_overlay") as mock_mount:
+        manager._restore_overlay_root_fs("/var/lib/minicon/rootfs/abc123")
+
+    mock_mount.assert_not_called()
+
+
 def test_should_fail_to_stop_nonexistent_container(manager):
     with pytest.raises(ValueError, match="Container nonexistent not found"):
         manager.stop("nonexistent")
@@ -115,6 +225,20 @@ def test_should_remove_exited_container(manager):
     assert manager.registry.get_container(container_id) is None
 
 
+def test_should_unmount_overlay_rootfs_when_removing_container(manager):
+    container_id = "abc123"
+    manager.registry.update_container_state(container_id, State.EXITED)
+
+    with (
+        patch("os.path.ismount", return_value=True),
+        patch("src.container.manager.safe_umount") as mock_umount,
+    ):
+        manager.remove(container_id)
+
+    mock_umount.assert_called_once_with("/var/lib/minicon/rootfs/abc123")
+    assert manager.registry.get_container(container_id) is None
+
+
 def test_should_fail_to_remove_running_container(manager):
     container_id = "def456"
     container = manager.registry.get_container(container_id)
@@ -127,7 +251,7 @@ def test_should_fail_to_remove_running_container(manager):
 
 
 def test_should_list_all_containers(manager):
-    containers = manager.list()
+    containers = list(manager.list())
 
     assert len(containers) == 2
     assert any(c.id == "abc123" for c in containers)
@@ -138,8 +262,8 @@ def test_should_list_containers_filtered_by_state(manager):
     manager.registry.update_container_state("abc123", State.EXITED)
     manager.registry.update_container_state("def456", State.RUNNING)
 
-    running_containers = manager.list(State.RUNNING)
-    exited_containers = manager.list(State.EXITED)
+    running_containers = list(manager.list(State.RUNNING))
+    exited_containers = list(manager.list(State.EXITED))
 
     assert len(running_containers) == 1
     assert running_containers[0].id == "def456"
@@ -201,3 +325,232 @@ def test_should_not_recover_container_when_process_not_running(mock_registry_fil
 
         running_containers = manager.registry.get_all_containers(State.RUNNING)
         assert len(running_containers) == 0
+
+
+def test_should_report_whether_any_containers_exist(manager):
+    assert manager.has_any()
+    assert manager.has_any(State.CREATED)
+
+    manager.registry.remove_container("abc123")
+    assert not manager.has_any(State.CREATED)
+
+
+def test_should_apply_memory_limit_from_environment(manager):
+    get_memory_limit.cache_clear()
+    try:
+        with (
+            patch.dict("os.environ", {"MINICON_MEMORY_LIMIT": "1048576"}),
+            patch("secrets.token_hex", return_value="abcdef12"),
+        ):
+            container_id = manager.create("test-container", ["echo", "hello"])
+    finally:
+        get_memory_limit.cache_clear()
+
+    container = manager.registry.get_container(container_id)
+    assert container.memory_limit == 1048576
+
+
+def test_should_recover_container_with_pidfd_when_supported(mock_registry_file):
+    with (
+        patch("os.pidfd_open", return_value=99) as mock_pidfd_open,
+        patch("os.kill") as mock_kill,
+        patch("threading.Thread"),
+        patch("os.makedirs"),
+        patch("os.path.exists", return_value=True),
+        patch("src.container.registry.ContainerRegistry._save_to_file"),
+    ):
+        manager = ContainerManager()
+
+    mock_pidfd_open.assert_called_once_with(67890)
+    mock_kill.assert_not_called()
+    assert manager._orchestrators["def456"]._pidfd == 99
+
+
+def test_should_watch_started_container_with_exit_monitor(manager, mock_orchestrator):
+    with (
+        patch("os.pidfd_open", return_value=99),
+        patch("threading.Thread") as mock_thread,
+        patch.object(manager._exit_monitor, "watch") as mock_watch,
+        patch.object(manager, "_orchestrator_class", return_value=mock_orchestrator),
+    ):
+        manager.start("abc123")
+
+    mock_watch.assert_called_once_with("abc123", 99)
+    mock_thread.assert_not_called()
+
+
+def test_should_mark_dead_containers_exited_in_one_batch(mock_registry_file):
+    with (
+        patch("os.pidfd_open", side_effect=ProcessLookupError()),
+        patch("os.kill", side_effect=OSError()),
+        patch("os.makedirs"),
+        patch("os.path.exists", return_value=True),
+        patch(
+            "src.container.registry.ContainerRegistry.update_many_states"
+        ) as mock_update_many,
+        patch("src.container.registry.ContainerRegistry._save_to_file"),
+    ):
+        ContainerManager()
+
+    mock_update_many.assert_called_once_with(["def456"], State.EXITED)
+
+
+def test_should_copy_binaries_concurrently_with_executable_mode(tmp_path):
+    manager = ContainerManager.__new__(ContainerManager)
+    source = tmp_path / "sh"
+    source.write_bytes(b"#!/bin/sh\n")
+    root_fs = tmp_path / "rootfs"
+    (root_fs / "bin").mkdir(parents=True)
+
+    with (
+        patch("src.container.manager.ESSENTIAL_BINARY_PATHS", [(str(source),)]),
+        patch("src.container.manager.ESSENTIAL_SYSTEM_LIBS", []),
+        patch("src.container.manager.CONTAINER_LIB_DIRS", []),
+    ):
+        manager._copy_essential_binaries(str(root_fs))
+
+    copied = root_fs / "bin" / "sh"
+    assert copied.read_bytes() == b"#!/bin/sh\n"
+    assert copied.stat().st_mode & 0o777 == 0o755
+
+
+def test_should_copy_binaries_and_libraries_in_one_batch(tmp_path):
+    manager = ContainerManager.__new__(ContainerManager)
+    binary = tmp_path / "sh"
+    binary.write_bytes(b"#!/bin/sh\n")
+    library = tmp_path / "libc.so.6"
+    library.write_bytes(b"\x7fELF")
+    root_fs = tmp_path / "rootfs"
+    (root_fs / "bin").mkdir(parents=True)
+
+    with (
+        patch("src.container.manager.ESSENTIAL_BINARY_PATHS", [(str(binary),)]),
+        patch(
+            "src.container.manager.ESSENTIAL_SYSTEM_LIBS",
+            [(str(library), "lib/libc.so.6")],
+        ),
+        patch("src.container.manager.CONTAINER_LIB_DIRS", ["lib"]),
+        patch.object(manager, "_copy_files") as mock_copy_files,
+    ):
+        manager._copy_essential_binaries(str(root_fs))
+
+    mock_copy_files.assert_called_once_with(
+        {
+            str(root_fs / "lib" / "libc.so.6"): ((str(library),), None),
+            str(root_fs / "bin" / "sh"): ((str(binary),), 0o755),
+        }
+    )
+
+
+def test_should_resolve_host_binaries_once(tmp_path):
+    binary = tmp_path / "sh"
+    binary.write_bytes(b"#!/bin/sh\n")
+
+    with (
+        patch(
+            "src.container.manager.ESSENTIAL_BINARY_PATHS",
+            [(str(tmp_path / "missing"), str(binary))],
+        ),
+        patch("os.path.exists", wraps=os.path.exists) as mock_exists,
+    ):
+        first = ContainerManager._resolve_binaries()
+        calls = mock_exists.call_count
+        second = ContainerManager._resolve_binaries()
+
+        assert mock_exists.call_count == calls
+
+    assert first == (((str(binary),), "sh"),)
+    assert second is first
+
+
+def test_should_fall_back_to_next_binary_candidate_when_copy_fails(tmp_path):
+    manager = ContainerManager.__new__(ContainerManager)
+    broken = tmp_path / "broken" / "sh"
+    broken.parent.mkdir()
+    broken.write_bytes(b"broken")
+    working = tmp_path / "working" / "sh"
+    working.parent.mkdir()
+    working.write_bytes(b"#!/bin/sh\n")
+    root_fs = tmp_path / "rootfs"
+    (root_fs / "bin").mkdir(parents=True)
+
+    real_copy_file = copy_file
+
+    def failing_copy(src_path, dest_path, mode):
+        if src_path == str(broken):
+            raise OSError("read error")
+        real_copy_file(src_path, dest_path, mode)
+
+    with (
+        patch(
+            "src.container.manager.ESSENTIAL_BINARY_PATHS",
+            [(str(broken), str(working))],
+        ),
+        patch("src.container.manager.ESSENTIAL_SYSTEM_LIBS", []),
+        patch("src.container.manager.CONTAINER_LIB_DIRS", []),
+        patch("src.container.manager.copy_file", side_effect=failing_copy),
+    ):
+        manager._copy_essential_binaries(str(root_fs))
+
+    assert (root_fs / "bin" / "sh").read_bytes() == b"#!/bin/sh\n"
+
+
+def test_should_generate_eight_hex_character_container_ids(manager):
+    container_id = manager.create("test-container", ["echo", "hello"])
+
+    assert len(container_id) == 8
+    assert all(char in "0123456789abcdef" for char in container_id)
+
+
+def test_should_write_hosts_file_without_overwriting_existing_one(tmp_path):
+    manager = ContainerManager.__new__(ContainerManager)
+    rootfs_dir = tmp_path / "rootfs"
+
+    with (
+        patch("src.container.manager.MINICON_BASE_DIR", str(tmp_path)),
+        patch("src.container.manager.MINICON_ROOTFS_DIR", str(rootfs_dir)),
+        patch("src.container.manager.MINICON_BASE_IMAGE", str(tmp_path / "base")),
+        patch.object(manager, "_copy_essential_binaries"),
+    ):
+        manager._prepare_root_fs("abc123")
+        hosts_file = rootfs_dir / "abc123" / "etc" / "hosts"
+        assert hosts_file.read_bytes() == b"127.0.0.1 localhost\n127.0.0.1 abc123\n"
+
+        hosts_file.write_bytes(b"custom\n")
+        manager._prepare_root_fs("abc123")
+
+    assert hosts_file.read_bytes() == b"custom\n"
+
+
+def test_should_skip_recovery_when_no_containers_are_running(mock_registry_file):
+    with (
+        patch("os.makedirs"),
+        patch("os.path.exists", return_value=True),
+        patch(
+            "src.container.registry.ContainerRegistry.has_containers",
+            return_value=False,
+        ),
+        patch(
+            "src.container.registry.ContainerRegistry.get_all_containers"
+        ) as mock_get_all,
+        patch("src.container.registry.ContainerRegistry._save_to_file"),
+    ):
+        ContainerManager()
+
+    mock_get_all.assert_not_called()
+
+
+def test_should_map_cached_credentials_to_container_root(manager, mock_orchestrator):
+    with (
+        patch("threading.Thread"),
+        patch("os.getuid") as mock_getuid,
+        patch.object(ContainerManager, "_UID", 1000),
+        patch.object(ContainerManager, "_GID", 1001),
+        patch.object(manager, "_orchestrator_class", return_value=mock_orchestrator),
+    ):
+        manager.start("abc123")
+
+    mock_getuid.assert_not_called()
+    _, kwargs = mock_orchestrator.configure.call_args
+    assert kwargs["uid_map"] == [(0, 1000, 1)]
+    assert kwargs["gid_map"] == [(0, 1001, 1)]
@@ -2,6 +2,8 @@
 
 from datetime import datetime
 
+import pytest
+
 from src.container.model import Container, State
 
 
@@ -23,6 +25,20 @@ def test_should_initialize_with_correct_defaults():
     assert container.exited_at is None
 
 
+def test_should_stamp_each_container_with_its_own_creation_time():
+    before = datetime.now()
+    container = Container(
+        name="test-container",
+        id="abc123",
+        command=["python", "-m", "http.server"],
+        root_fs="/var/lib/minicon/rootfs/abc123",
+        hostname="test-container",
+        memory_limit=100 * 1024 * 1024,
+    )
+
+    assert before <= container.created_at <= datetime.now()
+
+
 def test_should_convert_to_dict_when_serializing(sample_container):
     container_dict = sample_container.to_dict()
 
@@ -81,3 +97,81 @@ def test_should_transition_states_when_container_lifecycle_progresses(sample_con
     sample_container.exited_at = datetime.now()
     assert sample_container.state == State.EXITED
     assert sample_container.exit_code == 0
+
+
+def test_should_truncate_display_command_when_more_than_three_arguments(
+    sample_container,
+):
+    assert sample_container.display_command == "python -m http.server"
+
+    sample_container.command = ["echo", "a", "b", "c", "d"]
+    assert sample_container.display_command == "echo a b..."
+
+
+def test_should_not_have_instance_dict(sample_container):
+    assert not hasattr(sample_container, "__dict__")
+
+
+def test_should_serialize_every_field_when_converting_to_dict(sample_container):
+    sample_container.state = State.EXITED
+    sample_container.started_at = datetime(2023, 1, 1, 12, 1)
+
+    container_dict = sample_container.to_dict()
+
+    assert list(container_dict) == [
+        "name",
+        "id",
+        "command",
+        "root_fs",
+        "hostname",
+        "memory_limit",
+        "process_id",
+        "state",
+        "exit_code",
+        "created_at",
+        "started_at",
+        "exited_at",
+    ]
+    assert container_dict["state"] == "exited"
+    assert container_dict["started_at"] == "2023-01-01T12:01:00"
+    assert container_dict["exited_at"] is None
+    assert Container.from_dict(container_dict) == sample_container
+
+
+def test_should_list_dataclass_fields_in_field_names(sample_container):
+    assert Container.FIELD_NAMES == set(sample_container.to_dict())
+    assert "display_command" not in Container.FIELD_NAMES
+
+
+def test_should_ignore_unknown_keys_when_deserializing(sample_container):
+    container_dict = sample_container.to_dict()
+    container_dict["added_in_a_later_version"] = True
+    del container_dict["exit_code"]
+
+    container = Container.from_dict(container_dict)
+
+    assert container.id == sample_container.id
+    assert container.exit_code == 0
+
+    sample_container.update_from_dict({"state": "exited", "unknown": 1})
+    assert sample_container.state == State.EXITED
+
+
+def test_should_accept_datetime_values_when_deserializing(sample_container):
+    created_at = datetime(2024, 1, 1, 12, 0, 0)
+    container_dict = sample_container.to_dict()
+    container_dict["created_at"] = created_at
+    container_dict["state"] = State.RUNNING
+
+    container = Container.from_dict(container_dict)
+
+    assert container.created_at == created_at
+    assert container.state == State.RUNNING
+
+
+def test_should_raise_value_error_when_state_is_invalid(sample_container):
+    container_dict = sample_container.to_dict()
+    container_dict["state"] = "paused"
+
+    with pytest.raises(ValueError, match="Invalid state: 'paused'"):
+        Container.from_dict(container_dict)
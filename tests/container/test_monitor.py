@@ -0,0 +1,50 @@
+"""Tests for the ExitMonitor class."""
+
+import os
+import subprocess
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.container.monitor import ExitMonitor
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "pidfd_open"), reason="pidfd_open is not available"
+)
+
+
+def test_should_report_exit_of_watched_process():
+    exited = threading.Event()
+    reported = []
+
+    def on_exit(container_id):
+        reported.append(container_id)
+        exited.set()
+
+    monitor = ExitMonitor(on_exit)
+    process = subprocess.Popen(["sleep", "0.1"])
+    pidfd = os.pidfd_open(process.pid)
+    try:
+        monitor.watch("abc123", pidfd)
+
+        assert exited.wait(timeout=5)
+        assert reported == ["abc123"]
+        assert monitor._watched == {}
+    finally:
+        process.wait()
+        os.close(pidfd)
+
+
+def test_should_start_a_single_reactor_thread():
+    monitor = ExitMonitor(lambda container_id: None)
+    read_fd, write_fd = os.pipe()
+    try:
+        with patch("threading.Thread") as mock_thread:
+            monitor.watch("abc123", read_fd)
+            monitor.watch("def456", write_fd)
+
+        mock_thread.assert_called_once()
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
@@ -1,10 +1,16 @@
 """Tests for the ContainerRegistry."""
 
+import json
+import mmap
+import os
 from datetime import datetime
 from unittest.mock import mock_open, patch
 
+import pytest
+
+from src.container import registry as registry_module
 from src.container.model import Container, State
-from src.container.registry import ContainerRegistry
+from src.container.registry import ContainerRegistry, _read_registry
 
 
 def test_should_create_empty_registry_when_no_file_exists():
@@ -103,3 +109,336 @@ def test_should_return_false_when_removing_nonexistent_container(registry):
         result = registry.remove_container("nonexistent")
 
         assert result is False
+
+
+def test_should_report_whether_containers_exist_by_state(registry):
+    assert registry.has_containers()
+    assert registry.has_containers(State.RUNNING)
+    assert not registry.has_containers(State.EXITED)
+
+
+def test_should_iterate_containers_filtered_by_state(registry):
+    containers = registry.iter_containers(State.RUNNING)
+
+    assert not isinstance(containers, list)
+    assert [container.id for container in containers] == ["def456"]
+
+
+def test_should_round_trip_registry_without_orjson(tmp_path):
+    registry_file = str(tmp_path / "containers.json")
+    container = Container(
+        id="ghi789",
+        name="new-container",
+        command=["echo", "hello"],
+        root_fs="/var/lib/minicon/rootfs/ghi789",
+        hostname="new-container",
+        memory_limit=1024 * 1024 * 50,
+    )
+
+    with patch("src.container.registry.orjson", None):
+        ContainerRegistry(registry_file=registry_file).save_container(container)
+        loaded = ContainerRegistry(registry_file=registry_file)
+
+    assert loaded.get_container("ghi789") == container
+    assert ContainerRegistry(registry_file=registry_file).get_container("ghi789")
+
+
+@pytest.mark.skipif(registry_module.orjson is None, reason="orjson not installed")
+def test_should_parse_mapped_registry_file_when_orjson_available(tmp_path):
+    registry_file = tmp_path / "containers.json"
+    registry_file.write_text(json.dumps({"abc123": {"name": "test"}}))
+
+    with patch("src.container.registry.mmap.mmap", wraps=mmap.mmap) as mock_mmap:
+        data = _read_registry(str(registry_file))
+
+    mock_mmap.assert_called_once()
+    assert data == {"abc123": {"name": "test"}}
+
+
+def test_should_read_registry_file_when_it_cannot_be_mapped(tmp_path):
+    registry_file = tmp_path / "containers.json"
+    registry_file.write_text("{}")
+
+    with patch("src.container.registry.mmap.mmap", side_effect=ValueError):
+        assert _read_registry(str(registry_file)) == {}
+
+
+def test_should_reuse_parsed_registry_when_file_is_unchanged(tmp_path):
+    registry_file = str(tmp_path / "containers.json")
+    container = Container(
+        id="ghi789",
+        name="new-container",
+        command=["echo", "hello"],
+        root_fs="/var/lib/minicon/rootfs/ghi789",
+        hostname="new-container",
+        memory_limit=1024 * 1024 * 50,
+    )
+    ContainerRegistry(registry_file=registry_file).save_container(container)
+    ContainerRegistry(registry_file=registry_file)
+
+    with patch("src.container.registry._read_registry") as mock_read:
+        registry = ContainerRegistry(registry_file=registry_file)
+
+    mock_read.assert_not_called()
+    assert registry.get_container("ghi789") == container
+
+    registry.update_container_state("ghi789", State.RUNNING)
+
+    assert (
+        ContainerRegistry(registry_file=registry_file).get_container("ghi789").state
+        == State.RUNNING
+    )
+
+
+def test_should_reparse_registry_replaced_within_same_mtime_and_size(tmp_path):
+    registry_file = tmp_path / "containers.json"
+    entry = {
+        "name": "c",
+        "id": "abc123",
+        "command": ["sh"],
+        "root_fs": "/r",
+        "hostname": "c",
+        "memory_limit": 1,
+        "exit_code": 0,
+    }
+    registry_file.write_text(json.dumps({"abc123": entry}))
+    stat = os.stat(registry_file)
+    ContainerRegistry(registry_file=str(registry_file))
+
+    replacement = tmp_path / "containers.json.tmp"
+    replacement.write_text(json.dumps({"abc123": {**entry, "exit_code": 1}}))
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(replacement, registry_file)
+
+    registry = ContainerRegistry(registry_file=str(registry_file))
+
+    assert registry.get_container("abc123").exit_code == 1
+
+
+def test_should_not_share_command_lists_between_registries(tmp_path):
+    registry_file = str(tmp_path / "containers.json")
+    container = Container(
+        id="ghi789",
+        name="new-container",
+        command=["echo", "hello"],
+        root_fs="/var/lib/minicon/rootfs/ghi789",
+        hostname="new-container",
+        memory_limit=1024 * 1024 * 50,
+    )
+    ContainerRegistry(registry_file=registry_file).save_container(container)
+
+    first = ContainerRegistry(registry_file=registry_file).get_container("ghi789")
+    first.command.append("mutated")
+    second = ContainerRegistry(registry_file=registry_file).get_container("ghi789")
+
+    assert second.command == ["echo", "hello"]
+
+
+def test_should_update_many_states_with_single_save(registry):
+    with patch.object(registry, "_save_to_file") as mock_save:
+        updated = registry.update_many_states(
+            ["abc123", "def456", "nonexistent"], State.EXITED
+        )
+
+    assert updated == 2
+    assert registry.get_container("abc123").state == State.EXITED
+    assert registry.get_container("def456").exited_at is not None
+    mock_save.assert_called_once()
+
+
+def test_should_batch_writes_when_used_as_context_manager(registry):
+    with patch.object(registry, "_save_to_file") as mock_save:
+        with registry:
+            registry.update_container_state("abc123", State.RUNNING)
+            registry.update_container_state("abc123", State.EXITED, exit_code=1)
+            registry.remove_container("def456")
+            mock_save.assert_not_called()
+
+        mock_save.assert_called_once()
+
+        registry.update_container_state("abc123", State.RUNNING)
+        assert mock_save.call_count == 2
+
+
+def test_should_flush_only_when_outermost_batch_exits(registry):
+    with patch.object(registry, "_save_to_file") as mock_save:
+        with registry:
+            with registry:
+                registry.update_container_state("abc123", State.RUNNING)
+
+            registry.remove_container("def456")
+            mock_save.assert_not_called()
+
+        mock_save.assert_called_once()
+
+        registry.update_container_state("abc123", State.EXITED)
+        assert mock_save.call_count == 2
+
+
+def test_should_defer_writes_until_flush_when_autoflush_disabled(
+    mock_registry_file,
+):
+    registry = ContainerRegistry(registry_file="test_containers.json", autoflush=False)
+
+    with patch.object(registry, "_save_to_file") as mock_save:
+        registry.flush()
+        mock_save.assert_not_called()
+
+        registry.update_container_state("abc123", State.EXITED)
+        registry.remove_container("def456")
+        mock_save.assert_not_called()
+
+        registry.flush()
+        registry.flush()
+
+    mock_save.assert_called_once()
+
+
+def test_should_not_share_loaded_containers_between_registries(tmp_path):
+    registry_file = str(tmp_path / "containers.json")
+    container = Container(
+        id="ghi789",
+        name="new-container",
+        command=["echo", "hello"],
+        root_fs="/var/lib/minicon/rootfs/ghi789",
+        hostname="new-container",
+        memory_limit=1024 * 1024 * 50,
+    )
+    ContainerRegistry(registry_file=registry_file).save_container(container)
+
+    first = ContainerRegistry(registry_file=registry_file)
+    first.get_container("ghi789").command.append("mutated")
+
+    second = ContainerRegistry(registry_file=registry_file)
+    assert second.get_container("ghi789").command == ["echo", "hello"]
+
+
+def test_should_create_registry_directory_only_once(tmp_path):
+    registry_file = str(tmp_path / "nested" / "containers.json")
+    registry = ContainerRegistry(registry_file=registry_file)
+    container = Container(
+        id="ghi789",
+        name="new-container",
+        command=["echo", "hello"],
+        root_fs="/var/lib/minicon/rootfs/ghi789",
+        hostname="new-container",
+        memory_limit=1024 * 1024 * 50,
+    )
+
+    with patch("os.makedirs", wraps=os.makedirs) as mock_makedirs:
+        registry.save_container(container)
+        registry.update_container_state("ghi789", State.RUNNING)
+
+    mock_makedirs.assert_called_once_with(str(tmp_path / "nested"), exist_ok=True)
+    assert ContainerRegistry(registry_file=registry_file).get_container("ghi789")
+
+
+def test_should_refresh_existing_containers_in_place_when_reloading(tmp_path):
+    registry_file = str(tmp_path / "containers.json")
+    registry = ContainerRegistry(registry_file=registry_file)
+    for container_id in ("ghi789", "jkl012"):
+        registry.save_container(
+            Container(
+                id=container_id,
+                name="new-container",
+                command=["echo", "hello"],
+                root_fs=f"/var/lib/minicon/rootfs/{container_id}",
+                hostname="new-container",
+                memory_limit=1024 * 1024 * 50,
+            )
+        )
+    container = registry.get_container("ghi789")
+
+    other = ContainerRegistry(registry_file=registry_file)
+    other.update_container_state("ghi789", State.EXITED, exit_code=3)
+    other.remove_container("jkl012")
+
+    registry.load_containers()
+
+    assert registry.get_container("ghi789") is container
+    assert container.state == State.EXITED
+    assert container.exit_code == 3
+    assert isinstance(container.exited_at, datetime)
+    assert registry.get_container("jkl012") is None
+
+
+def test_should_leave_registry_unchanged_when_reload_fails(tmp_path):
+    registry_file = str(tmp_path / "containers.json")
+    registry = ContainerRegistry(registry_file=registry_file)
+    for container_id in ("ghi789", "jkl012"):
+        registry.save_container(
+            Container(
+                id=container_id,
+                name="new-container",
+                command=["echo", "hello"],
+                root_fs=f"/var/lib/minicon/rootfs/{container_id}",
+                hostname="new-container",
+                memory_limit=1024 * 1024 * 50,
+            )
+        )
+    container = registry.get_container("ghi789")
+
+    with open(registry_file) as _file:
+        data = json.load(_file)
+    data["ghi789"]["state"] = "exited"
+    data["jkl012"]["state"] = "paused"
+    with open(registry_file, "w") as _file:
+        json.dump(data, _file)
+
+    registry.load_containers()
+
+    assert registry.get_container("ghi789") is container
+    assert container.state == State.CREATED
+    assert registry.get_container("jkl012").state == State.CREATED
+
+
+def test_should_track_containers_by_state_across_updates(registry):
+    with patch.object(registry, "_save_to_file"):
+        assert [c.id for c in registry.get_by_state(State.CREATED)] == ["abc123"]
+        assert [c.id for c in registry.get_by_state(State.RUNNING)] == ["def456"]
+
+        registry.update_container_state("abc123", State.RUNNING)
+        registry.update_many_states(["def456"], State.EXITED)
+
+        assert registry.get_by_state(State.CREATED) == []
+        assert [c.id for c in registry.get_by_state(State.RUNNING)] == ["abc123"]
+        assert [c.id for c in registry.iter_containers(State.EXITED)] == ["def456"]
+
+        registry.remove_container("def456")
+
+        assert not registry.has_containers(State.EXITED)
+        assert registry.has_containers(State.RUNNING)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_should_write_same_document_as_encoding_whole_registry(tmp_path, use_orjson):
+    registry_file = tmp_path / "containers.json"
+    orjson = registry_module.orjson if use_orjson else None
+    if use_orjson and orjson is None:
+        pytest.skip("orjson not installed")
+
+    with patch("src.container.registry.orjson", orjson):
+        registry = ContainerRegistry(registry_file=str(registry_file))
+        registry._save_to_file()
+        assert registry_file.read_bytes() == registry_module._dumps({})
+
+        for container_id in ("ghi789", "jkl012"):
+            registry.save_container(
+                Container(
+                    id=container_id,
+                    name="new-container",
+                    command=["echo", "hello\nworld"],
+                    root_fs=f"/var/lib/minicon/rootfs/{container_id}",
+                    hostname="new-container",
+                    memory_limit=1024 * 1024 * 50,
+                )
+            )
+
+        expected = registry_module._dumps(
+            {
+                container_id: container.to_dict()
+                for container_id, container in registry._containers.items()
+            }
+        )
+
+    assert registry_file.read_bytes() == expected
@@ -123,14 +123,11 @@ def test_should_reject_unsafe_paths_in_operations(mock_subprocess):
         safe_mount_proc("../../proc")
 
 
-@patch("src.utils.system.load_libc")
-def test_should_handle_subprocess_failures_properly(mock_load_libc):
+@patch("src.utils.security.socket.sethostname")
+def test_should_handle_subprocess_failures_properly(mock_sethostname):
     from src.utils.security import safe_set_hostname
 
-    mock_libc = Mock()
-    mock_libc.sethostname.return_value = -1
-    mock_load_libc.return_value = mock_libc
+    mock_sethostname.side_effect = PermissionError(1, "Operation not permitted")
 
-    with patch("ctypes.get_errno", return_value=1):
-        with pytest.raises(OSError):
-            safe_set_hostname("test-host")
+    with pytest.raises(OSError):
+        safe_set_hostname("test-host")
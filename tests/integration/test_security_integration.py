@@ -282,11 +282,9 @@ def test_should_propagate_security_errors_during_creation(mock_safe_copy):
 @patch("src.namespace.handlers.mount_namespace.safe_mount_proc")
 @patch("src.namespace.handlers.mount_namespace.os.chroot")
 @patch("src.namespace.handlers.mount_namespace.os.chdir")
-@patch("src.namespace.handlers.mount_namespace.os.path.exists")
-@patch("src.namespace.handlers.mount_namespace.os.makedirs")
+@patch("src.namespace.handlers.mount_namespace.os.mkdir")
 def test_should_use_secure_functions_for_mount_namespace(
-    mock_makedirs,
-    mock_exists,
+    mock_mkdir,
     mock_chdir,
     mock_chroot,
     mock_safe_mount,
@@ -296,7 +294,6 @@ def test_should_use_secure_functions_for_mount_namespace(
 
     handler = MountNamespaceHandler()
     handler.set_root_fs("/test/rootfs")
-    mock_exists.return_value = True  # /proc exists after chroot
 
     handler.apply_mount_isolation()
 
@@ -305,7 +302,7 @@ def test_should_use_secure_functions_for_mount_namespace(
     mock_chroot.assert_called_once_with("/test/rootfs")
     mock_chdir.assert_called_once_with("/")
     # Should create essential mount points before chroot
-    assert mock_makedirs.call_count >= 1
+    assert mock_mkdir.call_count >= 1
 
 
 @patch("src.namespace.handlers.uts_namespace.safe_set_hostname")
@@ -13,7 +13,8 @@ from src.utils.security import (
 )
 
 
-def test_should_validate_container_names_when_using_manager():
+@patch("src.container.manager.os.makedirs")
+def test_should_validate_container_names_when_using_manager(mock_makedirs):
     temp_dir = tempfile.mkdtemp()
 
     try:
@@ -82,7 +83,8 @@ def test_should_validate_container_names_when_using_manager():
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-def test_should_validate_commands_when_using_manager():
+@patch("src.container.manager.os.makedirs")
+def test_should_validate_commands_when_using_manager(mock_makedirs):
     temp_dir = tempfile.mkdtemp()
 
     try:
@@ -159,7 +161,8 @@ def test_should_validate_commands_when_using_manager():
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-def test_should_prevent_path_traversal_when_using_filesystem():
+@patch("src.container.manager.os.makedirs")
+def test_should_prevent_path_traversal_when_using_filesystem(mock_makedirs):
     temp_dir = tempfile.mkdtemp()
 
     try:
@@ -278,7 +281,8 @@ def test_should_complete_workflow_when_dependencies_mocked(mock_thread_class):
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-def test_should_handle_security_errors_properly():
+@patch("src.container.manager.os.makedirs")
+def test_should_handle_security_errors_properly(mock_makedirs):
     temp_dir = tempfile.mkdtemp()
 
     try:
@@ -306,7 +310,8 @@ def test_should_handle_security_errors_properly():
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-def test_should_validate_multiple_layers_together():
+@patch("src.container.manager.os.makedirs")
+def test_should_validate_multiple_layers_together(mock_makedirs):
     manager = ContainerManager()
 
     with pytest.raises(ValueError, match="Invalid container name"):
@@ -91,10 +91,7 @@ def test_should_apply_mount_isolation_correctly():
         ) as mock_safe_mount,
         patch("src.namespace.handlers.mount_namespace.os.chroot") as mock_chroot,
         patch("src.namespace.handlers.mount_namespace.os.chdir") as mock_chdir,
-        patch(
-            "src.namespace.handlers.mount_namespace.os.path.exists", return_value=True
-        ),
-        patch("src.namespace.handlers.mount_namespace.os.makedirs") as mock_makedirs,
+        patch("src.namespace.handlers.mount_namespace.os.mkdir") as mock_mkdir,
     ):
 
         handler.apply_mount_isolation()
@@ -104,7 +101,7 @@ def test_should_apply_mount_isolation_correctly():
         mock_chroot.assert_called_once_with(test_root_fs)
         mock_chdir.assert_called_once_with("/")
         # Should create essential directories before chroot
-        assert mock_makedirs.call_count >= 1
+        assert mock_mkdir.call_count >= 1
 
 
 def test_should_not_create_proc_if_already_exists():
@@ -122,9 +119,9 @@ def test_should_not_create_proc_if_already_exists():
         patch("src.namespace.handlers.mount_namespace.os.chroot") as mock_chroot,
         patch("src.namespace.handlers.mount_namespace.os.chdir") as mock_chdir,
         patch(
-            "src.namespace.handlers.mount_namespace.os.path.exists", return_value=True
-        ),
-        patch("src.namespace.handlers.mount_namespace.os.makedirs") as mock_makedirs,
+            "src.namespace.handlers.mount_namespace.os.mkdir",
+            side_effect=FileExistsError,
+        ) as mock_mkdir,
     ):
 
         handler.apply_mount_isolation()
@@ -134,4 +131,30 @@ def test_should_not_create_proc_if_already_exists():
         mock_chroot.assert_called_once_with(test_root_fs)
         mock_chdir.assert_called_once_with("/")
         # Should create essential directories before chroot
-        assert mock_makedirs.call_count >= 1
+        assert mock_mkdir.call_count >= 1
+
+
+def test_should_make_mounts_private_only_once():
+    handler = MountNamespaceHandler()
+    handler.set_root_fs("/var/lib/minicon/rootfs/test123")
+
+    with (
+        patch(
+            "src.namespace.handlers.mount_namespace.safe_make_mount_private"
+        ) as mock_safe_private,
+        patch("src.namespace.handlers.mount_namespace.safe_mount_proc"),
+        patch("src.namespace.handlers.mount_namespace.os.chroot"),
+        patch("src.namespace.handlers.mount_namespace.os.chdir"),
+        patch("src.namespace.handlers.mount_namespace.os.mkdir"),
+    ):
+        handler.apply_mount_isolation()
+        handler.apply_mount_isolation()
+
+        mock_safe_private.assert_called_once()
+
+        already_private = MountNamespaceHandler()
+        already_private.set_root_fs("/var/lib/minicon/rootfs/test123")
+        already_private.propagation_private = True
+        already_private.apply_mount_isolation()
+
+        mock_safe_private.assert_called_once()
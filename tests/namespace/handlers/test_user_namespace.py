@@ -49,6 +49,28 @@ def test_should_add_gid_mapping():
     assert len(handler._gid_mappings) == 1
 
 
+def test_should_encode_mappings_when_added():
+    handler = UserNamespaceHandler()
+    handler.add_uid_mapping(0, 1000, 1)
+    handler.add_uid_mapping(1, 100000, 65536)
+    handler.add_gid_mapping(0, 1000, 1)
+
+    assert handler._uid_map_data == b"0 1000 1\n1 100000 65536\n"
+    assert handler._gid_map_data == b"0 1000 1\n"
+
+
+def test_should_replace_mappings_in_one_call():
+    handler = UserNamespaceHandler()
+    handler.add_uid_mapping(5, 5, 1)
+
+    handler.set_uid_mappings([(0, 1000, 1), (1, 100000, 65536)])
+    handler.set_gid_mappings([(0, 1000, 1)])
+
+    assert handler._uid_mappings == [(0, 1000, 1), (1, 100000, 65536)]
+    assert handler._uid_map_data == b"0 1000 1\n1 100000 65536\n"
+    assert handler._gid_map_data == b"0 1000 1\n"
+
+
 def test_should_raise_error_when_applying_user_isolation_without_mappings():
     handler = UserNamespaceHandler()
 
@@ -97,3 +119,64 @@ def test_should_run_child_function_with_isolation():
 
         mock_setregid.assert_called_once_with(1000, 1000)
         mock_setreuid.assert_called_once_with(1000, 1000)
+
+
+def test_should_write_each_mapping_file_in_a_single_write():
+    handler = UserNamespaceHandler()
+    handler.add_uid_mapping(0, 1000, 1)
+    handler.add_uid_mapping(1, 100000, 65536)
+    handler.add_gid_mapping(0, 1000, 1)
+    handler._child_pid = 1234
+
+    with (
+        patch("os.open", side_effect=[9, 10, 11, 12]) as mock_open,
+        patch("os.write") as mock_write,
+        patch("os.close") as mock_close,
+    ):
+        handler.apply_user_isolation()
+
+    assert [c.args[0] for c in mock_open.call_args_list] == [
+        "/proc/1234",
+        "setgroups",
+        "uid_map",
+        "gid_map",
+    ]
+    assert all(c.kwargs["dir_fd"] == 9 for c in mock_open.call_args_list[1:])
+    assert mock_close.call_args_list[-1].args == (9,)
+    assert [c.args for c in mock_write.call_args_list] == [
+        (10, b"deny"),
+        (11, b"0 1000 1\n1 100000 65536\n"),
+        (12, b"0 1000 1\n"),
+    ]
+
+
+def test_should_join_user_namespace_of_existing_process(mock_libc_unshare):
+    handler = UserNamespaceHandler()
+    mock_libc_unshare.setns.return_value = 0
+
+    with (
+        patch("os.open", return_value=10) as mock_open,
+        patch("os.close") as mock_close,
+    ):
+        handler.join(4321)
+
+    assert mock_open.call_args.args[0] == "/proc/4321/ns/user"
+    mock_libc_unshare.setns.assert_called_once_with(10, 0x10000000)
+    mock_close.assert_called_once_with(10)
+    assert handler.joined
+
+
+def test_should_close_namespace_fd_when_setns_fails(mock_libc_unshare):
+    handler = UserNamespaceHandler()
+    mock_libc_unshare.setns.return_value = -1
+
+    with (
+        patch("os.open", return_value=10),
+        patch("os.close") as mock_close,
+        patch("ctypes.get_errno", return_value=1),
+        pytest.raises(OSError, match="setns failed"),
+    ):
+        handler.join(4321)
+
+    mock_close.assert_called_once_with(10)
+    assert not handler.joined
@@ -2,10 +2,13 @@
 
 import os
 import signal
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.constants import CLONE_NEWNS, CLONE_NEWPID, CLONE_NEWUSER, CLONE_NEWUTS
+
 
 def test_should_configure_handlers_correctly(orchestrator):
     root_fs = "/var/lib/minicon/rootfs/test"
@@ -30,21 +33,52 @@ def test_should_configure_handlers_correctly(orchestrator):
     assert (0, 1000, 1) in orchestrator._user_handler._gid_mappings
 
 
-def test_should_setup_all_namespaces(configured_orchestrator):
+def test_should_setup_all_namespaces(configured_orchestrator, mock_libc_unshare):
+    with patch("os.getuid", return_value=1000):
+        configured_orchestrator.setup_namespaces()
+
+    mock_libc_unshare.unshare.assert_called_once_with(
+        CLONE_NEWUSER | CLONE_NEWNS | CLONE_NEWUTS | CLONE_NEWPID
+    )
+
+
+def test_should_skip_user_namespace_when_running_as_root(
+    configured_orchestrator, mock_libc_unshare
+):
+    with patch("os.getuid", return_value=0):
+        configured_orchestrator.setup_namespaces()
+
+    mock_libc_unshare.unshare.assert_called_once_with(
+        CLONE_NEWNS | CLONE_NEWUTS | CLONE_NEWPID
+    )
+
+
+def test_should_join_shared_user_namespace_when_configured(
+    configured_orchestrator, mock_libc_unshare
+):
     with (
-        patch.object(configured_orchestrator._user_handler, "setup") as mock_user_setup,
-        patch.object(
-            configured_orchestrator._mount_handler, "setup"
-        ) as mock_mount_setup,
-        patch.object(configured_orchestrator._uts_handler, "setup") as mock_uts_setup,
-        patch.object(configured_orchestrator._pid_handler, "setup") as mock_pid_setup,
+        patch("os.getuid", return_value=1000),
+        patch("src.namespace.orchestrator.MINICON_JOIN_USERNS", 4321),
+        patch.object(configured_orchestrator._user_handler, "join") as mock_join,
     ):
         configured_orchestrator.setup_namespaces()
 
-        mock_user_setup.assert_called_once()
-        mock_mount_setup.assert_called_once()
-        mock_uts_setup.assert_called_once()
-        mock_pid_setup.assert_called_once()
+    mock_join.assert_called_once_with(4321)
+    mock_libc_unshare.unshare.assert_called_once_with(
+        CLONE_NEWNS | CLONE_NEWUTS | CLONE_NEWPID
+    )
+
+
+def test_should_raise_runtime_error_when_unshare_fails(
+    configured_orchestrator, mock_libc_unshare
+):
+    mock_libc_unshare.unshare.return_value = -1
+
+    with (
+        patch("ctypes.get_errno", return_value=1),
+        pytest.raises(RuntimeError, match="Failed to setup namespaces"),
+    ):
+        configured_orchestrator.setup_namespaces()
 
 
 def test_should_create_container_process_with_proper_isolation(configured_orchestrator):
@@ -61,8 +95,13 @@ def test_should_create_container_process_with_proper_isolation(configured_orches
         patch.object(
             configured_orchestrator, "_apply_process_to_cgroup"
         ) as mock_apply_process_to_cgroup,
-        patch("os.pipe", return_value=(3, 4)),
-        patch("os.write"),
+        patch.object(
+            configured_orchestrator,
+            "_resolve_command",
+            return_value=["/usr/bin/python", "-m", "http.server"],
+        ),
+        patch("os.pipe2", return_value=(3, 4)) as mock_pipe2,
+        patch("os.write") as mock_write,
         patch("os.close"),
     ):
         mock_fork_sync.return_value = 12345
@@ -74,6 +113,8 @@ def test_should_create_container_process_with_proper_isolation(configured_orches
         mock_fork_sync.assert_called_once_with(
             configured_orchestrator._container_entry_point, 3, 4
         )
+        mock_pipe2.assert_called_once_with(os.O_CLOEXEC)
+        mock_write.assert_called_once_with(4, b"\x01")
         mock_pre_setup_cgroups.assert_called_once()
         mock_apply_process_to_cgroup.assert_called_once()
 
@@ -98,19 +139,22 @@ def test_should_execute_command_in_container_entry_point(configured_orchestrator
         patch.object(
             configured_orchestrator, "_apply_isolation"
         ) as mock_apply_isolation,
-        patch("os.execvp") as mock_execvp,
+        patch("os.execv") as mock_execv,
+        patch("src.namespace.orchestrator.set_cloexec_from") as mock_cloexec,
         patch.object(configured_orchestrator._user_handler, "drop_privileges"),
     ):
         configured_orchestrator._container_entry_point()
 
         mock_apply_isolation.assert_called_once()
-        mock_execvp.assert_called_once_with("python", ["python", "-m", "http.server"])
+        mock_cloexec.assert_called_once_with(3)
+        mock_execv.assert_called_once_with("python", ["python", "-m", "http.server"])
 
 
 def test_should_handle_container_lifecycle(configured_orchestrator):
     configured_orchestrator._container_pid = 12345
 
     with (
+        patch("os.pidfd_open", side_effect=ProcessLookupError),
         patch("os.waitpid") as mock_waitpid,
         patch.object(os, "WIFEXITED", return_value=True),
         patch.object(os, "WEXITSTATUS", return_value=0),
@@ -127,10 +171,14 @@ def test_should_handle_container_lifecycle(configured_orchestrator):
     configured_orchestrator._container_pid = 12345
 
     with (
+        patch("os.pidfd_open", side_effect=ProcessLookupError),
         patch("os.kill") as mock_kill,
         patch("os.waitpid") as mock_waitpid,
         patch.object(os, "WIFEXITED", return_value=True),
         patch.object(os, "WEXITSTATUS", return_value=0),
+        patch.object(
+            configured_orchestrator, "_wait_for_exit_event", return_value=True
+        ),
         patch.object(configured_orchestrator, "cleanup_resources") as mock_cleanup,
     ):
         mock_waitpid.return_value = (12345, 0)
@@ -138,9 +186,53 @@ def test_should_handle_container_lifecycle(configured_orchestrator):
         configured_orchestrator.terminate()
 
         mock_kill.assert_called_once_with(12345, signal.SIGTERM)
+        mock_waitpid.assert_called_once_with(12345, 0)
         mock_cleanup.assert_called_once()
 
 
+def test_should_kill_container_when_it_ignores_sigterm(configured_orchestrator):
+    configured_orchestrator._container_pid = 12345
+
+    with (
+        patch("os.pidfd_open", side_effect=ProcessLookupError),
+        patch("os.kill") as mock_kill,
+        patch("os.waitpid", return_value=(12345, signal.SIGKILL)),
+        patch.object(
+            configured_orchestrator, "_wait_for_exit_event", side_effect=[False, True]
+        ) as mock_wait,
+        patch.object(configured_orchestrator, "cleanup_resources"),
+    ):
+        configured_orchestrator.terminate()
+
+    assert [c.args for c in mock_wait.call_args_list] == [(None, 5000), (None, 1000)]
+    assert [c.args for c in mock_kill.call_args_list] == [
+        (12345, signal.SIGTERM),
+        (12345, signal.SIGKILL),
+    ]
+    assert configured_orchestrator._exit_code == 128 + signal.SIGKILL
+
+
+def test_should_not_block_when_killed_container_does_not_exit(
+    configured_orchestrator,
+):
+    configured_orchestrator._container_pid = 12345
+
+    with (
+        patch("os.pidfd_open", side_effect=ProcessLookupError),
+        patch("os.kill"),
+        patch("os.waitpid") as mock_waitpid,
+        patch.object(
+            configured_orchestrator, "_wait_for_exit_event", return_value=False
+        ),
+        patch.object(configured_orchestrator, "cleanup_resources") as mock_cleanup,
+    ):
+        configured_orchestrator.terminate()
+
+    mock_waitpid.assert_not_called()
+    mock_cleanup.assert_called_once()
+    assert configured_orchestrator._exit_code == -1
+
+
 def test_should_cleanup_resources(configured_orchestrator):
     configured_orchestrator._container_pid = 12345
     cgroup_path = f"/sys/fs/cgroup/minicon_{12345}"
@@ -156,6 +248,169 @@ def test_should_cleanup_resources(configured_orchestrator):
         assert configured_orchestrator._container_pid is None
 
 
+def test_should_reuse_cgroup_path_from_pre_setup(configured_orchestrator):
+    with (
+        patch("os.mkdir"),
+        patch("builtins.open", MagicMock()),
+        patch.object(configured_orchestrator, "_cg_write"),
+    ):
+        configured_orchestrator._pre_setup_cgroups()
+    cgroup_path = configured_orchestrator._cgroup_path
+    assert cgroup_path.startswith(f"/sys/fs/cgroup/minicon_{os.getpid()}_")
+
+    configured_orchestrator._container_pid = 12345
+    with (
+        patch("os.open", return_value=7) as mock_open,
+        patch("os.write") as mock_write,
+        patch("os.close"),
+    ):
+        configured_orchestrator._apply_process_to_cgroup()
+    assert mock_open.call_args.args[0] == f"{cgroup_path}/cgroup.procs"
+    mock_write.assert_called_once_with(7, b"12345")
+
+    with (
+        patch("os.path.exists", return_value=True),
+        patch("builtins.open", MagicMock()),
+        patch("os.rmdir") as mock_rmdir,
+    ):
+        configured_orchestrator.cleanup_resources()
+
+    mock_rmdir.assert_called_once_with(cgroup_path)
+    assert configured_orchestrator._cgroup_path is None
+
+
+def test_should_enable_memory_controller_without_reading_it_first(
+    configured_orchestrator,
+):
+    with (
+        patch("os.mkdir"),
+        patch("builtins.open", MagicMock()) as mock_open,
+        patch.object(configured_orchestrator, "_cg_write"),
+    ):
+        configured_orchestrator._pre_setup_cgroups()
+
+    mock_open.assert_called_once_with("/sys/fs/cgroup/cgroup.subtree_control", "w")
+
+
+def test_should_set_memory_high_below_memory_max(configured_orchestrator):
+    configured_orchestrator._memory_limit = 100 * 1024 * 1024
+
+    with (
+        patch("os.mkdir"),
+        patch("builtins.open", MagicMock()),
+        patch("os.open", side_effect=[7, 8]) as mock_open,
+        patch("os.write") as mock_write,
+        patch("os.close"),
+    ):
+        configured_orchestrator._pre_setup_cgroups()
+
+    cgroup_path = configured_orchestrator._cgroup_path
+    assert [c.args[0] for c in mock_open.call_args_list] == [
+        f"{cgroup_path}/memory.max",
+        f"{cgroup_path}/memory.high",
+    ]
+    assert [c.args for c in mock_write.call_args_list] == [
+        (7, b"104857600"),
+        (8, b"94371840"),
+    ]
+
+
+def test_should_reuse_existing_cgroup_directory(configured_orchestrator):
+    with (
+        patch("os.mkdir", side_effect=FileExistsError) as mock_mkdir,
+        patch("builtins.open", MagicMock()),
+        patch.object(configured_orchestrator, "_cg_write") as mock_cg_write,
+    ):
+        configured_orchestrator._pre_setup_cgroups()
+
+    mock_mkdir.assert_called_once_with(configured_orchestrator._cgroup_path)
+    assert mock_cg_write.call_count == 2
+
+
+def test_should_create_handlers_only_when_used(orchestrator):
+    assert "_user_handler" not in vars(orchestrator)
+
+    handler = orchestrator._user_handler
+
+    assert orchestrator._user_handler is handler
+    assert "_pid_handler" not in vars(orchestrator)
+
+
+def test_should_move_each_remaining_process_to_root_cgroup(orchestrator):
+    with (
+        patch("os.open", side_effect=[7, 8]) as mock_open,
+        patch("os.read", side_effect=[b"101\n102\n", b""]),
+        patch("os.write") as mock_write,
+        patch("os.close") as mock_close,
+    ):
+        orchestrator._move_processes_to_root_cgroup("/sys/fs/cgroup/minicon_1")
+
+    assert [c.args[0] for c in mock_open.call_args_list] == [
+        "/sys/fs/cgroup/minicon_1/cgroup.procs",
+        "/sys/fs/cgroup/cgroup.procs",
+    ]
+    assert [c.args for c in mock_write.call_args_list] == [(8, b"101"), (8, b"102")]
+    assert [c.args for c in mock_close.call_args_list] == [(7,), (8,)]
+
+
+def test_should_resolve_command_inside_container_root(orchestrator, tmp_path):
+    (tmp_path / "bin").mkdir()
+    (tmp_path / "bin" / "busybox").write_text("")
+    (tmp_path / "bin" / "busybox").chmod(0o755)
+    (tmp_path / "bin" / "sh").symlink_to("/bin/busybox")
+    orchestrator._root_fs = str(tmp_path)
+
+    with patch.dict(os.environ, {"PATH": "/usr/bin:/bin"}):
+        command = orchestrator._resolve_command(["sh", "-c", "true"])
+
+    assert command == ["/bin/sh", "-c", "true"]
+
+
+def test_should_skip_entries_that_are_not_executable_files(orchestrator, tmp_path):
+    (tmp_path / "usr" / "bin" / "sh").mkdir(parents=True)
+    (tmp_path / "bin").mkdir()
+    (tmp_path / "bin" / "sh").write_text("")
+    (tmp_path / "bin" / "sh").chmod(0o644)
+    (tmp_path / "sbin").mkdir()
+    (tmp_path / "sbin" / "sh").write_text("")
+    (tmp_path / "sbin" / "sh").chmod(0o755)
+    orchestrator._root_fs = str(tmp_path)
+
+    with patch.dict(os.environ, {"PATH": "/usr/bin:/bin:/sbin"}):
+        command = orchestrator._resolve_command(["sh"])
+
+    assert command == ["/sbin/sh"]
+
+
+def test_should_validate_explicit_command_paths(orchestrator, tmp_path):
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "run").write_text("")
+    (tmp_path / "app" / "run").chmod(0o755)
+    (tmp_path / "app" / "data").write_text("")
+    (tmp_path / "app" / "data").chmod(0o644)
+    orchestrator._root_fs = str(tmp_path)
+
+    assert orchestrator._resolve_command(["/app/run", "-v"]) == ["/app/run", "-v"]
+    assert orchestrator._resolve_command(["app/run"]) == ["app/run"]
+
+    for program in ("/app/missing", "/app/data", "/app"):
+        with pytest.raises(FileNotFoundError, match=program):
+            orchestrator._resolve_command([program])
+
+
+def test_should_fail_before_fork_when_command_missing(orchestrator, tmp_path):
+    orchestrator._root_fs = str(tmp_path)
+    orchestrator._command = ["missing-binary"]
+
+    with (
+        patch.object(orchestrator, "setup_namespaces") as mock_setup_namespaces,
+        pytest.raises(FileNotFoundError, match="missing-binary"),
+    ):
+        orchestrator.create_container_process()
+
+    mock_setup_namespaces.assert_not_called()
+
+
 def test_should_validate_container_command(orchestrator):
     with pytest.raises(ValueError, match="Command not set for container"):
         orchestrator.create_container_process()
@@ -163,3 +418,137 @@ def test_should_validate_container_command(orchestrator):
     orchestrator._command = None
     with pytest.raises(ValueError, match="Command not set for container"):
         orchestrator._container_entry_point()
+
+
+def test_should_close_pidfd_once(orchestrator):
+    orchestrator._pidfd = 99
+
+    with patch("os.close") as mock_close:
+        orchestrator.close_pidfd()
+        orchestrator.close_pidfd()
+
+    mock_close.assert_called_once_with(99)
+    assert orchestrator._pidfd is None
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "pidfd_open") or not hasattr(os, "P_PIDFD"),
+    reason="pidfd waits are not supported on this platform",
+)
+def test_should_wait_for_exit_on_pidfd_when_open(orchestrator):
+    pid = os.fork()
+    if pid == 0:
+        os._exit(3)
+
+    orchestrator._container_pid = pid
+    orchestrator._pidfd = os.pidfd_open(pid)
+
+    try:
+        with (
+            patch("os.waitpid") as mock_waitpid,
+            patch.object(orchestrator, "cleanup_resources"),
+        ):
+            exit_code = orchestrator.wait_for_exit()
+    finally:
+        orchestrator.close_pidfd()
+
+    assert exit_code == 3
+    mock_waitpid.assert_not_called()
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "pidfd_open"), reason="pidfds are not supported on this platform"
+)
+def test_should_return_as_soon_as_terminated_process_exits(orchestrator):
+    pid = os.fork()
+    if pid == 0:
+        signal.pause()
+        os._exit(0)
+
+    orchestrator._container_pid = pid
+
+    with (
+        patch("time.sleep") as mock_sleep,
+        patch.object(orchestrator, "cleanup_resources"),
+    ):
+        orchestrator.terminate()
+
+    mock_sleep.assert_not_called()
+    assert orchestrator._exit_code == 128 + signal.SIGTERM
+
+
+def test_should_wait_for_sigchld_when_pidfd_unavailable(orchestrator):
+    orchestrator._container_pid = 12345
+
+    with (
+        patch("signal.sigtimedwait", return_value=None) as mock_sigtimedwait,
+        patch("os.waitid", return_value=None),
+    ):
+        exited = orchestrator._wait_for_exit_event(None, 5000)
+
+    assert mock_sigtimedwait.call_args.args[0] == {signal.SIGCHLD}
+    assert 0 < mock_sigtimedwait.call_args.args[1] <= 5
+    assert not exited
+    assert signal.SIGCHLD not in signal.pthread_sigmask(signal.SIG_BLOCK, set())
+
+
+def test_should_stop_waiting_for_sigchld_once_child_exits(orchestrator):
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0)
+
+    orchestrator._container_pid = pid
+    try:
+        start = time.monotonic()
+        exited = orchestrator._wait_for_sigchld(5000)
+        elapsed = time.monotonic() - start
+    finally:
+        os.waitpid(pid, 0)
+
+    assert exited
+    assert elapsed < 5
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "pidfd_open") or not hasattr(os, "P_PIDFD"),
+    reason="pidfd waits are not supported on this platform",
+)
+def test_should_open_pidfd_for_wait_when_none_is_held(orchestrator):
+    pid = os.fork()
+    if pid == 0:
+        os._exit(4)
+
+    orchestrator._container_pid = pid
+
+    with (
+        patch("os.waitpid") as mock_waitpid,
+        patch.object(orchestrator, "cleanup_resources"),
+    ):
+        exit_code = orchestrator.wait_for_exit()
+
+    assert exit_code == 4
+    mock_waitpid.assert_not_called()
+    assert orchestrator._pidfd is None
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "pidfd_open") or not hasattr(os, "P_PIDFD"),
+    reason="pidfd waits are not supported on this platform",
+)
+def test_should_reap_terminated_process_through_pidfd(orchestrator):
+    pid = os.fork()
+    if pid == 0:
+        signal.pause()
+        os._exit(0)
+
+    orchestrator._container_pid = pid
+
+    with (
+        patch("os.waitpid") as mock_waitpid,
+        patch.object(orchestrator, "cleanup_resources"),
+    ):
+        orchestrator.terminate()
+
+    mock_waitpid.assert_not_called()
+    with pytest.raises(ChildProcessError):
+        os.waitpid(pid, os.WNOHANG)
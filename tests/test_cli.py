@@ -6,7 +6,7 @@ import pytest
 import typer
 from typer.testing import CliRunner
 
-from src.cli import MiniConCLI
+from src.cli import MiniConCLI, _state_cell, _style
 from src.container.model import Container, State
 
 
@@ -21,7 +21,7 @@ def runner():
 
 
 @patch("src.cli.os.geteuid")
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_create_container_when_run_as_root(
     mock_manager_class, mock_geteuid, cli, runner
 ):
@@ -49,7 +49,7 @@ def test_should_fail_when_create_run_without_root(mock_geteuid, cli, runner):
     assert "requires root privileges" in result.output
 
 
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_show_no_containers_when_list_is_empty(mock_manager_class, cli, runner):
     mock_manager = Mock()
     mock_manager.list.return_value = []
@@ -61,7 +61,7 @@ def test_should_show_no_containers_when_list_is_empty(mock_manager_class, cli, r
     assert "No containers found" in result.output
 
 
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_display_containers_when_list_has_items(mock_manager_class, cli, runner):
     container1 = Container(
         id="abc123",
@@ -96,7 +96,7 @@ def test_should_display_containers_when_list_has_items(mock_manager_class, cli,
     assert "test2" in result.output
 
 
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_filter_by_state_when_state_provided(mock_manager_class, cli, runner):
     mock_manager = Mock()
     mock_manager.list.return_value = []
@@ -116,7 +116,7 @@ def test_should_fail_when_invalid_state_provided(cli, runner):
 
 
 @patch("src.cli.os.geteuid")
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_start_container_when_valid_id(
     mock_manager_class, mock_geteuid, cli, runner
 ):
@@ -132,7 +132,7 @@ def test_should_start_container_when_valid_id(
 
 
 @patch("src.cli.os.geteuid")
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_fail_when_starting_nonexistent(
     mock_manager_class, mock_geteuid, cli, runner
 ):
@@ -148,7 +148,7 @@ def test_should_fail_when_starting_nonexistent(
 
 
 @patch("src.cli.os.geteuid")
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_handle_error_when_start_fails(
     mock_manager_class, mock_geteuid, cli, runner
 ):
@@ -164,7 +164,7 @@ def test_should_handle_error_when_start_fails(
 
 
 @patch("src.cli.os.geteuid")
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_stop_container_when_running(
     mock_manager_class, mock_geteuid, cli, runner
 ):
@@ -180,7 +180,7 @@ def test_should_stop_container_when_running(
 
 
 @patch("src.cli.os.geteuid")
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_fail_when_stopping_non_running(
     mock_manager_class, mock_geteuid, cli, runner
 ):
@@ -196,7 +196,7 @@ def test_should_fail_when_stopping_non_running(
 
 
 @patch("src.cli.os.geteuid")
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_remove_container_when_not_running(
     mock_manager_class, mock_geteuid, cli, runner
 ):
@@ -212,7 +212,7 @@ def test_should_remove_container_when_not_running(
 
 
 @patch("src.cli.os.geteuid")
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_fail_when_removing_running(
     mock_manager_class, mock_geteuid, cli, runner
 ):
@@ -228,7 +228,7 @@ def test_should_fail_when_removing_running(
 
 
 @patch("src.cli.os.geteuid")
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_create_and_start_when_run_used(
     mock_manager_class, mock_geteuid, cli, runner
 ):
@@ -247,7 +247,7 @@ def test_should_create_and_start_when_run_used(
 
 
 @patch("src.cli.os.geteuid")
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_fail_run_when_start_fails(
     mock_manager_class, mock_geteuid, cli, runner
 ):
@@ -279,7 +279,7 @@ def test_should_not_raise_when_user_is_root(mock_geteuid, cli):
     cli._check_root()
 
 
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_truncate_long_commands_in_list(mock_manager_class, cli, runner):
     container = Container(
         id="abc123",
@@ -301,7 +301,7 @@ def test_should_truncate_long_commands_in_list(mock_manager_class, cli, runner):
     assert "echo very long..." in result.output
 
 
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_show_pid_for_running_containers(mock_manager_class, cli, runner):
     containers = [
         Container(
@@ -348,7 +348,7 @@ def test_should_show_pid_for_running_containers(mock_manager_class, cli, runner)
 
 
 @patch("src.cli.os.geteuid")
-@patch("src.cli.ContainerManager")
+@patch("src.container.manager.ContainerManager")
 def test_should_complete_full_container_lifecycle(mock_manager_class, mock_geteuid):
     mock_geteuid.return_value = 0
     mock_manager = Mock()
@@ -378,3 +378,159 @@ def test_should_complete_full_container_lifecycle(mock_manager_class, mock_geteu
     mock_manager.start.assert_called_once()
     mock_manager.stop.assert_called_once()
     mock_manager.remove.assert_called_once()
+
+
+@patch("src.cli.os.geteuid")
+@patch("src.container.manager.ContainerManager")
+def test_should_reuse_manager_across_commands(
+    mock_manager_class, mock_geteuid, cli, runner
+):
+    mock_geteuid.return_value = 0
+    mock_manager = Mock()
+    mock_manager.create.return_value = "test123"
+    mock_manager.list.return_value = []
+    mock_manager_class.return_value = mock_manager
+
+    runner.invoke(cli.app, ["run", "--name", "test-run", "echo", "hello"])
+    runner.invoke(cli.app, ["list"])
+
+    mock_manager_class.assert_called_once()
+
+
+@patch("src.container.manager.ContainerManager")
+def test_should_not_interpret_markup_in_list_output(mock_manager_class, cli, runner):
+    container = Container(
+        id="abc123",
+        name="test",
+        command=["echo", "[bold]hi[/bold]"],
+        root_fs="/tmp/test",
+        hostname="test",
+        memory_limit=250000000,
+        state=State.CREATED,
+    )
+
+    mock_manager = Mock()
+    mock_manager.list.return_value = [container]
+    mock_manager_class.return_value = mock_manager
+
+    result = runner.invoke(cli.app, ["list"])
+
+    assert result.exit_code == 0
+    assert "[bold]hi[/bold]" in result.output
+
+
+@patch("src.container.manager.ContainerManager")
+def test_should_paginate_list_when_limit_and_offset_provided(
+    mock_manager_class, cli, runner
+):
+    containers = [
+        Container(
+            id=f"id{index}",
+            name=f"container{index}",
+            command=["echo", "hello"],
+            root_fs=f"/tmp/test{index}",
+            hostname=f"container{index}",
+            memory_limit=250000000,
+        )
+        for index in range(5)
+    ]
+
+    mock_manager = Mock()
+    mock_manager.list.return_value = containers
+    mock_manager_class.return_value = mock_manager
+
+    result = runner.invoke(cli.app, ["list", "--offset", "1", "--limit", "2"])
+
+    assert result.exit_code == 0
+    assert "id0" not in result.output
+    assert "id1" in result.output
+    assert "id2" in result.output
+    assert "id3" not in result.output
+
+
+@patch("src.cli.os.geteuid")
+def test_should_check_effective_uid_once(mock_geteuid, cli):
+    mock_geteuid.return_value = 0
+
+    cli._check_root()
+    cli._check_root()
+
+    mock_geteuid.assert_called_once()
+
+
+@patch("src.container.manager.ContainerManager")
+def test_should_skip_listing_when_no_containers_match(mock_manager_class, cli, runner):
+    mock_manager = Mock()
+    mock_manager.has_any.return_value = False
+    mock_manager_class.return_value = mock_manager
+
+    result = runner.invoke(cli.app, ["list"])
+
+    assert result.exit_code == 0
+    assert "No containers found" in result.output
+    mock_manager.list.assert_not_called()
+
+
+@patch("src.container.manager.ContainerManager")
+def test_should_drop_table_edges_for_large_listings(mock_manager_class, cli, runner):
+    containers = [
+        Container(
+            id=f"id{index}",
+            name=f"container{index}",
+            command=["echo", "hello"],
+            root_fs=f"/tmp/test{index}",
+            hostname=f"container{index}",
+            memory_limit=250000000,
+        )
+        for index in range(101)
+    ]
+
+    mock_manager = Mock()
+    mock_manager.list.return_value = containers
+    mock_manager_class.return_value = mock_manager
+
+    result = runner.invoke(cli.app, ["list"])
+
+    assert result.exit_code == 0
+    assert "id100" in result.output
+    assert "┏" not in result.output
+
+
+def test_should_parse_each_style_once():
+    assert _style("green") is _style("green")
+
+
+def test_should_cache_state_cell_per_state():
+    value, style = _state_cell(State.RUNNING)
+
+    assert value == "running"
+    assert style == _style("green")
+    assert _state_cell(State.RUNNING) is _state_cell(State.RUNNING)
+
+
+@patch("src.cli.os.geteuid")
+@patch("src.container.manager.ContainerManager")
+def test_should_skip_status_spinner_when_output_is_not_terminal(
+    mock_manager_class, mock_geteuid, cli, runner
+):
+    mock_geteuid.return_value = 0
+    mock_manager_class.return_value = Mock()
+
+    with (
+        patch.object(type(cli.console), "is_terminal", False),
+        patch.object(cli.console, "status") as mock_status,
+    ):
+        result = runner.invoke(cli.app, ["start", "abc123"])
+
+    assert result.exit_code == 0
+    mock_status.assert_not_called()
+
+
+def test_should_use_status_spinner_when_output_is_terminal(cli):
+    with (
+        patch.object(type(cli.console), "is_terminal", True),
+        patch.object(cli.console, "status") as mock_status,
+    ):
+        cli._status("Working...")
+
+    mock_status.assert_called_once_with("Working...")
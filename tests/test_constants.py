@@ -0,0 +1,27 @@
+"""Tests for the constants module."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.constants import _parse_pid
+
+
+def test_should_parse_pid_from_environment():
+    with patch.dict(os.environ, {"MINICON_JOIN_USERNS": "4321"}):
+        assert _parse_pid("MINICON_JOIN_USERNS") == 4321
+
+
+def test_should_return_none_when_pid_variable_unset():
+    with patch.dict(os.environ, {"MINICON_JOIN_USERNS": ""}):
+        assert _parse_pid("MINICON_JOIN_USERNS") is None
+
+
+@pytest.mark.parametrize("value", ["abc", "-1", "0", "12a"])
+def test_should_reject_invalid_pid(value):
+    with (
+        patch.dict(os.environ, {"MINICON_JOIN_USERNS": value}),
+        pytest.raises(ValueError, match="MINICON_JOIN_USERNS must be a process ID"),
+    ):
+        _parse_pid("MINICON_JOIN_USERNS")
@@ -1,19 +1,22 @@
 """Tests for security utilities."""
 
-import subprocess
+import errno
 import tempfile
 from unittest.mock import Mock, patch
 
 import pytest
 
+from src.constants import MS_PRIVATE, MS_REC
 from src.utils.security import (
     SecurityError,
     is_safe_path,
     safe_copy_directory,
     safe_extract_tar,
     safe_make_mount_private,
+    safe_mount_overlay,
     safe_mount_proc,
     safe_set_hostname,
+    safe_umount,
     validate_command,
     validate_container_name,
 )
@@ -53,6 +56,7 @@ def test_should_reject_container_names_with_invalid_characters():
 
 
 def test_should_reject_container_names_when_too_long():
+    assert validate_container_name("a" * 64)
     assert not validate_container_name("a" * 65)
 
 
@@ -70,6 +74,7 @@ def test_should_reject_dangerous_commands():
     assert not validate_command(["rm", "-rf", "/"])
     assert not validate_command(["sudo", "echo", "hello"])
     assert not validate_command(["mount", "/dev/sda1", "/mnt"])
+    assert not validate_command(["/usr/bin/sudo", "echo", "hello"])
 
 
 @patch("src.utils.security.subprocess.run")
@@ -87,7 +92,7 @@ def test_should_copy_directory_when_paths_are_safe(
     safe_copy_directory("/source", "/dest")
 
     mock_subprocess.assert_called_once_with(
-        ["cp", "-a", "/source/.", "/dest"],
+        ["cp", "-a", "--reflink=auto", "/source/.", "/dest"],
         check=True,
         capture_output=True,
         text=True,
@@ -166,20 +171,15 @@ def test_should_fail_extract_when_file_not_tar(mock_exists):
         safe_extract_tar("/file.txt", "/dest")
 
 
-@patch("src.utils.security.subprocess.run")
-@patch("src.utils.security.is_safe_path")
-def test_should_mount_proc_when_path_safe(mock_is_safe_path, mock_subprocess):
-    mock_is_safe_path.return_value = True
-    mock_subprocess.return_value = Mock(returncode=0)
+@patch("src.utils.system.load_libc")
+def test_should_mount_proc_when_path_safe(mock_load_libc):
+    mock_libc = Mock()
+    mock_libc.mount.return_value = 0
+    mock_load_libc.return_value = mock_libc
 
     safe_mount_proc("/proc")
 
-    mock_subprocess.assert_called_once_with(
-        ["mount", "-t", "proc", "proc", "/proc"],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
+    mock_libc.mount.assert_called_once_with(b"proc", b"/proc", b"proc", 0, None)
 
 
 @patch("src.utils.security.is_safe_path")
@@ -191,18 +191,54 @@ def test_should_fail_mount_proc_when_path_unsafe(mock_is_safe_path):
 
 
 @patch("src.utils.system.load_libc")
-def test_should_set_hostname_when_valid(mock_load_libc):
+@patch("src.utils.security.is_safe_path")
+def test_should_mount_overlay_when_paths_safe(mock_is_safe_path, mock_load_libc):
+    mock_is_safe_path.return_value = True
     mock_libc = Mock()
-    mock_libc.sethostname.return_value = 0
+    mock_libc.mount.return_value = 0
     mock_load_libc.return_value = mock_libc
 
-    safe_set_hostname("test-hostname")
+    safe_mount_overlay("/base", "/c/upper", "/c/work", "/c/merged")
 
-    mock_libc.sethostname.assert_called_once_with(
-        b"test-hostname", len(b"test-hostname")
+    mock_libc.mount.assert_called_once_with(
+        b"overlay",
+        b"/c/merged",
+        b"overlay",
+        0,
+        b"lowerdir=/base,upperdir=/c/upper,workdir=/c/work",
     )
 
 
+@patch("src.utils.security.is_safe_path")
+def test_should_fail_mount_overlay_when_path_contains_option_separator(
+    mock_is_safe_path,
+):
+    mock_is_safe_path.return_value = True
+
+    with pytest.raises(SecurityError, match="Invalid characters in overlay path"):
+        safe_mount_overlay("/base,upperdir=/etc", "/c/upper", "/c/work", "/c/merged")
+
+
+@patch("src.utils.system.load_libc")
+@patch("src.utils.security.is_safe_path")
+def test_should_unmount_when_path_safe(mock_is_safe_path, mock_load_libc):
+    mock_is_safe_path.return_value = True
+    mock_libc = Mock()
+    mock_libc.umount2.return_value = 0
+    mock_load_libc.return_value = mock_libc
+
+    safe_umount("/c/merged")
+
+    mock_libc.umount2.assert_called_once_with(b"/c/merged", 0)
+
+
+@patch("src.utils.security.socket.sethostname")
+def test_should_set_hostname_when_valid(mock_sethostname):
+    safe_set_hostname("test-hostname")
+
+    mock_sethostname.assert_called_once_with("test-hostname")
+
+
 def test_should_fail_set_hostname_when_empty():
     with pytest.raises(SecurityError, match="Invalid hostname length"):
         safe_set_hostname("")
@@ -221,26 +257,29 @@ def test_should_fail_set_hostname_when_invalid_characters():
         safe_set_hostname("test hostname")
 
 
-@patch("src.utils.security.subprocess.run")
-def test_should_make_mount_private_when_called(mock_subprocess):
-    mock_subprocess.return_value = Mock(returncode=0)
+@patch("src.utils.system.load_libc")
+def test_should_make_mount_private_when_called(mock_load_libc):
+    mock_libc = Mock()
+    mock_libc.mount.return_value = 0
+    mock_load_libc.return_value = mock_libc
 
     safe_make_mount_private()
 
-    mock_subprocess.assert_called_once_with(
-        ["mount", "--make-private", "/"], check=True, capture_output=True, text=True
-    )
+    mock_libc.mount.assert_called_once_with(None, b"/", None, MS_REC | MS_PRIVATE, None)
 
 
-@patch("src.utils.security.subprocess.run")
-def test_should_propagate_subprocess_error(mock_subprocess):
-    mock_subprocess.side_effect = subprocess.CalledProcessError(
-        1, ["command"], stderr="Command failed"
-    )
+@patch("src.utils.system.ctypes.get_errno", return_value=errno.EPERM)
+@patch("src.utils.system.load_libc")
+def test_should_propagate_mount_error(mock_load_libc, mock_get_errno):
+    mock_libc = Mock()
+    mock_libc.mount.return_value = -1
+    mock_load_libc.return_value = mock_libc
 
-    with pytest.raises(subprocess.CalledProcessError):
+    with pytest.raises(OSError) as exc_info:
         safe_make_mount_private()
 
+    assert exc_info.value.errno == errno.EPERM
+
 
 def test_should_validate_paths_in_real_directories():
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -0,0 +1,128 @@
+"""Tests for system utility functions."""
+
+import ctypes
+import errno
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.system import check_syscall, copy_file, load_libc, set_cloexec_from
+
+
+def test_should_copy_file_contents_and_mode(tmp_path):
+    source = tmp_path / "source"
+    destination = tmp_path / "destination"
+    source.write_bytes(b"binary contents")
+    os.chmod(source, 0o755)
+
+    copy_file(str(source), str(destination))
+
+    assert destination.read_bytes() == b"binary contents"
+    assert os.stat(destination).st_mode & 0o777 == 0o755
+
+
+def test_should_fall_back_to_userspace_copy_when_kernel_copy_unsupported(tmp_path):
+    source = tmp_path / "source"
+    destination = tmp_path / "destination"
+    source.write_bytes(b"binary contents")
+
+    with (
+        patch("src.utils.system.fcntl.ioctl", side_effect=OSError()),
+        patch("src.utils.system.os.copy_file_range", side_effect=OSError()),
+        patch("src.utils.system._sendfile", return_value=False),
+    ):
+        copy_file(str(source), str(destination))
+
+    assert destination.read_bytes() == b"binary contents"
+
+
+def test_should_fall_back_to_userspace_copy_when_kernel_copy_stops_early(tmp_path):
+    source = tmp_path / "source"
+    destination = tmp_path / "destination"
+    source.write_bytes(b"x" * 10000)
+
+    with (
+        patch("src.utils.system.fcntl.ioctl", side_effect=OSError()),
+        patch("src.utils.system.os.copy_file_range", return_value=0),
+        patch("src.utils.system._sendfile", return_value=False),
+    ):
+        copy_file(str(source), str(destination))
+
+    assert destination.read_bytes() == b"x" * 10000
+
+
+def test_should_copy_with_sendfile_when_copy_file_range_unsupported(tmp_path):
+    source = tmp_path / "source"
+    destination = tmp_path / "destination"
+    source.write_bytes(b"x" * 10000)
+
+    with (
+        patch("src.utils.system.fcntl.ioctl", side_effect=OSError()),
+        patch("src.utils.system.os.copy_file_range", side_effect=OSError()),
+        patch("src.utils.system.os.sendfile", wraps=os.sendfile) as mock_sendfile,
+        patch("src.utils.system.shutil.copy2") as mock_copy2,
+    ):
+        copy_file(str(source), str(destination), 0o700)
+
+    mock_sendfile.assert_called()
+    mock_copy2.assert_not_called()
+    assert destination.read_bytes() == b"x" * 10000
+    assert os.stat(destination).st_mode & 0o777 == 0o700
+
+
+def test_should_load_libc_once_when_called_repeatedly():
+    with patch("src.utils.system.ctypes.CDLL") as mock_cdll:
+        first = load_libc()
+        second = load_libc()
+
+    assert first is second
+    mock_cdll.assert_called_once()
+    assert first.unshare.argtypes == [ctypes.c_int]
+    assert first.unshare.restype is ctypes.c_int
+    assert first.mount.argtypes[3] is ctypes.c_ulong
+    assert first.umount2.argtypes == [ctypes.c_char_p, ctypes.c_int]
+
+
+def test_should_declare_signatures_on_real_libc():
+    libc = load_libc()
+
+    assert libc.unshare.argtypes == [ctypes.c_int]
+    assert libc.mount.restype is ctypes.c_int
+
+
+def test_should_raise_errno_when_syscall_fails():
+    with patch("src.utils.system.ctypes.get_errno", return_value=errno.EPERM):
+        check_syscall(0, "unshare")
+
+        with pytest.raises(OSError, match="unshare failed") as exc_info:
+            check_syscall(-1, "unshare")
+
+    assert exc_info.value.errno == errno.EPERM
+
+
+def test_should_mark_descriptors_close_on_exec():
+    read_fd, write_fd = os.pipe()
+    os.set_inheritable(read_fd, True)
+    os.set_inheritable(write_fd, True)
+    try:
+        set_cloexec_from(write_fd)
+
+        assert os.get_inheritable(read_fd)
+        assert not os.get_inheritable(write_fd)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_should_mark_descriptors_from_proc_when_close_range_unavailable():
+    read_fd, write_fd = os.pipe()
+    os.set_inheritable(write_fd, True)
+    try:
+        with patch("src.utils.system.load_libc", return_value=object()):
+            set_cloexec_from(write_fd)
+
+        assert not os.get_inheritable(write_fd)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)